@@ -56,7 +56,7 @@ rbnics_installation_cell = """# Install RBniCS
 try:
     import rbnics
 except ImportError as e:
-    !pip3 -q install --upgrade cvxopt multipledispatch pylru toposort
+    !pip3 -q install --upgrade cvxopt multipledispatch toposort
     ![ -d "/tmp/RBniCS" ] || git clone https://github.com/RBniCS/RBniCS /tmp/RBniCS
     !cd /tmp/RBniCS && python3 setup.py install && cd -
     !ln -s /usr/local/lib/python3.6/dist-packages/RBniCS*egg/rbnics /usr/local/lib/python3.6/dist-packages/
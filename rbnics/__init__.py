@@ -29,6 +29,7 @@ from rbnics.problems.stokes_optimal_control import StokesOptimalControlProblem
 from rbnics.problems.stokes_unsteady import StokesUnsteadyProblem
 from rbnics.sampling.distributions import (DrawFrom, EquispacedDistribution, LogEquispacedDistribution,
                                            LogUniformDistribution, UniformDistribution)
+from rbnics.sampling.executors import MPIGroupsExecutor, ProcessPoolExecutor, SerialExecutor
 from rbnics.scm.problems import ExactStabilityFactor, SCM
 from rbnics.shape_parametrization.problems import AffineShapeParametrization, ShapeParametrization
 from rbnics.utils.decorators import CustomizeReducedProblemFor, CustomizeReductionMethodFor, exact_problem
@@ -58,6 +59,9 @@ __all__ += [
     "EquispacedDistribution",
     "LogEquispacedDistribution",
     "LogUniformDistribution",
+    "MPIGroupsExecutor",
+    "ProcessPoolExecutor",
+    "SerialExecutor",
     "UniformDistribution",
     # rbnics.scm
     "ExactStabilityFactor",
@@ -31,6 +31,7 @@ from rbnics.backends.abstract.proper_orthogonal_decomposition import ProperOrtho
 from rbnics.backends.abstract.reduced_mesh import ReducedMesh
 from rbnics.backends.abstract.reduced_vertices import ReducedVertices
 from rbnics.backends.abstract.separated_parametrized_form import SeparatedParametrizedForm
+from rbnics.backends.abstract.snapshot_store import SnapshotStore
 from rbnics.backends.abstract.snapshots_matrix import SnapshotsMatrix
 from rbnics.backends.abstract.sum import sum
 from rbnics.backends.abstract.symbolic_parameters import SymbolicParameters
@@ -73,6 +74,7 @@ __all__ = [
     "ReducedMesh",
     "ReducedVertices",
     "SeparatedParametrizedForm",
+    "SnapshotStore",
     "SnapshotsMatrix",
     "sum",
     "SymbolicParameters",
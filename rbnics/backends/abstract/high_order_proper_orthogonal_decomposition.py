@@ -23,6 +23,11 @@ class HighOrderProperOrthogonalDecomposition(object, metaclass=ABCMeta):
     def store_snapshot(self, snapshot):
         pass
 
+    # Set parameters of the POD, e.g. the method used to compute the POD modes
+    @abstractmethod
+    def set_parameters(self, parameters):
+        pass
+
     # Perform POD on the snapshots previously computed, and store the first
     # POD modes in the basis functions matrix.
     # Input arguments are: Nmax, tol
@@ -21,6 +21,10 @@ class LinearSolver(object, metaclass=ABCMeta):
     def set_parameters(self, parameters):
         pass
 
+    @abstractmethod
+    def set_rhs(self, rhs):
+        pass
+
     @abstractmethod
     def solve(self):
         pass
@@ -0,0 +1,28 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from rbnics.utils.decorators import ABCMeta, AbstractBackend, abstractmethod
+
+
+@AbstractBackend
+class SnapshotStore(object, metaclass=ABCMeta):
+    def __init__(self, space, directory, filename):
+        """
+        Store all snapshots (and the corresponding outputs) of a problem in a single file,
+        indexed by the cache key of each snapshot
+        """
+        pass
+
+    @abstractmethod
+    def save(self, function_or_output, key):
+        pass
+
+    @abstractmethod
+    def load(self, function_or_output, key):
+        """
+        Raise OSError if key is not available in the store
+        """
+        pass
@@ -4,10 +4,13 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from logging import DEBUG, getLogger
 from math import sqrt
 from numpy import abs, cumsum as compute_retained_energy, isclose, sum as compute_total_energy
 from rbnics.utils.io import ExportableList
 
+logger = getLogger("rbnics/backends/basic/proper_orthogonal_decomposition_base.py")
+
 
 # Class containing the implementation of the POD
 def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_wrapping,
@@ -26,62 +29,126 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
             # Declare a list to store eigenvalues
             self.eigenvalues = ExportableList("text")
             self.retained_energy = ExportableList("text")
+            # Declare a dict to store parameters
+            self.parameters = {
+                "method": "full",
+                "oversampling": 10,
+                "power_iterations": 2,
+                "random_seed": 0,
+                "incremental_batch_size": 10,
+                "incremental_tol": 1.e-12
+            }
+            # Number of leading entries of the snapshots matrix which store the (scaled) modes computed by
+            # the incremental POD, their eigenvalues, and energy discarded by its truncation
+            self._incremental_N = 0
+            self._incremental_eigenvalues = list()
+            self._incremental_discarded_energy = 0.
 
         def clear(self):
             self.snapshots_matrix.clear()
             self.eigenvalues = ExportableList("text")
             self.retained_energy = ExportableList("text")
+            self._incremental_N = 0
+            self._incremental_eigenvalues = list()
+            self._incremental_discarded_energy = 0.
 
         # No implementation is provided for store_snapshot, because
         # it has different interface for the standard POD and
         # the tensor one.
 
+        def set_parameters(self, parameters):
+            """
+            Set the parameters of the POD. The "method" parameter selects how the POD modes are computed:
+            * "full": form the correlation matrix and compute all its eigenpairs (default);
+            * "truncated": form the correlation matrix, but only compute the eigenpairs associated to the
+              first Nmax POD modes;
+            * "randomized": never form the correlation matrix, and compute the eigenpairs associated to the
+              first Nmax POD modes by a randomized range finder, which accesses the snapshots matrix only
+              through products with blocks of (Nmax + oversampling) vectors;
+            * "incremental": do not keep all snapshots in memory, but rather update a truncated POD every
+              incremental_batch_size stored snapshots, discarding modes as long as the overall discarded
+              energy is below incremental_tol times the total energy. Not available for the POD of tensors.
+            """
+            assert "method" not in parameters or parameters["method"] in (
+                "full", "truncated", "randomized", "incremental")
+            self.parameters.update(parameters)
+
         def apply(self, Nmax, tol):
-            inner_product = self.inner_product
             snapshots_matrix = self.snapshots_matrix
-            transpose = backend.transpose
-
-            if inner_product is not None:
-                correlation = transpose(snapshots_matrix) * inner_product * snapshots_matrix
-            else:
-                correlation = transpose(snapshots_matrix) * snapshots_matrix
 
             basis_functions = BasisContainerType(self.space, *self.args)
 
-            eigensolver = online_backend.OnlineEigenSolver(basis_functions, correlation)
+            method = self.parameters["method"]
+            if method == "incremental":
+                # Update the truncated POD with the snapshots stored since the last update, after which
+                # the snapshots matrix only contains orthogonal modes, and the standard method is cheap
+                self._update_incrementally()
+                method = "full"
+
+            Neigs = len(self.snapshots_matrix)
+            Nmax = min(Nmax, Neigs)
+            if method == "randomized":
+                rank = min(Nmax + self.parameters["oversampling"], Neigs)
+                if rank == Neigs:
+                    method = "full"  # randomization would bring no savings
+
             parameters = {
                 "problem_type": "hermitian",
                 "spectrum": "largest real"
             }
-            eigensolver.set_parameters(parameters)
-            eigensolver.solve()
+            if method in ("full", "truncated"):
+                correlation = self._compute_correlation(snapshots_matrix, snapshots_matrix)
+                eigensolver = online_backend.OnlineEigenSolver(basis_functions, correlation)
+                eigensolver.set_parameters(parameters)
+                if method == "full":
+                    eigensolver.solve()
+                    Ncomputed = Neigs
+                else:
+                    eigensolver.solve(Nmax)
+                    Ncomputed = Nmax
+                range_ = None
+                modes_matrix = snapshots_matrix
+            else:
+                range_ = online_wrapping.randomized_range_finder(
+                    lambda online_matrix: self._compute_correlation(snapshots_matrix, snapshots_matrix * online_matrix),
+                    Neigs, rank, self.parameters["power_iterations"], self.parameters["random_seed"])
+                modes_matrix = snapshots_matrix * range_
+                projected_correlation = self._compute_correlation(modes_matrix, modes_matrix)
+                eigensolver = online_backend.OnlineEigenSolver(basis_functions, projected_correlation)
+                eigensolver.set_parameters(parameters)
+                eigensolver.solve()
+                Ncomputed = Nmax
 
-            Neigs = len(self.snapshots_matrix)
-            Nmax = min(Nmax, Neigs)
             assert len(self.eigenvalues) == 0
-            for i in range(Neigs):
+            for i in range(Ncomputed):
                 (eig_i_real, eig_i_complex) = eigensolver.get_eigenvalue(i)
                 assert isclose(eig_i_complex, 0.)
                 self.eigenvalues.append(eig_i_real)
 
-            total_energy = compute_total_energy([abs(e) for e in self.eigenvalues])
+            if method == "full":
+                total_energy = (compute_total_energy([abs(e) for e in self.eigenvalues])
+                                + self._incremental_discarded_energy)
+            else:
+                # the total energy is the trace of the correlation matrix, which is cheap to compute
+                # even when the correlation matrix is not formed
+                total_energy = compute_total_energy([self._compute_squared_norm(snapshot)
+                                                     for snapshot in snapshots_matrix])
             retained_energy = compute_retained_energy([abs(e) for e in self.eigenvalues])
             assert len(self.retained_energy) == 0
             if total_energy > 0.:
                 self.retained_energy.extend([retained_energy_i / total_energy
                                              for retained_energy_i in retained_energy])
             else:
-                self.retained_energy.extend([1. for _ in range(Neigs)])  # trivial case, all snapshots are zero
+                self.retained_energy.extend([1. for _ in range(Ncomputed)])  # trivial case, all snapshots are zero
 
             eigenvectors = list()
             for N in range(Nmax):
                 (eigvector, _) = eigensolver.get_eigenvector(N)
+                b = modes_matrix * eigvector
+                if range_ is not None:
+                    eigvector = online_backend.OnlineFunction(range_ * online_wrapping.function_to_vector(eigvector))
                 eigenvectors.append(eigvector)
-                b = self.snapshots_matrix * eigvector
-                if inner_product is not None:
-                    norm_b = sqrt(transpose(b) * inner_product * b)
-                else:
-                    norm_b = sqrt(transpose(b) * b)
+                norm_b = sqrt(self._compute_squared_norm(b))
                 if norm_b != 0.:
                     b /= norm_b
                 basis_functions.enrich(b)
@@ -91,9 +158,91 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
 
             return (self.eigenvalues[:N], eigenvectors, basis_functions, N)
 
+        def _store_snapshot_incrementally(self):
+            if (self.parameters["method"] == "incremental"
+                    and len(self.snapshots_matrix) - self._incremental_N >= self.parameters["incremental_batch_size"]):
+                self._update_incrementally()
+
+        def _update_incrementally(self):
+            # Compute the POD of the snapshots matrix [U, S], where U are the modes computed by the previous update
+            # (scaled by the square root of the corresponding eigenvalue) and S the snapshots stored since then.
+            # Since U is orthogonal the result is the same as a POD of all snapshots stored so far,
+            # up to the truncation carried out by previous updates.
+            snapshots_matrix = self.snapshots_matrix
+            Nsnapshots = len(snapshots_matrix)
+            if Nsnapshots == self._incremental_N:
+                return
+            correlation = self._compute_incremental_correlation()
+            eigensolver = online_backend.OnlineEigenSolver(None, correlation)
+            eigensolver.set_parameters({
+                "problem_type": "hermitian",
+                "spectrum": "largest real"
+            })
+            eigensolver.solve()
+            eigenvalues = [eigensolver.get_eigenvalue(i)[0] for i in range(Nsnapshots)]
+            # Truncate trailing modes, as long as the overall discarded energy is small
+            total_energy = compute_total_energy([abs(e) for e in eigenvalues]) + self._incremental_discarded_energy
+            N = Nsnapshots
+            while N > 0:
+                discarded_energy = self._incremental_discarded_energy + abs(eigenvalues[N - 1])
+                if eigenvalues[N - 1] > 0. and discarded_energy > self.parameters["incremental_tol"] * total_energy:
+                    break
+                self._incremental_discarded_energy = discarded_energy
+                N -= 1
+            # Replace the snapshots matrix with the retained (scaled) modes
+            eigenvectors = online_backend.OnlineMatrix(Nsnapshots, N)
+            for i in range(N):
+                (eigvector, _) = eigensolver.get_eigenvector(i)
+                eigenvectors[:, i] = online_wrapping.function_to_vector(eigvector)
+            modes = snapshots_matrix * eigenvectors
+            snapshots_matrix.clear()
+            snapshots_matrix.enrich(modes, copy=False)
+            self._incremental_N = N
+            self._incremental_eigenvalues = eigenvalues[:N]
+
+        def _compute_incremental_correlation(self):
+            # Assemble the correlation matrix of [U, S] by blocks. Since the (scaled) modes U are orthogonal,
+            # U^T X U is the diagonal matrix of their eigenvalues, so that only U^T X S and S^T X S require
+            # inner products between truth functions
+            snapshots_matrix = self.snapshots_matrix
+            Nsnapshots = len(snapshots_matrix)
+            N = self._incremental_N
+            if N == 0:
+                return self._compute_correlation(snapshots_matrix, snapshots_matrix)
+            modes = snapshots_matrix[:N]
+            snapshots = snapshots_matrix[N:]
+            modes_snapshots_correlation = self._compute_correlation(modes, snapshots)
+            correlation = online_backend.OnlineMatrix(Nsnapshots, Nsnapshots)
+            for i in range(N):
+                correlation[i, i] = self._incremental_eigenvalues[i]
+            correlation[:N, N:] = modes_snapshots_correlation
+            for i in range(N):
+                for j in range(Nsnapshots - N):
+                    correlation[N + j, i] = modes_snapshots_correlation[i, j]
+            correlation[N:, N:] = self._compute_correlation(snapshots, snapshots)
+            if logger.isEnabledFor(DEBUG):
+                # Check against the correlation matrix computed from scratch, which is as expensive as a full POD
+                full_correlation = self._compute_correlation(snapshots_matrix, snapshots_matrix)
+                error = max([abs(full_correlation[i, j] - correlation[i, j])
+                             for i in range(Nsnapshots) for j in range(Nsnapshots)])
+                logger.log(DEBUG, "Error in the correlation matrix of the incremental POD is " + str(error))
+            return correlation
+
+        def _compute_correlation(self, functions_list, other_functions_list):
+            if self.inner_product is not None:
+                return backend.transpose(functions_list) * self.inner_product * other_functions_list
+            else:
+                return backend.transpose(functions_list) * other_functions_list
+
+        def _compute_squared_norm(self, function):
+            if self.inner_product is not None:
+                return backend.transpose(function) * self.inner_product * function
+            else:
+                return backend.transpose(function) * function
+
         def print_eigenvalues(self, N=None):
             if N is None:
-                N = len(self.snapshots_matrix)
+                N = len(self.eigenvalues)
             for i in range(N):
                 print("lambda_" + str(i) + " = " + str(self.eigenvalues[i]))
 
@@ -223,6 +223,25 @@ def Vector_Transpose__times__Matrix(backend, wrapping, online_backend, online_wr
             logger.log(DEBUG, "End v^T A w")
             return output
 
+        @overload(backend.BasisFunctionsMatrix, )
+        def __mul__(self, basis_functions_matrix):
+            logger.log(DEBUG, "Begin v^T A Z")
+            output = online_backend.OnlineVector(basis_functions_matrix._component_name_to_basis_component_length)
+            vector_times_matrix = wrapping.vector_mul_matrix(self.vector, self.matrix)
+            j = 0
+            for component_name in basis_functions_matrix._components_name:
+                for fun_j in basis_functions_matrix._components[component_name]:
+                    output[j] = wrapping.vector_mul_vector(vector_times_matrix, wrapping.function_to_vector(fun_j))
+                    j += 1
+            logger.log(DEBUG, "End v^T A Z")
+            # Assert consistency of private attributes storing the order of components and their basis length.
+            assert output._component_name_to_basis_component_index == (
+                basis_functions_matrix._component_name_to_basis_component_index)
+            assert output._component_name_to_basis_component_length == (
+                basis_functions_matrix._component_name_to_basis_component_length)
+            # Return
+            return output
+
         @overload(object, )
         def __mul__(self, other):
             if AdditionalIsFunction(other):
@@ -259,6 +278,17 @@ def FunctionsList_Transpose(backend, wrapping, online_backend, online_wrapping,
             logger.log(DEBUG, "End S^T w")
             return output
 
+        @overload(backend.FunctionsList, )
+        def __mul__(self, other_functions_list):
+            logger.log(DEBUG, "Begin S^T*S")
+            output = online_backend.OnlineMatrix(len(self.functions_list), len(other_functions_list))
+            for (j, fun_j) in enumerate(other_functions_list):
+                for (i, fun_i) in enumerate(self.functions_list):
+                    output[i, j] = wrapping.vector_mul_vector(
+                        wrapping.function_to_vector(fun_i), wrapping.function_to_vector(fun_j))
+            logger.log(DEBUG, "End S^T*S")
+            return output
+
         @overload(backend.Matrix.Type(), )
         def __mul__(self, matrix):
             output = _FunctionsList_Transpose__times__Matrix(self.functions_list, matrix)
@@ -38,7 +38,8 @@ from rbnics.backends.basic.wrapping.get_mpi_comm import get_mpi_comm
 from rbnics.backends.basic.wrapping.gram_schmidt_projection_step import gram_schmidt_projection_step
 from rbnics.backends.basic.wrapping.is_parametrized import is_parametrized
 from rbnics.backends.basic.wrapping.is_time_dependent import is_time_dependent
-from rbnics.backends.basic.wrapping.matrix_mul import matrix_mul_vector, vectorized_matrix_inner_vectorized_matrix
+from rbnics.backends.basic.wrapping.matrix_mul import (
+    matrix_mul_vector, vector_mul_matrix, vectorized_matrix_inner_vectorized_matrix)
 from rbnics.backends.basic.wrapping.tensor_copy import tensor_copy
 from rbnics.backends.basic.wrapping.tensor_load import tensor_load
 from rbnics.backends.basic.wrapping.tensor_save import tensor_save
@@ -84,6 +85,7 @@ __all__ = [
     "tensor_load",
     "tensor_save",
     "tensors_list_mul_online_function",
+    "vector_mul_matrix",
     "vector_mul_vector",
     "vectorized_matrix_inner_vectorized_matrix"
 ]
@@ -9,5 +9,9 @@ def matrix_mul_vector(matrix, vector):
     pass
 
 
+def vector_mul_matrix(vector, matrix):
+    pass
+
+
 def vectorized_matrix_inner_vectorized_matrix(matrix, other_matrix):
     pass
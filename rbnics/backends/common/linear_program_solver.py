@@ -4,7 +4,6 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-import cvxopt
 from numbers import Number
 from numpy import eye, hstack, matrix as numpy_matrix, ndarray as numpy_vector, vstack, zeros
 from rbnics.backends.abstract import LinearProgramSolver as AbstractLinearProgramSolver
@@ -28,6 +27,7 @@ class Error(RuntimeError):
 @BackendFor("common", inputs=(numpy_vector, numpy_matrix, numpy_vector, list_of(tuple_of(Number))))
 class LinearProgramSolver(AbstractLinearProgramSolver):
     def __init__(self, cost, inequality_constraints_matrix, inequality_constraints_vector, bounds):
+        import cvxopt  # imported here since cvxopt is only required by SCM
         self.Q = len(cost)
         # Store cost
         self.cost = cvxopt.matrix(cost)
@@ -46,6 +46,7 @@ class LinearProgramSolver(AbstractLinearProgramSolver):
                                                                    bounds_lower, bounds_upper)))
 
     def solve(self):
+        import cvxopt
         result = cvxopt.solvers.lp(self.cost, self.inequality_constraints_matrix, self.inequality_constraints_vector,
                                    solver="glpk", options={"glpk": {"msg_lev": "GLP_MSG_OFF"}})
         if result["status"] != "optimal":
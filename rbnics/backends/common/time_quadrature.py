@@ -5,7 +5,6 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from numbers import Number
-from scipy.integrate import simps
 from rbnics.backends.abstract import TimeQuadrature as AbstractTimeQuadrature
 from rbnics.backends.common.time_series import TimeSeries
 from rbnics.utils.decorators import backend_for, list_of, tuple_of, overload
@@ -23,6 +22,7 @@ class TimeQuadrature_Numbers(AbstractTimeQuadrature):
         self._function_over_time = function_over_time
 
     def integrate(self):
+        from scipy.integrate import simps  # imported here since scipy.integrate is expensive to import
         return simps(self._function_over_time, dx=self._time_step_size)
 
 
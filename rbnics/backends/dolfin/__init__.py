@@ -31,6 +31,7 @@ from rbnics.backends.dolfin.proper_orthogonal_decomposition import ProperOrthogo
 from rbnics.backends.dolfin.reduced_mesh import ReducedMesh
 from rbnics.backends.dolfin.reduced_vertices import ReducedVertices
 from rbnics.backends.dolfin.separated_parametrized_form import SeparatedParametrizedForm
+from rbnics.backends.dolfin.snapshot_store import SnapshotStore
 from rbnics.backends.dolfin.snapshots_matrix import SnapshotsMatrix
 from rbnics.backends.dolfin.sum import sum
 from rbnics.backends.dolfin.symbolic_parameters import SymbolicParameters
@@ -76,6 +77,7 @@ __all__ = [
     "ReducedMesh",
     "ReducedVertices",
     "SeparatedParametrizedForm",
+    "SnapshotStore",
     "SnapshotsMatrix",
     "sum",
     "SymbolicParameters",
@@ -11,7 +11,9 @@ from rbnics.backends.basic import ProperOrthogonalDecompositionBase as BasicHigh
 from rbnics.backends.dolfin.tensor_snapshots_list import TensorSnapshotsList
 from rbnics.backends.dolfin.tensor_basis_list import TensorBasisList
 from rbnics.backends.dolfin.wrapping import get_mpi_comm
-from rbnics.backends.online import OnlineEigenSolver
+from rbnics.backends.online import OnlineEigenSolver, OnlineFunction
+from rbnics.backends.online.wrapping import (
+    function_to_vector as online_function_to_online_vector, randomized_range_finder)
 from rbnics.utils.decorators import BackendFor, ModuleWrapper
 
 
@@ -23,8 +25,8 @@ def transpose(arg):
 
 backend = ModuleWrapper(transpose)
 wrapping = ModuleWrapper(get_mpi_comm)
-online_backend = ModuleWrapper(OnlineEigenSolver=OnlineEigenSolver)
-online_wrapping = ModuleWrapper()
+online_backend = ModuleWrapper(OnlineEigenSolver=OnlineEigenSolver, OnlineFunction=OnlineFunction)
+online_wrapping = ModuleWrapper(randomized_range_finder, function_to_vector=online_function_to_online_vector)
 HighOrderProperOrthogonalDecomposition_Base = BasicHighOrderProperOrthogonalDecomposition(
     backend, wrapping, online_backend, online_wrapping, AbstractHighOrderProperOrthogonalDecomposition,
     TensorSnapshotsList, TensorBasisList)
@@ -35,5 +37,12 @@ class HighOrderProperOrthogonalDecomposition(HighOrderProperOrthogonalDecomposit
     def __init__(self, V, empty_tensor):
         HighOrderProperOrthogonalDecomposition_Base.__init__(self, V, None, empty_tensor)
 
+    def set_parameters(self, parameters):
+        # The incremental update requires to replace snapshots by their linear combinations, which is not
+        # available for tensors
+        assert "method" not in parameters or parameters["method"] != "incremental", (
+            "Incremental POD is not available for tensors")
+        HighOrderProperOrthogonalDecomposition_Base.set_parameters(self, parameters)
+
     def store_snapshot(self, snapshot):
         self.snapshots_matrix.enrich(snapshot)
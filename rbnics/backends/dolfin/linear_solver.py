@@ -27,10 +27,12 @@ class LinearSolver(AbstractLinearSolver):
                dict_of(str, ProductOutputDirichletBC), None))
     def __init__(self, lhs, solution, rhs, bcs=None):
         self.solution = solution
+        self._bcs = bcs
         self._init_lhs(lhs, bcs)
         self._init_rhs(rhs, bcs)
         self._apply_bcs(bcs)
         self._linear_solver = "default"
+        self._solver = None  # created upon the first solve, and then reused
         self.monitor = None
 
     @overload(LinearProblemWrapper, Function.Type())
@@ -97,14 +99,40 @@ class LinearSolver(AbstractLinearSolver):
             for bc in bcs[key]:
                 bc.apply(self.lhs, self.rhs)
 
+    @overload(None)
+    def _apply_bcs_to_rhs(self, bcs):
+        pass
+
+    @overload((list_of(DirichletBC), ProductOutputDirichletBC))
+    def _apply_bcs_to_rhs(self, bcs):
+        for bc in bcs:
+            bc.apply(self.rhs)
+
+    @overload((dict_of(str, list_of(DirichletBC)), dict_of(str, ProductOutputDirichletBC)))
+    def _apply_bcs_to_rhs(self, bcs):
+        for key in bcs:
+            for bc in bcs[key]:
+                bc.apply(self.rhs)
+
     def set_parameters(self, parameters):
         assert len(parameters) in (0, 1)
         if len(parameters) == 1:
             assert "linear_solver" in parameters
-        self._linear_solver = parameters.get("linear_solver", "default")
+        linear_solver = parameters.get("linear_solver", "default")
+        if linear_solver != self._linear_solver:
+            self._linear_solver = linear_solver
+            self._solver = None
+
+    def set_rhs(self, rhs):
+        # Replace the right-hand side, so that the factorization of the left-hand side can be reused
+        # by the next call to solve()
+        self._init_rhs(rhs, self._bcs)
+        self._apply_bcs_to_rhs(self._bcs)
 
     def solve(self):
-        solver = PETScLUSolver(self._linear_solver)
-        solver.solve(self.lhs, self.solution.vector(), self.rhs)
+        if self._solver is None:
+            self._solver = PETScLUSolver(self._linear_solver)
+            self._solver.set_operator(self.lhs)
+        self._solver.solve(self.solution.vector(), self.rhs)
         if self.monitor is not None:
             self.monitor(self.solution)
@@ -12,7 +12,9 @@ from rbnics.backends.dolfin.functions_list import FunctionsList
 from rbnics.backends.dolfin.matrix import Matrix
 from rbnics.backends.dolfin.snapshots_matrix import SnapshotsMatrix
 from rbnics.backends.dolfin.wrapping import get_mpi_comm
-from rbnics.backends.online import OnlineEigenSolver
+from rbnics.backends.online import OnlineEigenSolver, OnlineFunction
+from rbnics.backends.online.wrapping import (
+    function_to_vector as online_function_to_online_vector, randomized_range_finder)
 from rbnics.utils.decorators import BackendFor, ModuleWrapper
 
 
@@ -24,8 +26,8 @@ def transpose(arg):
 
 backend = ModuleWrapper(transpose)
 wrapping = ModuleWrapper(get_mpi_comm)
-online_backend = ModuleWrapper(OnlineEigenSolver=OnlineEigenSolver)
-online_wrapping = ModuleWrapper()
+online_backend = ModuleWrapper(OnlineEigenSolver=OnlineEigenSolver, OnlineFunction=OnlineFunction)
+online_wrapping = ModuleWrapper(randomized_range_finder, function_to_vector=online_function_to_online_vector)
 ProperOrthogonalDecomposition_Base = BasicProperOrthogonalDecomposition(
     backend, wrapping, online_backend, online_wrapping, AbstractProperOrthogonalDecomposition,
     SnapshotsMatrix, FunctionsList)
@@ -38,3 +40,4 @@ class ProperOrthogonalDecomposition(ProperOrthogonalDecomposition_Base):
 
     def store_snapshot(self, snapshot, component=None, weight=None):
         self.snapshots_matrix.enrich(snapshot, component, weight)
+        self._store_snapshot_incrementally()
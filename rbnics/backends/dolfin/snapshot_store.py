@@ -0,0 +1,116 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import glob
+import os
+from multiprocessing import current_process
+from numbers import Number
+from mpi4py.MPI import COMM_WORLD
+from dolfin import FunctionSpace, has_hdf5, has_hdf5_parallel, HDF5File
+from rbnics.backends.abstract import SnapshotStore as AbstractSnapshotStore
+from rbnics.backends.dolfin.function import Function
+from rbnics.utils.decorators import BackendFor, list_of, overload
+from rbnics.utils.io import Folders
+from rbnics.utils.mpi import parallel_io
+
+NotImplementedType = type(NotImplemented)
+
+
+@BackendFor("dolfin", inputs=(FunctionSpace, (Folders.Folder, str), str))
+class SnapshotStore(AbstractSnapshotStore):
+    """
+    Store all snapshots of a problem as datasets of (appendable) HDF5 files, one group per key.
+    Outputs are stored as an attribute of the group of the corresponding snapshot. Writes are collective
+    on the communicator of the mesh. Processes which may write concurrently to the store, i.e. forked worker
+    processes and groups of processes not containing the first process of COMM_WORLD (as in the executors of
+    rbnics.sampling), append to a separate shard of the store, so that a file is never shared by several
+    independent HDF5 writers. Reads look for a key in all shards.
+    """
+
+    def __init__(self, space, directory, filename):
+        self.mpi_comm = space.mesh().mpi_comm()
+        assert has_hdf5(), "hdf5 is required by dolfin to use a snapshot store"
+        assert self.mpi_comm.size == 1 or has_hdf5_parallel(), (
+            "parallel hdf5 is required by dolfin to use a snapshot store in parallel")
+        self._directory = directory
+        self._filename = filename
+
+    def filename(self, key=None):
+        """
+        Return the file of the shard written by the current process or, if a key is provided, the file of
+        the shard containing it.
+        """
+        if key is None:
+            return self._shard_filename()
+        for shard_filename in self._shard_filenames():
+            if self._shard_has_dataset(shard_filename, key):
+                return shard_filename
+        raise OSError
+
+    def _shard_filename(self):
+        # Identify the writer by the rank in COMM_WORLD and the name of the first process of the mesh communicator
+        (world_rank, process_name) = self.mpi_comm.bcast((COMM_WORLD.rank, current_process().name), root=0)
+        shard = ""
+        if world_rank > 0:
+            shard += "_" + str(world_rank)
+        if process_name != "MainProcess":
+            shard += "_" + process_name
+        return os.path.join(str(self._directory), self._filename + shard + ".h5")
+
+    def _shard_filenames(self):
+        # Shard of the current process first, since it is the most likely to contain recently stored keys
+        shard_filename = self._shard_filename()
+
+        def glob_shards_task():
+            return sorted(glob.glob(os.path.join(str(self._directory), self._filename + "*.h5")))
+
+        return [shard_filename] + [
+            other_shard_filename for other_shard_filename in parallel_io(glob_shards_task, self.mpi_comm)
+            if other_shard_filename != shard_filename]
+
+    def _shard_has_dataset(self, shard_filename, key):
+        if not os.path.exists(shard_filename):
+            return False
+        try:
+            with HDF5File(self.mpi_comm, shard_filename, "r") as store:
+                return store.has_dataset("/" + key)
+        except RuntimeError:  # shard being written by another process, which cannot be read yet
+            return False
+
+    @overload(Function.Type(), str)
+    def save(self, function, key):
+        with HDF5File(self.mpi_comm, self.filename(), "a") as store:
+            # Keys are generated from the parameter value, so an existing dataset already contains the same snapshot
+            if not store.has_dataset("/" + key):
+                store.write(function, "/" + key)
+
+    # used while trying to write out scalar outputs for a problem without any output
+    @overload(list_of(NotImplementedType), str)
+    def save(self, output, key):
+        pass
+
+    @overload(list_of(Number), str)
+    def save(self, output, key):
+        assert len(output) == 1
+        # The snapshot may have been read from the shard of another process, which must not be written to:
+        # in such case the output is not stored, and will be computed again if required
+        if self._shard_has_dataset(self.filename(), key):
+            with HDF5File(self.mpi_comm, self.filename(), "a") as store:
+                store.attributes("/" + key)["output"] = float(output[0])
+
+    @overload(Function.Type(), str)
+    def load(self, function, key):
+        with HDF5File(self.mpi_comm, self.filename(key), "r") as store:
+            store.read(function, "/" + key)
+
+    @overload(list_of(Number), str)
+    def load(self, output, key):
+        assert len(output) == 1
+        with HDF5File(self.mpi_comm, self.filename(key), "r") as store:
+            attributes = store.attributes("/" + key)
+            if "output" not in attributes.list_attributes():
+                raise OSError
+            output[0] = attributes["output"]
@@ -72,7 +72,8 @@ from rbnics.backends.dolfin.wrapping.is_problem_solution import is_problem_solut
 from rbnics.backends.dolfin.wrapping.is_problem_solution_dot import is_problem_solution_dot
 from rbnics.backends.dolfin.wrapping.is_problem_solution_type import is_problem_solution_type
 from rbnics.backends.dolfin.wrapping.is_time_dependent import is_time_dependent
-from rbnics.backends.dolfin.wrapping.matrix_mul import matrix_mul_vector, vectorized_matrix_inner_vectorized_matrix
+from rbnics.backends.dolfin.wrapping.matrix_mul import (
+    matrix_mul_vector, vector_mul_matrix, vectorized_matrix_inner_vectorized_matrix)
 from rbnics.backends.dolfin.wrapping.parametrized_constant import (
     is_parametrized_constant, ParametrizedConstant, parametrized_constant_to_float)
 from rbnics.backends.dolfin.wrapping.parametrized_expression import ParametrizedExpression
@@ -170,6 +171,7 @@ __all__ = [
     "solution_iterator",
     "tensor_copy",
     "to_petsc4py",
+    "vector_mul_matrix",
     "vector_mul_vector",
     "vectorized_matrix_inner_vectorized_matrix"
 ]
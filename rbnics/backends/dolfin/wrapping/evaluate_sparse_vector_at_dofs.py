@@ -4,26 +4,45 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from mpi4py.MPI import MAX
+from numpy import array, logical_and, zeros
+from mpi4py.MPI import IN_PLACE, SUM
+from petsc4py import PETSc
 from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
 from rbnics.backends.online import OnlineVector
 
 
 def evaluate_sparse_vector_at_dofs(sparse_vector, dofs_list):
     vec = to_petsc4py(sparse_vector)
-    row_start, row_end = vec.getOwnershipRange()
-    out_size = len(dofs_list)
-    out = OnlineVector(out_size)
-    mpi_comm = vec.comm.tompi4py()
-    for (index, dofs) in enumerate(dofs_list):
+    for dofs in dofs_list:
         assert len(dofs) == 1
-        i = dofs[0]
-        out_index = None
-        vec_i_processor = -1
-        if i >= row_start and i < row_end:
-            out_index = vec.getValue(i)
-            vec_i_processor = mpi_comm.rank
-        vec_i_processor = mpi_comm.allreduce(vec_i_processor, op=MAX)
-        assert vec_i_processor >= 0
-        out[index] = mpi_comm.bcast(out_index, root=vec_i_processor)
+    out_values = _evaluate_vector_at_rows(vec, [dofs[0] for dofs in dofs_list])
+    out = OnlineVector(len(dofs_list))
+    for (index, value) in enumerate(out_values):
+        out[index] = value
     return out
+
+
+def _evaluate_vector_at_rows(vec, rows):
+    """
+    Return a numpy array with the values of vec at rows on all processes. Each process fetches the values
+    at the rows it owns with a single call to getValues, and a single collective operation then makes
+    all values available on all processes.
+    """
+    rows = array(rows, dtype=PETSc.IntType)
+    row_start, row_end = vec.getOwnershipRange()
+    owned = logical_and(rows >= row_start, rows < row_end)
+    values_and_owners = zeros((2, len(rows)))
+    if owned.any():
+        values_and_owners[0, owned] = vec.getValues(rows[owned])
+        values_and_owners[1, owned] = 1.
+    return _collect_values(vec.comm.tompi4py(), values_and_owners)
+
+
+def _collect_values(mpi_comm, values_and_owners):
+    """
+    Sum, over all processes, values (first row) and ownership flags (second row), which are zero on processes
+    that do not own the corresponding entry, so that every entry is provided by exactly one process.
+    """
+    mpi_comm.Allreduce(IN_PLACE, values_and_owners, op=SUM)
+    assert (values_and_owners[1] == 1.).all()
+    return values_and_owners[0]
@@ -8,6 +8,7 @@ from numbers import Number
 from logging import DEBUG, getLogger
 from ufl import Measure
 from ufl.geometry import GeometricQuantity
+from dolfin import Form
 from dolfin.function.argument import Argument
 from rbnics.eim.utils.decorators import get_problem_from_parametrized_operator
 from rbnics.utils.cache import Cache
@@ -429,8 +430,19 @@ def basic_form_on_reduced_function_space(backend, wrapping, online_backend, onli
                     solution_dot_from = reduced_basis_functions[:solution_dot_from_N] * solution_dot_from
                     backend.assign(solution_dot_to, solution_dot_from)
 
-        # Assemble and return
-        assembled_replaced_form = wrapping.assemble(replaced_form_with_replaced_measures)
+        # Assemble and return. The form is compiled only once, and the tensor (and thus its sparsity pattern)
+        # is preallocated by the first assembly and then reused, so that the returned tensor is overwritten
+        # by the next call with the same form and reduced function space
+        if (form_name, reduced_V) not in assembler_cache:
+            compiled_form = Form(replaced_form_with_replaced_measures)
+            assembled_replaced_form = wrapping.assemble(compiled_form)
+            if not isinstance(assembled_replaced_form, Number):
+                assembler_cache[(form_name, reduced_V)] = (compiled_form, assembled_replaced_form)
+            else:
+                assembler_cache[(form_name, reduced_V)] = (compiled_form, None)
+        else:
+            (compiled_form, tensor) = assembler_cache[(form_name, reduced_V)]
+            assembled_replaced_form = wrapping.assemble(compiled_form, tensor)
         if not isinstance(assembled_replaced_form, Number):
             form_rank = assembled_replaced_form.rank()
         else:
@@ -438,6 +450,7 @@ def basic_form_on_reduced_function_space(backend, wrapping, online_backend, onli
         return (assembled_replaced_form, form_rank)
 
     form_cache = Cache()
+    assembler_cache = Cache()
     truth_problems_cache = Cache()
     truth_problem_to_components_cache = Cache()
     truth_problem_to_exact_truth_problem_cache = Cache()
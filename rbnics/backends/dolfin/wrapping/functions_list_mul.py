@@ -12,8 +12,8 @@ def functions_list_mul_online_matrix(functions_list, online_matrix, FunctionsLis
     assert isinstance(space, FunctionSpace)
 
     output = FunctionsListType(space)
-    assert isinstance(online_matrix.M, int)
-    for j in range(online_matrix.M):
+    assert isinstance(online_matrix.N, int)
+    for j in range(online_matrix.N):
         assert len(online_matrix[:, j]) == len(functions_list)
         output_j = Function(space)
         for (i, fun_i) in enumerate(functions_list):
@@ -4,13 +4,20 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from dolfin import compile_cpp_code
+from dolfin import compile_cpp_code, Vector
 
 
 def matrix_mul_vector(matrix, vector):
     return matrix * vector
 
 
+def vector_mul_matrix(vector, matrix):
+    output = Vector(matrix.mpi_comm())
+    matrix.init_vector(output, 1)
+    matrix.transpmult(vector, output)
+    return output
+
+
 cpp_code = """
     #include <pybind11/pybind11.h>
     #include <dolfin/la/LinearAlgebraObject.h>
@@ -15,7 +15,7 @@ from rbnics.utils.cache import Cache
 from rbnics.utils.decorators import overload, tuple_of
 from rbnics.utils.io import (ComponentNameToBasisComponentIndexDict, Folders, OnlineSizeDict,
                              TextIO as ContentItemShapeIO, TextIO as ContentItemTypeIO, TextIO as DictIO,
-                             TextIO as ScalarContentIO)
+                             TextIO as HeaderIO, TextIO as ScalarContentIO)
 
 
 def AffineExpansionStorage(backend, wrapping):
@@ -63,72 +63,60 @@ def AffineExpansionStorage(backend, wrapping):
             # Initialize iterator
             it = AffineExpansionStorageContent_Iterator(
                 self._content, flags=["c_index", "multi_index", "refs_ok"], op_flags=["readonly"])
-            # Save content item type and shape
-            self._save_content_item_type_shape(self._content[it.multi_index], it, full_directory)
+            # Save header, containing content item type and shape and dicts
+            self._save_header(self._content[it.multi_index], full_directory)
             # Save content
             self._save_content(self._content[it.multi_index], it, full_directory)
-            # Save dicts
-            self._save_dicts(full_directory)
 
-        @overload(backend.Matrix.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
-        def _save_content_item_type_shape(self, item, it, full_directory):
-            ContentItemTypeIO.save_file("matrix", full_directory, "content_item_type")
-            ContentItemShapeIO.save_file((item.M, item.N), full_directory, "content_item_shape")
+        def _save_header(self, item, full_directory):
+            (content_item_type, content_item_shape) = self._get_content_item_type_shape(item)
+            header = {
+                "content_item_type": content_item_type,
+                "content_item_shape": content_item_shape,
+                "component_name_to_basis_component_index": self._component_name_to_basis_component_index,
+                "component_name_to_basis_component_length": self._component_name_to_basis_component_length
+            }
+            HeaderIO.save_file(header, full_directory, "header")
 
-        @overload(backend.Vector.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
-        def _save_content_item_type_shape(self, item, it, full_directory):
-            ContentItemTypeIO.save_file("vector", full_directory, "content_item_type")
-            ContentItemShapeIO.save_file(item.N, full_directory, "content_item_shape")
+        @overload(backend.Matrix.Type(), )
+        def _get_content_item_type_shape(self, item):
+            return ("matrix", (item.M, item.N))
 
-        @overload(backend.Function.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
-        def _save_content_item_type_shape(self, item, it, full_directory):
-            ContentItemTypeIO.save_file("function", full_directory, "content_item_type")
-            ContentItemShapeIO.save_file(item.N, full_directory, "content_item_shape")
+        @overload(backend.Vector.Type(), )
+        def _get_content_item_type_shape(self, item):
+            return ("vector", item.N)
 
-        @overload(Number, AffineExpansionStorageContent_Iterator, Folders.Folder)
-        def _save_content_item_type_shape(self, item, it, full_directory):
-            ContentItemTypeIO.save_file("scalar", full_directory, "content_item_type")
-            ContentItemShapeIO.save_file(None, full_directory, "content_item_shape")
+        @overload(backend.Function.Type(), )
+        def _get_content_item_type_shape(self, item):
+            return ("function", item.N)
 
-        @overload(AbstractFunctionsList, AffineExpansionStorageContent_Iterator, Folders.Folder)
-        def _save_content_item_type_shape(self, item, it, full_directory):
-            ContentItemTypeIO.save_file("functions_list", full_directory, "content_item_type")
-            ContentItemShapeIO.save_file(None, full_directory, "content_item_shape")
+        @overload(Number, )
+        def _get_content_item_type_shape(self, item):
+            return ("scalar", None)
 
-        @overload(AbstractBasisFunctionsMatrix, AffineExpansionStorageContent_Iterator, Folders.Folder)
-        def _save_content_item_type_shape(self, item, it, full_directory):
-            ContentItemTypeIO.save_file("basis_functions_matrix", full_directory, "content_item_type")
-            ContentItemShapeIO.save_file(None, full_directory, "content_item_shape")
+        @overload(AbstractFunctionsList, )
+        def _get_content_item_type_shape(self, item):
+            return ("functions_list", None)
 
-        @overload(None, AffineExpansionStorageContent_Iterator, Folders.Folder)
-        def _save_content_item_type_shape(self, item, it, full_directory):
-            ContentItemTypeIO.save_file("empty", full_directory, "content_item_type")
-            ContentItemShapeIO.save_file(None, full_directory, "content_item_shape")
+        @overload(AbstractBasisFunctionsMatrix, )
+        def _get_content_item_type_shape(self, item):
+            return ("basis_functions_matrix", None)
 
-        @overload(backend.Matrix.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
-        def _save_content(self, item, it, full_directory):
-            while not it.finished:
-                wrapping.tensor_save(self._content[it.multi_index], full_directory, "content_item_" + str(it.index))
-                it.iternext()
+        @overload(None, )
+        def _get_content_item_type_shape(self, item):
+            return ("empty", None)
 
-        @overload(backend.Vector.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
+        @overload((backend.Matrix.Type(), backend.Vector.Type(), Number),
+                  AffineExpansionStorageContent_Iterator, Folders.Folder)
         def _save_content(self, item, it, full_directory):
-            while not it.finished:
-                wrapping.tensor_save(self._content[it.multi_index], full_directory, "content_item_" + str(it.index))
-                it.iternext()
+            # Pack all content items in a single file, since content items all have the same shape
+            wrapping.tensors_save_packed(list(self._content.flat), full_directory, "content")
 
         @overload(backend.Function.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
         def _save_content(self, item, it, full_directory):
-            while not it.finished:
-                wrapping.function_save(self._content[it.multi_index], full_directory, "content_item_" + str(it.index))
-                it.iternext()
-
-        @overload(Number, AffineExpansionStorageContent_Iterator, Folders.Folder)
-        def _save_content(self, item, it, full_directory):
-            while not it.finished:
-                ScalarContentIO.save_file(
-                    self._content[it.multi_index], full_directory, "content_item_" + str(it.index))
-                it.iternext()
+            # Pack all content items in a single file, since content items all have the same shape
+            wrapping.tensors_save_packed([function.vector() for function in self._content.flat], full_directory,
+                                         "content")
 
         @overload(AbstractFunctionsList, AffineExpansionStorageContent_Iterator, Folders.Folder)
         def _save_content(self, item, it, full_directory):
@@ -146,12 +134,6 @@ def AffineExpansionStorage(backend, wrapping):
         def _save_content(self, item, it, full_directory):
             pass
 
-        def _save_dicts(self, full_directory):
-            DictIO.save_file(self._component_name_to_basis_component_index, full_directory,
-                             "component_name_to_basis_component_index")
-            DictIO.save_file(self._component_name_to_basis_component_length, full_directory,
-                             "component_name_to_basis_component_length")
-
         def load(self, directory, filename):
             if self._content is not None:  # avoid loading multiple times
                 if self._content.size > 0:
@@ -177,14 +159,34 @@ def AffineExpansionStorage(backend, wrapping):
             # Exit in the trivial case of empty affine expansion
             if self._content.size == 0:
                 return True
-            # Load content item type and shape
-            reference_item = self._load_content_item_type_shape(full_directory)
-            # Initialize iterator
-            it = AffineExpansionStorageContent_Iterator(self._content, flags=["c_index", "multi_index", "refs_ok"])
-            # Load content
-            self._load_content(reference_item, it, full_directory)
-            # Load dicts
-            self._load_dicts(full_directory)
+            if HeaderIO.exists_file(full_directory, "header"):
+                # Load header, containing content item type and shape and dicts
+                header = HeaderIO.load_file(
+                    full_directory, "header",
+                    globals={"ComponentNameToBasisComponentIndexDict": ComponentNameToBasisComponentIndexDict,
+                             "OnlineSizeDict": OnlineSizeDict})
+                reference_item = self._get_content_item_from_type_shape(
+                    header["content_item_type"], header["content_item_shape"])
+                # Initialize iterator
+                it = AffineExpansionStorageContent_Iterator(
+                    self._content, flags=["c_index", "multi_index", "refs_ok"])
+                # Load content
+                self._load_packed_content(reference_item, it, full_directory)
+                # Load dicts
+                self._component_name_to_basis_component_index = header["component_name_to_basis_component_index"]
+                self._component_name_to_basis_component_length = header["component_name_to_basis_component_length"]
+            else:
+                # Fall back to the format of previous versions, which stored each content item in its own file
+                reference_item = self._load_content_item_type_shape(full_directory)
+                # Initialize iterator
+                it = AffineExpansionStorageContent_Iterator(
+                    self._content, flags=["c_index", "multi_index", "refs_ok"])
+                # Load content
+                self._load_content(reference_item, it, full_directory)
+                # Load dicts
+                self._load_dicts(full_directory)
+            # Store dicts in each content item
+            self._store_dicts_in_content()
             # Reset precomputed slices
             self._precomputed_slices.clear()
             self._prepare_trivial_precomputed_slice(reference_item)
@@ -195,19 +197,21 @@ def AffineExpansionStorage(backend, wrapping):
             assert ContentItemTypeIO.exists_file(full_directory, "content_item_type")
             content_item_type = ContentItemTypeIO.load_file(full_directory, "content_item_type")
             assert ContentItemShapeIO.exists_file(full_directory, "content_item_shape")
+            content_item_shape = ContentItemShapeIO.load_file(
+                full_directory, "content_item_shape", globals={"OnlineSizeDict": OnlineSizeDict})
+            return self._get_content_item_from_type_shape(content_item_type, content_item_shape)
+
+        def _get_content_item_from_type_shape(self, content_item_type, content_item_shape):
             assert content_item_type in (
                 "matrix", "vector", "function", "scalar", "functions_list", "basis_functions_matrix", "empty")
             if content_item_type == "matrix":
-                (M, N) = ContentItemShapeIO.load_file(
-                    full_directory, "content_item_shape", globals={"OnlineSizeDict": OnlineSizeDict})
+                (M, N) = content_item_shape
                 return backend.Matrix(M, N)
             elif content_item_type == "vector":
-                N = ContentItemShapeIO.load_file(
-                    full_directory, "content_item_shape", globals={"OnlineSizeDict": OnlineSizeDict})
+                N = content_item_shape
                 return backend.Vector(N)
             elif content_item_type == "function":
-                N = ContentItemShapeIO.load_file(
-                    full_directory, "content_item_shape", globals={"OnlineSizeDict": OnlineSizeDict})
+                N = content_item_shape
                 return backend.Function(N)
             elif content_item_type == "scalar":
                 return 0.
@@ -225,6 +229,47 @@ def AffineExpansionStorage(backend, wrapping):
                 # impossible to arrive here anyway thanks to the assert
                 raise ValueError("Invalid content item type.")
 
+        @overload(backend.Matrix.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
+        def _load_packed_content(self, item, it, full_directory):
+            content = wrapping.tensors_load_packed(full_directory, "content")
+            while not it.finished:
+                # Content items are views of the memory mapped content, which is thus read lazily
+                self._content[it.multi_index] = backend.Matrix.Type()(item.M, item.N, content[it.index])
+                it.iternext()
+
+        @overload(backend.Vector.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
+        def _load_packed_content(self, item, it, full_directory):
+            content = wrapping.tensors_load_packed(full_directory, "content")
+            while not it.finished:
+                # Content items are views of the memory mapped content, which is thus read lazily
+                self._content[it.multi_index] = backend.Vector.Type()(item.N, content[it.index])
+                it.iternext()
+
+        @overload(backend.Function.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
+        def _load_packed_content(self, item, it, full_directory):
+            content = wrapping.tensors_load_packed(full_directory, "content")
+            while not it.finished:
+                # Content items are views of the memory mapped content, which is thus read lazily
+                self._content[it.multi_index] = backend.Function(backend.Vector.Type()(item.N, content[it.index]))
+                it.iternext()
+
+        @overload(Number, AffineExpansionStorageContent_Iterator, Folders.Folder)
+        def _load_packed_content(self, item, it, full_directory):
+            content = wrapping.tensors_load_packed(full_directory, "content")
+            while not it.finished:
+                self._content[it.multi_index] = float(content[it.index])
+                it.iternext()
+
+        @overload((AbstractFunctionsList, AbstractBasisFunctionsMatrix),
+                  AffineExpansionStorageContent_Iterator, Folders.Folder)
+        def _load_packed_content(self, item, it, full_directory):
+            # Functions lists and basis functions matrices are not packed, since they may have different lengths
+            self._load_content(item, it, full_directory)
+
+        @overload(None, AffineExpansionStorageContent_Iterator, Folders.Folder)
+        def _load_packed_content(self, item, it, full_directory):
+            pass
+
         @overload(backend.Matrix.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
         def _load_content(self, item, it, full_directory):
             while not it.finished:
@@ -278,6 +323,8 @@ def AffineExpansionStorage(backend, wrapping):
             self._component_name_to_basis_component_length = DictIO.load_file(
                 full_directory, "component_name_to_basis_component_length",
                 globals={"OnlineSizeDict": OnlineSizeDict})
+
+        def _store_dicts_in_content(self):
             it = AffineExpansionStorageContent_Iterator(
                 self._content, flags=["multi_index", "refs_ok"], op_flags=["readonly"])
             while not it.finished:
@@ -18,6 +18,7 @@ def LinearSolver(backend, wrapping):
                   ThetaType + DictOfThetaType + (None,))
         def __init__(self, lhs, solution, rhs, bcs=None):
             self.solution = solution
+            self._bcs = bcs
             self._init_lhs(lhs)
             self._init_rhs(rhs)
             self._apply_bcs(bcs)
@@ -70,4 +71,23 @@ def LinearSolver(backend, wrapping):
             bcs.apply_to_vector(self.rhs)
             bcs.apply_to_matrix(self.lhs)
 
+        @overload
+        def _apply_bcs_to_rhs(self, bcs: None):
+            pass
+
+        @overload
+        def _apply_bcs_to_rhs(self, bcs: ThetaType):
+            bcs = DirichletBC(bcs)
+            bcs.apply_to_vector(self.rhs)
+
+        @overload
+        def _apply_bcs_to_rhs(self, bcs: DictOfThetaType):
+            bcs = DirichletBC(bcs, self.rhs._component_name_to_basis_component_index, self.rhs.N)
+            bcs.apply_to_vector(self.rhs)
+
+        def set_rhs(self, rhs):
+            self._init_rhs(rhs)
+            self._apply_bcs_to_rhs(self._bcs)
+            preserve_solution_attributes(self.lhs, self.solution, self.rhs)
+
     return LinearSolver_Class
@@ -9,12 +9,13 @@ from rbnics.backends.online.numpy.copy import function_copy, tensor_copy
 from rbnics.backends.online.numpy.function import Function
 from rbnics.backends.online.numpy.matrix import Matrix
 from rbnics.backends.online.numpy.vector import Vector
-from rbnics.backends.online.numpy.wrapping import function_load, function_save, tensor_load, tensor_save
+from rbnics.backends.online.numpy.wrapping import (function_load, function_save, tensor_load, tensor_save,
+                                                   tensors_load_packed, tensors_save_packed)
 from rbnics.utils.decorators import BackendFor, ModuleWrapper, tuple_of
 
 backend = ModuleWrapper(Function, Matrix, Vector)
-wrapping = ModuleWrapper(function_load, function_save, tensor_load, tensor_save, function_copy=function_copy,
-                         tensor_copy=tensor_copy)
+wrapping = ModuleWrapper(function_load, function_save, tensor_load, tensor_save, tensors_load_packed,
+                         tensors_save_packed, function_copy=function_copy, tensor_copy=tensor_copy)
 AffineExpansionStorage_Base = BasicAffineExpansionStorage(backend, wrapping)
 
 
@@ -36,7 +36,14 @@ class EigenSolver(AbstractEigenSolver):
     def solve(self, n_eigs=None):
         assert "problem_type" in self.parameters
         if self.parameters["problem_type"] in ("hermitian", "gen_hermitian"):
-            eigs, eigv = eigh(self.A, self.B)
+            # Only compute the requested eigenpairs at the end of the spectrum, rather than all of them
+            subset_by_index = None
+            if n_eigs is not None and 0 < n_eigs < self.A.N:
+                if self.parameters.get("spectrum") == "largest real":
+                    subset_by_index = [self.A.N - n_eigs, self.A.N - 1]
+                elif self.parameters.get("spectrum") == "smallest real":
+                    subset_by_index = [0, n_eigs - 1]
+            eigs, eigv = eigh(self.A, self.B, subset_by_index=subset_by_index)
         else:
             eigs, eigv = eig(self.A, self.B)
 
@@ -9,16 +9,17 @@ from rbnics.backends.abstract import (
     HighOrderProperOrthogonalDecomposition as AbstractHighOrderProperOrthogonalDecomposition)
 from rbnics.backends.basic import ProperOrthogonalDecompositionBase as BasicHighOrderProperOrthogonalDecomposition
 from rbnics.backends.online.numpy.eigen_solver import EigenSolver
+from rbnics.backends.online.numpy.function import Function
 from rbnics.backends.online.numpy.tensor_snapshots_list import TensorSnapshotsList
 from rbnics.backends.online.numpy.tensor_basis_list import TensorBasisList
 from rbnics.backends.online.numpy.transpose import transpose
-from rbnics.backends.online.numpy.wrapping import get_mpi_comm
+from rbnics.backends.online.numpy.wrapping import function_to_vector, get_mpi_comm, randomized_range_finder
 from rbnics.utils.decorators import BackendFor, ModuleWrapper
 
 backend = ModuleWrapper(transpose)
 wrapping = ModuleWrapper(get_mpi_comm)
-online_backend = ModuleWrapper(OnlineEigenSolver=EigenSolver)
-online_wrapping = ModuleWrapper()
+online_backend = ModuleWrapper(OnlineEigenSolver=EigenSolver, OnlineFunction=Function)
+online_wrapping = ModuleWrapper(function_to_vector, randomized_range_finder)
 HighOrderProperOrthogonalDecomposition_Base = BasicHighOrderProperOrthogonalDecomposition(
     backend, wrapping, online_backend, online_wrapping, AbstractHighOrderProperOrthogonalDecomposition,
     TensorSnapshotsList, TensorBasisList)
@@ -29,5 +30,12 @@ class HighOrderProperOrthogonalDecomposition(HighOrderProperOrthogonalDecomposit
     def __init__(self, basis_functions, empty_tensor):
         HighOrderProperOrthogonalDecomposition_Base.__init__(self, basis_functions, None, empty_tensor)
 
+    def set_parameters(self, parameters):
+        # The incremental update requires to replace snapshots by their linear combinations, which is not
+        # available for tensors
+        assert "method" not in parameters or parameters["method"] != "incremental", (
+            "Incremental POD is not available for tensors")
+        HighOrderProperOrthogonalDecomposition_Base.set_parameters(self, parameters)
+
     def store_snapshot(self, snapshot):
         self.snapshots_matrix.enrich(snapshot)
@@ -35,6 +35,8 @@ class NonlinearSolver(AbstractNonlinearSolver):
         self._relative_tolerance = None
         self._report = False
         self._solution_tolerance = None
+        # Number of iterations of the latest call to solve
+        self.number_of_iterations = None
 
     def set_parameters(self, parameters):
         for (key, value) in parameters.items():
@@ -69,6 +71,7 @@ class NonlinearSolver(AbstractNonlinearSolver):
                 x_rtol=self._solution_tolerance, maxiter=self._maximum_iterations,
                 line_search=self._line_search, callback=self._monitor,
                 full_output=True, raise_exception=False)
+            self.number_of_iterations = info["nit"]
             if self._report:
                 if info["success"]:
                     print("scipy solver converged in " + str(info["nit"]) + " iterations.")
@@ -76,6 +79,7 @@ class NonlinearSolver(AbstractNonlinearSolver):
                     print("scipy solver diverged in " + str(info["nit"]) + " iterations.")
             self.problem.solution.vector()[:] = solution_vector
         except ArithmeticError as error:
+            self.number_of_iterations = None
             if self._report:
                 print("scipy solver diverged due to arithmetic error " + str(error))
         self.monitor(self.problem.solution)
@@ -4,7 +4,8 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from numpy import arange, isclose, linspace
+from numpy import arange, array_equal, isclose, linspace
+from scipy.linalg import lu_factor, lu_solve
 try:
     from assimulo.solvers import IDA
     from assimulo.problem import Implicit_Problem
@@ -15,7 +16,7 @@ else:
 from rbnics.backends.abstract import TimeStepping as AbstractTimeStepping, TimeDependentProblemWrapper
 from rbnics.backends.online.basic.wrapping import DirichletBC
 from rbnics.backends.online.numpy.assign import assign
-from rbnics.backends.online.numpy.copy import function_copy
+from rbnics.backends.online.numpy.copy import function_copy, tensor_copy
 from rbnics.backends.online.numpy.function import Function
 from rbnics.backends.online.numpy.linear_solver import LinearSolver
 from rbnics.backends.online.numpy.nonlinear_solver import NonlinearSolver, NonlinearProblemWrapper
@@ -106,11 +107,24 @@ class _ScipyImplicitEuler(object):
                     self.set_time(t)
                     self.minus_solution_previous_over_dt.vector()[:] = self.solution_previous.vector()
                     self.minus_solution_previous_over_dt.vector()[:] /= - self._time_step_size
-                    lhs = self.jacobian_eval(t, self.zero, self.zero, 1. / self._time_step_size)
+                    if self._time_independent_jacobian and self._lhs is not None:
+                        lhs = self._lhs
+                    else:
+                        lhs = self.jacobian_eval(t, self.zero, self.zero, 1. / self._time_step_size)
                     rhs = - self.residual_eval(t, self.zero, self.minus_solution_previous_over_dt)
                     bcs_t = self.bc_eval(t)
                     LinearSolver.__init__(self_, lhs, self.solution, rhs, bcs_t)
 
+                def solve(self_):
+                    # Factorize the left-hand side only if it has changed since the previous time step. A copy
+                    # is stored alongside the factorization, since the assembled matrix may be updated in place
+                    if self._lhs is None or not array_equal(self_.lhs, self._lhs):
+                        self._lhs = tensor_copy(self_.lhs)
+                        self._lhs_factorization = lu_factor(self_.lhs)
+                    self.solution.vector()[:] = lu_solve(self._lhs_factorization, self_.rhs)
+                    if self_.monitor is not None:
+                        self_.monitor(self.solution)
+
             self.solver_generator = _LinearSolver
         elif problem_type == "nonlinear":
 
@@ -153,6 +167,11 @@ class _ScipyImplicitEuler(object):
         self._monitor_initial_time = None
         self._monitor_time_step_size = None
         self._time_step_size = None
+        self._time_independent_jacobian = False
+        # Storage for the left-hand side of linear problems and its factorization, which are reused
+        # across time steps as long as the left-hand side does not change
+        self._lhs = None
+        self._lhs_factorization = None
 
     def _monitor(self, t, solution, solution_dot):
         if self._monitor_callback is not None:
@@ -186,6 +205,8 @@ class _ScipyImplicitEuler(object):
                     self._report = print_time
                 else:
                     self._report = None
+            elif key == "time_independent_jacobian":
+                self._time_independent_jacobian = value
             elif key == "time_step_size":
                 self._time_step_size = value
             else:
@@ -220,6 +241,9 @@ class _ScipyImplicitEuler(object):
         assert isclose(all_t[monitor_first_index], self._monitor_initial_time, atol=0.1 * self._time_step_size)
         monitor_step = int(round(monitor_dt_consistency))
         monitor_t = all_t[monitor_first_index::monitor_step]
+        # Discard any factorization from previous calls, since the parameter or the time step size may have changed
+        self._lhs = None
+        self._lhs_factorization = None
         # Solve
         if all_t[0] in monitor_t:
             self._monitor(all_t[0], self.solution, self.solution_dot)
@@ -358,6 +382,8 @@ if has_IDA:
                     self._relative_tolerance = value
                 elif key == "report":
                     self._report = True
+                elif key == "time_independent_jacobian":
+                    pass
                 elif key == "time_step_size":
                     self._time_step_size = value
                 else:
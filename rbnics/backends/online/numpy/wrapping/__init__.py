@@ -7,6 +7,9 @@
 from numpy import ix_ as Slicer
 from rbnics.backends.online.numpy.wrapping.basis_functions_matrix_mul import (
     basis_functions_matrix_mul_online_matrix, basis_functions_matrix_mul_online_vector)
+from rbnics.backends.online.numpy.wrapping.batched_evaluation import (
+    affine_expansion_storage_to_array, batched_factorized_solve, batched_solve, batched_sum_product,
+    batched_vector_mul_matrix_mul_vector, batched_vector_mul_vector, factorize)
 from rbnics.backends.online.numpy.wrapping.function_load import function_load
 from rbnics.backends.online.numpy.wrapping.function_save import function_save
 from rbnics.backends.online.numpy.wrapping.function_to_vector import function_to_vector
@@ -15,14 +18,23 @@ from rbnics.backends.online.numpy.wrapping.functions_list_mul import (
 from rbnics.backends.online.numpy.wrapping.get_mpi_comm import get_mpi_comm
 from rbnics.backends.online.numpy.wrapping.gram_schmidt_projection_step import gram_schmidt_projection_step
 from rbnics.backends.online.numpy.wrapping.matrix_mul import (
-    matrix_mul_vector, vectorized_matrix_inner_vectorized_matrix)
+    matrix_mul_vector, vector_mul_matrix, vectorized_matrix_inner_vectorized_matrix)
+from rbnics.backends.online.numpy.wrapping.randomized_range_finder import randomized_range_finder
 from rbnics.backends.online.numpy.wrapping.tensor_load import tensor_load
 from rbnics.backends.online.numpy.wrapping.tensor_save import tensor_save
+from rbnics.backends.online.numpy.wrapping.tensors_packed_io import tensors_load_packed, tensors_save_packed
 from rbnics.backends.online.numpy.wrapping.vector_mul import vector_mul_vector
 
 __all__ = [
+    "affine_expansion_storage_to_array",
     "basis_functions_matrix_mul_online_matrix",
     "basis_functions_matrix_mul_online_vector",
+    "batched_factorized_solve",
+    "batched_solve",
+    "batched_sum_product",
+    "batched_vector_mul_matrix_mul_vector",
+    "batched_vector_mul_vector",
+    "factorize",
     "function_load",
     "function_save",
     "function_to_vector",
@@ -31,9 +43,13 @@ __all__ = [
     "get_mpi_comm",
     "gram_schmidt_projection_step",
     "matrix_mul_vector",
+    "randomized_range_finder",
     "Slicer",
     "tensor_load",
     "tensor_save",
+    "tensors_load_packed",
+    "tensors_save_packed",
+    "vector_mul_matrix",
     "vector_mul_vector",
     "vectorized_matrix_inner_vectorized_matrix"
 ]
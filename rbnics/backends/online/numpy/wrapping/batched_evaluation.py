@@ -0,0 +1,61 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import arange, asarray, einsum, ndindex, newaxis
+from numpy.linalg import solve
+from scipy.linalg import lu_factor, lu_solve
+
+
+# Stack the content of an affine expansion storage of matrices, vectors or scalars into a single array,
+# with the affine expansion indices first
+def affine_expansion_storage_to_array(affine_expansion_storage):
+    shape = affine_expansion_storage._content.shape
+    content = [asarray(affine_expansion_storage[key]) for key in ndindex(*shape)]
+    return asarray(content).reshape(shape + content[0].shape)
+
+
+# Compute sum(product(thetas[p], affine_expansion_storage)) (or sum(product(thetas[p], affine_expansion_storage,
+# other_thetas[p])) for affine expansions of order two) for all rows p of thetas at once
+def batched_sum_product(thetas, affine_expansion_storage, other_thetas=None):
+    content = affine_expansion_storage_to_array(affine_expansion_storage)
+    if other_thetas is None:
+        return einsum("pq,q...->p...", asarray(thetas), content, optimize=True)
+    else:
+        return einsum("pq,qr...,pr->p...", asarray(thetas), content, asarray(other_thetas), optimize=True)
+
+
+# Solve the stacked linear systems lhs[p] * solution[p] = rhs[p] with a single batched solve, possibly
+# after imposing the (stacked) values bcs[p] on the first degrees of freedom, as DirichletBC does
+def batched_solve(lhs, rhs, bcs=None):
+    if bcs is not None:
+        bcs = asarray(bcs)
+        lhs = lhs.copy()
+        rhs = rhs.copy()
+        bcs_indices = arange(bcs.shape[1])
+        lhs[:, bcs_indices, :] = 0.
+        lhs[:, bcs_indices, bcs_indices] = 1.
+        rhs[:, bcs_indices] = bcs
+    return solve(lhs, rhs[..., newaxis])[..., 0]
+
+
+# Compute the LU factorization of a matrix, to be later used in batched_factorized_solve
+def factorize(lhs):
+    return lu_factor(asarray(lhs))
+
+
+# Solve the linear systems lhs * solution[p] = rhs[p] for all rows p at once, given the factorization of lhs
+def batched_factorized_solve(factorization, rhs):
+    return lu_solve(factorization, asarray(rhs).T).T
+
+
+# Compute transpose(vector[p]) * other_vector[p] for all rows p at once
+def batched_vector_mul_vector(vector, other_vector):
+    return einsum("pn,pn->p", vector, other_vector)
+
+
+# Compute transpose(vector[p]) * matrix[p] * other_vector[p] for all rows p at once
+def batched_vector_mul_matrix_mul_vector(vector, matrix, other_vector):
+    return einsum("pn,pnm,pm->p", vector, matrix, other_vector, optimize=True)
@@ -4,10 +4,16 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numpy import dot
+
 
 def matrix_mul_vector(matrix, vector):
     return matrix * vector
 
 
+def vector_mul_matrix(vector, matrix):
+    return dot(vector, matrix)
+
+
 def vectorized_matrix_inner_vectorized_matrix(matrix, other_matrix):
     return (matrix * other_matrix).sum()
@@ -0,0 +1,24 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy.linalg import qr
+from numpy.random import RandomState
+
+
+# Compute an orthonormal basis of (an approximation of) the range of a symmetric operator by randomized subspace
+# iteration, see Algorithm 4.4 in Halko, Martinsson, Tropp, SIAM Review 53(2), 2011. The operator is never formed
+# explicitly: it is only accessed through operator_mul_online_matrix, which is applied to dim x rank matrices
+def randomized_range_finder(operator_mul_online_matrix, dim, rank, power_iterations, random_seed):
+    # cannot import Matrix at global scope due to cyclic dependence
+    from rbnics.backends.online.numpy.matrix import Matrix
+    # Use the same random seed on every process, so that all processes end up with the same range
+    random_state = RandomState(random_seed)
+    range_ = Matrix(dim, rank)
+    range_[:, :] = random_state.standard_normal((dim, rank))
+    for _ in range(power_iterations + 1):
+        operator_range = operator_mul_online_matrix(range_)
+        range_[:, :] = qr(operator_range.content, mode="reduced")[0]
+    return range_
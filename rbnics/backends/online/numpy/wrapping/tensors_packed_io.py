@@ -0,0 +1,22 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import asarray
+from rbnics.utils.io import NumpyIO
+
+
+# Save a list of matrices, vectors or scalars of the same shape as a single stacked array
+def tensors_save_packed(tensors, directory, filename):
+    NumpyIO.save_file(asarray([asarray(tensor) for tensor in tensors]), directory, filename)
+
+
+# Load a stacked array saved by tensors_save_packed. The file is memory mapped in copy-on-write mode, so that
+# content is only read from disk when it is first accessed, and modifications are never written back to disk
+def tensors_load_packed(directory, filename):
+    if NumpyIO.exists_file(directory, filename):
+        return NumpyIO.load_file(directory, filename, mmap_mode="c")
+    else:
+        raise OSError
@@ -5,7 +5,6 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from numbers import Number
-from rbnics.backends import LinearSolver
 from rbnics.backends.basic.wrapping import DelayedLinearSolver, DelayedProduct
 from rbnics.eim.backends.offline_online_switch import OfflineOnlineSwitch
 from rbnics.utils.cache import cache
@@ -45,15 +44,11 @@ def OfflineOnlineRieszSolver(problem_name):
             @overload
             def solve(self, rhs: object):
                 problem = self.problem
-                args = (problem._riesz_solve_inner_product, problem._riesz_solve_storage, rhs,
-                        problem._riesz_solve_homogeneous_dirichlet_bc)
                 if not self.delay:
-                    solver = LinearSolver(*args)
-                    solver.set_parameters(problem._linear_solver_parameters)
-                    solver.solve()
-                    return problem._riesz_solve_storage
+                    return problem._riesz_solve(rhs)
                 else:
-                    solver = DelayedLinearSolver(*args)
+                    solver = DelayedLinearSolver(problem._riesz_solve_inner_product, problem._riesz_solve_storage, rhs,
+                                                 problem._riesz_solve_homogeneous_dirichlet_bc)
                     solver.set_parameters(problem._linear_solver_parameters)
                     return solver
 
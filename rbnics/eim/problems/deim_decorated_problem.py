@@ -195,20 +195,55 @@ def DEIMDecoratedProblem(
                     deim_forms.append(non_deim_form)
                 return tuple(deim_forms)
 
+            def compute_theta_batched(self, term, mus):
+                OfflineOnlineSwitch = self.offline_online_backend.OfflineOnlineSwitch
+                if (OfflineOnlineSwitch.get_current_stage() in self._apply_DEIM_at_stages
+                        and term in self.DEIM_approximations):
+                    return self._compute_theta_DEIM_batched(term, mus)
+                else:
+                    return ParametrizedDifferentialProblem_DerivedClass.compute_theta_batched(self, term, mus)
+
             def _compute_theta_DEIM(self, term):
                 original_thetas = ParametrizedDifferentialProblem_DerivedClass.compute_theta(self, term)
+
+                def compute_interpolated_theta(q, N_DEIM):
+                    return self.DEIM_approximations[term][q].compute_interpolated_theta(N_DEIM)
+
+                return self._combine_thetas_DEIM(term, original_thetas, compute_interpolated_theta)
+
+            def _compute_theta_DEIM_batched(self, term, mus):
+                original_thetas = list()
+                for mu in mus:
+                    self.set_mu(mu)
+                    original_thetas.append(ParametrizedDifferentialProblem_DerivedClass.compute_theta(self, term))
+                # Interpolate each form for all parameters at once
+                interpolated_thetas = dict()  # from q to interpolated thetas stacked over parameters
+                for (q, deim_approximation) in self.DEIM_approximations[term].items():
+                    N_DEIM = None
+                    if self._N_DEIM is not None:
+                        N_DEIM = self._N_DEIM[term][q]
+                    interpolated_thetas[q] = deim_approximation.compute_interpolated_theta_batched(mus, N_DEIM)
+                deim_thetas = list()
+                for (p, original_thetas_p) in enumerate(original_thetas):
+
+                    def compute_interpolated_theta(q, N_DEIM):
+                        return tuple(interpolated_thetas[q][p])
+
+                    deim_thetas.append(self._combine_thetas_DEIM(term, original_thetas_p, compute_interpolated_theta))
+                return deim_thetas
+
+            def _combine_thetas_DEIM(self, term, original_thetas, compute_interpolated_theta):
                 deim_thetas = list()
                 assert len(self.DEIM_approximations[term]) + len(self.non_DEIM_forms[term]) == len(original_thetas)
                 if self._N_DEIM is not None:
                     assert term in self._N_DEIM
                     assert len(self.DEIM_approximations[term]) == len(self._N_DEIM[term])
                 # Append forms computed with DEIM, if applicable
-                for (q, deim_approximation) in self.DEIM_approximations[term].items():
+                for q in self.DEIM_approximations[term]:
                     N_DEIM = None
                     if self._N_DEIM is not None:
                         N_DEIM = self._N_DEIM[term][q]
-                    deim_thetas_q = [v * original_thetas[q]
-                                     for v in deim_approximation.compute_interpolated_theta(N_DEIM)]
+                    deim_thetas_q = [v * original_thetas[q] for v in compute_interpolated_theta(q, N_DEIM)]
                     deim_thetas.extend(deim_thetas_q)
                 # Append forms which did not require DEIM, if applicable
                 for q in self.non_DEIM_forms[term]:
@@ -6,9 +6,11 @@
 
 import os
 import hashlib
+from numpy import zeros as array
 from rbnics.problems.base import ParametrizedProblem
 from rbnics.backends import abs, assign, copy, evaluate, export, import_, max
 from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineFunction, OnlineLinearSolver
+from rbnics.backends.online.wrapping import batched_factorized_solve, factorize
 from rbnics.utils.cache import Cache
 from rbnics.utils.decorators import sync_setters
 from rbnics.eim.utils.decorators import StoreMapFromParametrizedExpressionToProblem
@@ -40,6 +42,9 @@ class EIMApproximation(ParametrizedProblem):
         self.interpolation_matrix = OnlineAffineExpansionStorage(1)
         # Solution
         self._interpolation_coefficients = None  # OnlineFunction
+        # Factorizations of the interpolation matrix (for each N), employed by batched interpolation,
+        # together with the interpolation matrix they were computed from
+        self._interpolation_matrix_factorizations = (None, dict())
 
         # $$ OFFLINE DATA STRUCTURES $$ #
         self.snapshot = parametrized_expression.create_empty_snapshot()
@@ -73,7 +78,8 @@ class EIMApproximation(ParametrizedProblem):
             key_generator=_snapshot_cache_key_generator,
             import_=_snapshot_cache_import,
             export=_snapshot_cache_export,
-            filename_generator=_snapshot_cache_filename_generator
+            filename_generator=_snapshot_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
     # Initialize data structures required for the online phase
@@ -150,6 +156,37 @@ class EIMApproximation(ParametrizedProblem):
                 interpolated_theta_list.append(0.0)
         return tuple(interpolated_theta_list)
 
+    # Compute interpolated thetas for each parameter in mus at once, returning them stacked as rows of an array.
+    # The parametrized expression is evaluated at interpolation locations for each parameter, but the interpolation
+    # problems are solved with a single batched solve, employing a factorization of the interpolation matrix which
+    # is cached for later calls.
+    def compute_interpolated_theta_batched(self, mus, N=None):
+        if N is None:
+            N = self.N
+
+        interpolated_thetas = array((len(mus), self.N))
+        if N > 0:
+            # Evaluate the parametrized expression at interpolation locations
+            rhs = list()
+            for mu in mus:
+                self.set_mu(mu)
+                rhs.append(evaluate(self.parametrized_expression, self.interpolation_locations[:N]))
+
+            # Solve the interpolation problems
+            interpolated_thetas[:, :N] = batched_factorized_solve(self._get_interpolation_matrix_factorization(N), rhs)
+        # Note that a 0 coefficient is returned for each basis function which has not been requested
+        return interpolated_thetas
+
+    def _get_interpolation_matrix_factorization(self, N):
+        interpolation_matrix = self.interpolation_matrix[0]
+        (factorized_interpolation_matrix, factorizations) = self._interpolation_matrix_factorizations
+        if interpolation_matrix is not factorized_interpolation_matrix:
+            factorizations = dict()
+            self._interpolation_matrix_factorizations = (interpolation_matrix, factorizations)
+        if N not in factorizations:
+            factorizations[N] = factorize(interpolation_matrix[:N, :N])
+        return factorizations[N]
+
     # Compute the interpolation error and/or its maximum location
     def compute_maximum_interpolation_error(self, N=None):
         if N is None:
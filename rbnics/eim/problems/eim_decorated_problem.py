@@ -210,8 +210,48 @@ def EIMDecoratedProblem(
                         eim_forms.append(unchanged_form)
                 return tuple(eim_forms)
 
+            def compute_theta_batched(self, term, mus):
+                OfflineOnlineSwitch = self.offline_online_backend.OfflineOnlineSwitch
+                if (OfflineOnlineSwitch.get_current_stage() in self._apply_EIM_at_stages
+                        and term in self.separated_forms):
+                    return self._compute_theta_EIM_batched(term, mus)
+                else:
+                    return ParametrizedDifferentialProblem_DerivedClass.compute_theta_batched(self, term, mus)
+
             def _compute_theta_EIM(self, term):
                 original_thetas = ParametrizedDifferentialProblem_DerivedClass.compute_theta(self, term)
+
+                def compute_interpolated_theta(factor, N_EIM):
+                    return self.EIM_approximations[factor].compute_interpolated_theta(N_EIM)
+
+                return self._combine_thetas_EIM(term, original_thetas, compute_interpolated_theta)
+
+            def _compute_theta_EIM_batched(self, term, mus):
+                original_thetas = list()
+                for mu in mus:
+                    self.set_mu(mu)
+                    original_thetas.append(ParametrizedDifferentialProblem_DerivedClass.compute_theta(self, term))
+                # Interpolate each factor for all parameters at once
+                interpolated_thetas = dict()  # from (factor, N_EIM) to interpolated thetas stacked over parameters
+                for (q, form) in enumerate(self.separated_forms[term]):
+                    N_EIM = None
+                    if self._N_EIM is not None:
+                        N_EIM = self._N_EIM[term][q]
+                    for addend in form.coefficients:
+                        for factor in addend:
+                            if (factor, N_EIM) not in interpolated_thetas:
+                                interpolated_thetas[factor, N_EIM] = self.EIM_approximations[
+                                    factor].compute_interpolated_theta_batched(mus, N_EIM)
+                eim_thetas = list()
+                for (p, original_thetas_p) in enumerate(original_thetas):
+
+                    def compute_interpolated_theta(factor, N_EIM):
+                        return tuple(interpolated_thetas[factor, N_EIM][p])
+
+                    eim_thetas.append(self._combine_thetas_EIM(term, original_thetas_p, compute_interpolated_theta))
+                return eim_thetas
+
+            def _combine_thetas_EIM(self, term, original_thetas, compute_interpolated_theta):
                 eim_thetas = list()
                 assert len(self.separated_forms[term]) == len(original_thetas)
                 if self._N_EIM is not None:
@@ -225,7 +265,7 @@ def EIMDecoratedProblem(
                             N_EIM = None
                             if self._N_EIM is not None:
                                 N_EIM = self._N_EIM[term][q]
-                            eim_thetas__list.append(self.EIM_approximations[factor].compute_interpolated_theta(N_EIM))
+                            eim_thetas__list.append(compute_interpolated_theta(factor, N_EIM))
                         eim_thetas__cartesian_product = cartesian_product(*eim_thetas__list)
                         for tuple_ in eim_thetas__cartesian_product:
                             eim_thetas_tuple = original_thetas[q]
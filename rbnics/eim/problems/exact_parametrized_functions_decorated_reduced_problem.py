@@ -184,6 +184,21 @@ def ExactParametrizedFunctionsDecoratedReducedProblem(ParametrizedReducedDiffere
             # Update current stage in offline/online switch
             OfflineOnlineSwitch.set_current_stage(current_stage)
 
+        if hasattr(ParametrizedReducedDifferentialProblem_DerivedClass, "estimate_error_batched"):
+            def estimate_error_batched(self, mus):
+                # Exact operators do not have an affine decomposition, and thus cannot be stacked over
+                # parameters: revert to evaluating one parameter at a time
+                OfflineOnlineSwitch = self.offline_online_backend.OfflineOnlineSwitch
+                if OfflineOnlineSwitch.get_current_stage() in self.truth_problem._apply_exact_evaluation_at_stages:
+                    error_estimators = list()
+                    for mu in mus:
+                        self.set_mu(mu)
+                        self.solve()
+                        error_estimators.append(self.estimate_error())
+                    return error_estimators
+                else:
+                    return ParametrizedReducedDifferentialProblem_DerivedClass.estimate_error_batched(self, mus)
+
         def _cache_key_from_N_and_kwargs(self, N, **kwargs):
             if len(self.truth_problem._apply_exact_evaluation_at_stages) == 1:
                 # uses EIM/DEIM online and exact evaluation offline
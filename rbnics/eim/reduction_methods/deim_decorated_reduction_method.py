@@ -63,6 +63,15 @@ def DEIMDecoratedReductionMethod(DifferentialProblemReductionMethod_DerivedClass
 
             self._propagate_setter_from_kwargs_to_DEIM_reductions(setter, Number, **kwargs)
 
+        # OFFLINE: set the executor used to evaluate parametrized tensors over the training set of DEIM reductions
+        def set_snapshots_executor(self, executor, **kwargs):
+            if hasattr(DifferentialProblemReductionMethod_DerivedClass, "set_snapshots_executor"):
+                DifferentialProblemReductionMethod_DerivedClass.set_snapshots_executor(self, executor, **kwargs)
+
+            for DEIM_reductions_term in self.DEIM_reductions.values():
+                for DEIM_reduction_term_q in DEIM_reductions_term.values():
+                    DEIM_reduction_term_q.set_snapshots_executor(executor)
+
         # OFFLINE: set the elements in the training set.
         def initialize_training_set(self, ntrain, enable_import=True, sampling=None, **kwargs):
             import_successful = DifferentialProblemReductionMethod_DerivedClass.initialize_training_set(
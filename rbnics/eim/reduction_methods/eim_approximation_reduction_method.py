@@ -5,8 +5,12 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 import os
+from numpy import argmax, zeros
 from rbnics.reduction_methods.base import ReductionMethod
-from rbnics.backends import abs, evaluate, max
+from rbnics.backends import abs, assign, evaluate, max
+from rbnics.sampling.executors import Executor
+from rbnics.utils.cache.cache import parse_cache_limit
+from rbnics.utils.config import config
 from rbnics.utils.decorators import snapshot_links_to_cache
 from rbnics.utils.io import (ErrorAnalysisTable, Folders, GreedySelectedParametersList, GreedyErrorEstimatorsList,
                              SpeedupAnalysisTable, TextBox, TextLine, Timer)
@@ -24,14 +28,20 @@ class EIMApproximationReductionMethod(ReductionMethod):
         # $$ OFFLINE DATA STRUCTURES $$ #
         # High fidelity problem
         self.EIM_approximation = EIM_approximation
-        # Declare a new container to store the snapshots
+        # Declare a new container to store the snapshots. During the greedy algorithm, snapshots are replaced
+        # in place by their interpolation residuals
         self.snapshots_container = self.EIM_approximation.parametrized_expression.create_snapshots_container()
         self._training_set_parameters_to_snapshots_container_index = dict()
+        # Maximum of the interpolation residuals, one for each parameter in the training set
+        self._training_set_residuals_maximum = None
         # I/O
         self.folder["snapshots"] = os.path.join(self.folder_prefix, "snapshots")
         self.folder["post_processing"] = os.path.join(self.folder_prefix, "post_processing")
         self.greedy_selected_parameters = GreedySelectedParametersList()
         self.greedy_errors = GreedyErrorEstimatorsList()
+        # Executor used to evaluate the parametrized expression over the training set in advance, storing
+        # evaluations in the disk cache. None corresponds to evaluations being carried out sequentially on the fly.
+        self.snapshots_executor = None
         #
         # By default set a tolerance slightly larger than zero, in order to
         # stop greedy iterations in trivial cases by default
@@ -51,6 +61,11 @@ class EIMApproximationReductionMethod(ReductionMethod):
         return ReductionMethod.initialize_testing_set(
             self, self.EIM_approximation.mu_range, ntest, enable_import, sampling, **kwargs)
 
+    # OFFLINE: set the executor used to evaluate the parametrized expression over the training set
+    def set_snapshots_executor(self, executor, **kwargs):
+        assert executor is None or isinstance(executor, Executor)
+        self.snapshots_executor = executor
+
     # Perform the offline phase of EIM
     def offline(self):
         need_to_do_offline_stage = self._init_offline()
@@ -92,6 +107,11 @@ class EIMApproximationReductionMethod(ReductionMethod):
                       + "\n".join(description), fill="="))
         print("")
 
+        if self.snapshots_executor is not None:
+            print(TextLine(interpolation_method_name + " evaluations over the training set", fill=":"))
+            self.compute_snapshots()
+            print("")
+
         for (mu_index, mu) in enumerate(self.training_set):
             print(TextLine(interpolation_method_name + " " + str(mu_index), fill=":"))
 
@@ -132,12 +152,9 @@ class EIMApproximationReductionMethod(ReductionMethod):
             while self.EIM_approximation.N < self.Nmax and relative_error_max >= self.tol:
                 print(TextLine(interpolation_method_name + " N = " + str(self.EIM_approximation.N), fill=":"))
 
-                self._print_greedy_interpolation_solve_message()
-                self.EIM_approximation.solve()
-
                 print("compute and locate maximum interpolation error")
-                self.EIM_approximation.snapshot = self.load_snapshot()
-                (error, maximum_error, maximum_location) = self.EIM_approximation.compute_maximum_interpolation_error()
+                error = self.load_snapshot()
+                (maximum_error, maximum_location) = max(abs(error))
 
                 print("update locations with", maximum_location)
                 self.update_interpolation_locations(maximum_location)
@@ -182,8 +199,22 @@ class EIMApproximationReductionMethod(ReductionMethod):
     def _finalize_offline(self):
         self.EIM_approximation.init("online")
 
-    def _print_greedy_interpolation_solve_message(self):
-        print("solve interpolation for mu =", self.EIM_approximation.mu)
+    # Evaluate the parametrized expression for all parameters in the training set through the snapshots executor.
+    # Evaluations are not returned, but rather stored in the disk cache of the EIM approximation, from which they
+    # will be read when filling the snapshots container.
+    def compute_snapshots(self):
+        assert "disk" in config.get("EIM", "cache"), (
+            "A snapshots executor requires the disk cache of EIM approximations to be enabled")
+        # Each worker process or group of processes has its own index of the disk cache, so that a limit would
+        # not be enforced globally, and snapshots evicted by a worker would have to be computed again
+        assert parse_cache_limit(config.get("EIM", "disk cache limit")) is None, (
+            "A snapshots executor requires the disk cache of EIM approximations to be unlimited")
+
+        def evaluate_parametrized_expression(mu_index):
+            self.EIM_approximation.set_mu(self.training_set[mu_index])
+            self.EIM_approximation.evaluate_parametrized_expression()
+
+        self.snapshots_executor.execute(evaluate_parametrized_expression, range(len(self.training_set)))
 
     # Update the snapshots container
     def add_to_snapshots(self, snapshot):
@@ -226,7 +257,7 @@ class EIMApproximationReductionMethod(ReductionMethod):
         self.EIM_approximation.interpolation_matrix.save(
             self.EIM_approximation.folder["reduced_operators"], "interpolation_matrix")
 
-    # Load the precomputed snapshot
+    # Load the interpolation residual of the precomputed snapshot, by which the snapshot has been replaced
     def load_snapshot(self):
         assert self.EIM_approximation.basis_generation == "Greedy"
         mu = self.EIM_approximation.mu
@@ -238,12 +269,12 @@ class EIMApproximationReductionMethod(ReductionMethod):
     def greedy(self):
         assert self.EIM_approximation.basis_generation == "Greedy"
 
+        # Update the interpolation residuals with the latest basis function
+        self.update_training_set_residuals()
+
         # Print some additional information on the consistency of the reduced basis
         if self.EIM_approximation.N > 0:  # skip during initialization
-            self.EIM_approximation.solve()
-            self.EIM_approximation.snapshot = self.load_snapshot()
-            error = (self.EIM_approximation.snapshot
-                     - self.EIM_approximation.basis_functions * self.EIM_approximation._interpolation_coefficients)
+            error = self.load_snapshot()
             error_on_interpolation_locations = evaluate(error, self.EIM_approximation.interpolation_locations)
             (maximum_error, _) = max(abs(error))
             (maximum_error_on_interpolation_locations, _) = max(abs(error_on_interpolation_locations))
@@ -252,19 +283,12 @@ class EIMApproximationReductionMethod(ReductionMethod):
                   abs(maximum_error_on_interpolation_locations))  # for consistency check, should be zero
 
         # Carry out the actual greedy search
-        def solve_and_computer_error(mu):
-            self.EIM_approximation.set_mu(mu)
-
-            self.EIM_approximation.solve()
-            self.EIM_approximation.snapshot = self.load_snapshot()
-            (_, maximum_error, _) = self.EIM_approximation.compute_maximum_interpolation_error()
-            return abs(maximum_error)
-
         if self.EIM_approximation.N == 0:
             print("find initial mu")
         else:
             print("find next mu")
-        (error_max, error_argmax) = self.training_set.max(solve_and_computer_error)
+        error_argmax = int(argmax(self._training_set_residuals_maximum))
+        error_max = self._training_set_residuals_maximum[error_argmax]
         self.EIM_approximation.set_mu(self.training_set[error_argmax])
         self.greedy_selected_parameters.append(self.training_set[error_argmax])
         self.greedy_selected_parameters.save(self.folder["post_processing"], "mu_greedy")
@@ -287,6 +311,27 @@ class EIMApproximationReductionMethod(ReductionMethod):
                 self.tol = 1.
             return (0., 0.)
 
+    # Update the interpolation residuals of all snapshots in the training set. Since the interpolation matrix
+    # is lower triangular with unit diagonal, the interpolant with N basis functions is obtained from the one with
+    # N - 1 basis functions by adding the (N - 1)-th basis function times the residual at the (N - 1)-th
+    # interpolation location, so that residuals can be updated with a rank one correction, rather than
+    # recomputed from scratch by solving the interpolation problem for each parameter in the training set.
+    # Residuals are stored in place of the snapshots in the snapshots container, the residual with no basis
+    # functions being the snapshot itself.
+    def update_training_set_residuals(self):
+        N = self.EIM_approximation.N
+        assert len(self.snapshots_container) == len(self.training_set)
+        if N > 0:
+            basis_function = self.EIM_approximation.basis_functions[N - 1]
+            for residual in self.snapshots_container:
+                residual_at_location = evaluate(residual, self.EIM_approximation.interpolation_locations)[N - 1]
+                if residual_at_location != 0.:
+                    assign(residual, residual - basis_function * residual_at_location)
+        self._training_set_residuals_maximum = zeros(len(self.snapshots_container))
+        for (mu_index, residual) in enumerate(self.snapshots_container):
+            (maximum_residual, _) = max(abs(residual))
+            self._training_set_residuals_maximum[mu_index] = abs(maximum_residual)
+
     # Compute the error of the empirical interpolation approximation with respect to the
     # exact function over the testing set
     def error_analysis(self, N_generator=None, filename=None, **kwargs):
@@ -59,6 +59,14 @@ def EIMDecoratedReductionMethod(DifferentialProblemReductionMethod_DerivedClass)
 
             self._propagate_setter_from_kwargs_to_EIM_reductions(setter, Number, **kwargs)
 
+        # OFFLINE: set the executor used to evaluate parametrized functions over the training set of EIM reductions
+        def set_snapshots_executor(self, executor, **kwargs):
+            if hasattr(DifferentialProblemReductionMethod_DerivedClass, "set_snapshots_executor"):
+                DifferentialProblemReductionMethod_DerivedClass.set_snapshots_executor(self, executor, **kwargs)
+
+            for EIM_reduction_coeff in self.EIM_reductions.values():
+                EIM_reduction_coeff.set_snapshots_executor(executor)
+
         # OFFLINE: set the elements in the training set.
         def initialize_training_set(self, ntrain, enable_import=True, sampling=None, **kwargs):
             import_successful = DifferentialProblemReductionMethod_DerivedClass.initialize_training_set(
@@ -87,9 +87,6 @@ class TimeDependentEIMApproximationReductionMethod(EIMApproximationReductionMeth
             mu_t["t"] = t[0]
             mu_set[n] = mu_t
 
-    def _print_greedy_interpolation_solve_message(self):
-        print("solve interpolation for mu =", self.EIM_approximation.mu, "and t =", self.EIM_approximation.t)
-
     # Load the precomputed snapshot. Overridden to correct the assert
     def load_snapshot(self):
         assert self.EIM_approximation.basis_generation == "Greedy"
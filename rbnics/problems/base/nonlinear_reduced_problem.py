@@ -4,7 +4,10 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from rbnics.backends import NonlinearProblemWrapper, NonlinearSolver
+from collections import OrderedDict
+from heapq import nsmallest
+from math import sqrt
+from rbnics.backends import copy, NonlinearProblemWrapper, NonlinearSolver
 from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators
 
 
@@ -22,12 +25,127 @@ def NonlinearReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass)
             # Nonlinear solver parameters
             self._nonlinear_solver_parameters = dict()
 
+            # Warm start of the nonlinear solver from cached solutions
+            self._warm_start = None
+            self._warm_start_window = None  # from cache key to solution, in order of computation
+            self._warm_start_window_size = None
+            self.warm_start_statistics = WarmStartStatistics()
+
+        def set_warm_start(self, warm_start, window=100):
+            """
+            Set the initial guess of the nonlinear solver to be computed from solutions previously computed
+            for different parameters:
+            * None: start from zero (default);
+            * "nearest": start from the cached solution with the closest parameter;
+            * "extrapolated": start from the linear extrapolation of the cached solutions with the two closest
+              parameters, evaluated at the projection of the current parameter on the line through them.
+            Only the solutions of the last window solves with the same reduced dimension are considered, so that
+            the cost of computing the initial guess does not grow with the number of solves. A solve for a
+            parameter already in the window replaces its previous solution.
+            """
+            assert warm_start in (None, "nearest", "extrapolated")
+            assert isinstance(window, int) and window > 0
+            self._warm_start = warm_start
+            if warm_start is None:
+                self._warm_start_window = None
+                self._warm_start_window_size = None
+            else:
+                self._warm_start_window = OrderedDict()
+                self._warm_start_window_size = window
+
+        def _compute_warm_start(self, N, **kwargs):
+            # Look for recent solutions with the same dimension and keyword arguments, but a different parameter
+            current_cache_key = self._cache_key_from_N_and_kwargs(N, **kwargs)
+            recent_mus_and_solutions = [
+                (cache_key[0], recent_solution)
+                for (cache_key, recent_solution) in tuple(self._warm_start_window.items())
+                if cache_key[0] != current_cache_key[0] and cache_key[1:] == current_cache_key[1:]]
+            if len(recent_mus_and_solutions) == 0:
+                return None
+            closest_mus_and_solutions = nsmallest(
+                2, recent_mus_and_solutions, key=lambda mu_and_solution: _distance(mu_and_solution[0], self.mu))
+            (mu_1, solution_1) = closest_mus_and_solutions[0]
+            if self._warm_start == "nearest" or len(closest_mus_and_solutions) == 1:
+                return solution_1.vector()
+            elif self._warm_start == "extrapolated":
+                (mu_2, solution_2) = closest_mus_and_solutions[1]
+                if _distance(mu_2, mu_1) == 0.:  # e.g. same parameter with a different representation
+                    return solution_1.vector()
+                # Coordinate of the projection of the current parameter on the line through mu_1 and mu_2,
+                # with mu_1 corresponding to 0 and mu_2 to 1
+                t = (sum([(mu_p - mu_1_p) * (mu_2_p - mu_1_p) for (mu_p, mu_1_p, mu_2_p) in zip(self.mu, mu_1, mu_2)])
+                     / _distance(mu_2, mu_1)**2)
+                return solution_1.vector() + t * (solution_2.vector() - solution_1.vector())
+            else:
+                raise ValueError("Invalid warm start")
+
+        def _store_warm_start(self, cache_key):
+            # Replace the solution previously stored for the same cache key, if any, so that the window never
+            # contains the same parameter twice
+            self._warm_start_window.pop(cache_key, None)
+            self._warm_start_window[cache_key] = copy(self._solution)
+            while len(self._warm_start_window) > self._warm_start_window_size:
+                self._warm_start_window.popitem(last=False)
+
         class ProblemSolver(ParametrizedReducedDifferentialProblem_DerivedClass.ProblemSolver, NonlinearProblemWrapper):
             def solve(self):
                 problem = self.problem
+                if problem._warm_start is not None:
+                    initial_guess = problem._compute_warm_start(self.N, **self.kwargs)
+                    if initial_guess is not None:
+                        problem._solution.vector()[:] = initial_guess
+                else:
+                    initial_guess = None
                 solver = NonlinearSolver(self, problem._solution)
                 solver.set_parameters(problem._nonlinear_solver_parameters)
                 solver.solve()
+                if problem._warm_start is not None:
+                    problem._store_warm_start(problem._cache_key_from_N_and_kwargs(self.N, **self.kwargs))
+                problem.warm_start_statistics.add(solver.number_of_iterations, initial_guess is not None)
 
     # return value (a class) for the decorator
     return NonlinearReducedProblem_Class
+
+
+def _distance(mu, other_mu):
+    return sqrt(sum([(mu_p - other_mu_p)**2 for (mu_p, other_mu_p) in zip(mu, other_mu)]))
+
+
+class WarmStartStatistics(object):
+    """
+    Number of nonlinear iterations of reduced solves, depending on whether they were warm started or not.
+    """
+
+    def __init__(self):
+        self.cold_solves = 0
+        self.cold_iterations = 0
+        self.warm_solves = 0
+        self.warm_iterations = 0
+
+    def add(self, iterations, warm):
+        if iterations is None:  # iteration count not provided by the nonlinear solver
+            return
+        if warm:
+            self.warm_solves += 1
+            self.warm_iterations += iterations
+        else:
+            self.cold_solves += 1
+            self.cold_iterations += iterations
+
+    def iterations_saved(self):
+        """
+        Estimate the average number of iterations saved by each warm started solve, compared to the average
+        number of iterations of solves started from zero.
+        """
+        if self.cold_solves == 0 or self.warm_solves == 0:
+            return None
+        return self.cold_iterations / self.cold_solves - self.warm_iterations / self.warm_solves
+
+    def __str__(self):
+        output = ("cold started solves: " + str(self.cold_solves) + " (" + str(self.cold_iterations)
+                  + " iterations), warm started solves: " + str(self.warm_solves) + " (" + str(self.warm_iterations)
+                  + " iterations)")
+        iterations_saved = self.iterations_saved()
+        if iterations_saved is not None:
+            output += ", average iterations saved per warm started solve: " + "{0:.2f}".format(iterations_saved)
+        return output
@@ -9,8 +9,10 @@ import os
 import hashlib
 from numbers import Number
 from rbnics.problems.base.parametrized_problem import ParametrizedProblem
-from rbnics.backends import AffineExpansionStorage, assign, copy, export, Function, import_, product, sum
+from rbnics.backends import (AffineExpansionStorage, assign, copy, export, Function, import_, product,
+                             SnapshotStore, sum)
 from rbnics.utils.cache import Cache
+from rbnics.utils.config import config
 from rbnics.utils.decorators import (StoreMapFromProblemNameToProblem, StoreMapFromProblemToTrainingStatus,
                                      StoreMapFromSolutionToProblem)
 from rbnics.utils.test import PatchInstanceMethod
@@ -65,6 +67,17 @@ class ParametrizedDifferentialProblem(ParametrizedProblem, metaclass=ABCMeta):
         self._output = 0.
         # I/O
         self.folder["cache"] = os.path.join(self.folder_prefix, "cache")
+        # Disk cache storage: either one set of files per solution in the cache folder ("files"), or a single
+        # snapshot store in the cache folder for all solutions and outputs ("snapshot store")
+        disk_cache_storage = config.get("problems", "disk cache storage")
+        if disk_cache_storage == "files":
+            self._snapshot_store = None
+        elif disk_cache_storage == "snapshot store":
+            assert config.get("problems", "disk cache limit") == "unlimited", (
+                "A disk cache limit cannot be enforced on the snapshot store")
+            self._snapshot_store = SnapshotStore(self.V, self.folder["cache"], "snapshot_store")
+        else:
+            raise ValueError("Invalid disk cache storage")
 
         def _solution_cache_key_generator(*args, **kwargs):
             assert len(args) == 1
@@ -73,11 +86,17 @@ class ParametrizedDifferentialProblem(ParametrizedProblem, metaclass=ABCMeta):
 
         def _solution_cache_import(filename):
             solution = copy(self._solution)
-            self.import_solution(self.folder["cache"], filename, solution)
+            if self._snapshot_store is not None:
+                self._snapshot_store.load(solution, filename)
+            else:
+                self.import_solution(self.folder["cache"], filename, solution)
             return solution
 
         def _solution_cache_export(filename):
-            self.export_solution(self.folder["cache"], filename)
+            if self._snapshot_store is not None:
+                self._snapshot_store.save(self._solution, filename)
+            else:
+                self.export_solution(self.folder["cache"], filename)
 
         def _solution_cache_filename_generator(*args, **kwargs):
             assert len(args) == 1
@@ -89,7 +108,8 @@ class ParametrizedDifferentialProblem(ParametrizedProblem, metaclass=ABCMeta):
             key_generator=_solution_cache_key_generator,
             import_=_solution_cache_import,
             export=_solution_cache_export,
-            filename_generator=_solution_cache_filename_generator
+            filename_generator=_solution_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
         def _output_cache_key_generator(*args, **kwargs):
@@ -99,12 +119,18 @@ class ParametrizedDifferentialProblem(ParametrizedProblem, metaclass=ABCMeta):
 
         def _output_cache_import(filename):
             output = [0.]
-            self.import_output(self.folder["cache"], filename, output)
+            if self._snapshot_store is not None:
+                self._snapshot_store.load(output, filename)
+            else:
+                self.import_output(self.folder["cache"], filename, output)
             assert len(output) == 1
             return output[0]
 
         def _output_cache_export(filename):
-            self.export_output(self.folder["cache"], filename)
+            if self._snapshot_store is not None:
+                self._snapshot_store.save([self._output], filename)
+            else:
+                self.export_output(self.folder["cache"], filename)
 
         def _output_cache_filename_generator(*args, **kwargs):
             assert len(args) == 1
@@ -116,7 +142,8 @@ class ParametrizedDifferentialProblem(ParametrizedProblem, metaclass=ABCMeta):
             key_generator=_output_cache_key_generator,
             import_=_output_cache_import,
             export=_output_cache_export,
-            filename_generator=_output_cache_filename_generator
+            filename_generator=_output_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
     def name(self):
@@ -494,6 +521,17 @@ class ParametrizedDifferentialProblem(ParametrizedProblem, metaclass=ABCMeta):
         """
         raise NotImplementedError("The method compute_theta() is problem-specific and needs to be overridden.")
 
+    def compute_theta_batched(self, term, mus):
+        """
+        Return theta multiplicative terms of the affine expansion of the problem for each parameter in mus.
+        Note that the current parameter is changed to the last element of mus.
+        """
+        thetas = list()
+        for mu in mus:
+            self.set_mu(mu)
+            thetas.append(self.compute_theta(term))
+        return thetas
+
     @abstractmethod
     def assemble_operator(self, term):
         """
@@ -6,11 +6,15 @@
 
 from abc import ABCMeta, abstractmethod
 import os
+from copy import copy as shallow_copy
 from math import sqrt
+from threading import Lock
 from numpy import isclose
 from rbnics.problems.base.parametrized_problem import ParametrizedProblem
 from rbnics.backends import assign, BasisFunctionsMatrix, copy, product, sum, transpose
-from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineFunction, OnlineLinearSolver
+from rbnics.backends.abstract import AffineExpansionStorage as AbstractAffineExpansionStorage
+from rbnics.backends.online import (OnlineAffineExpansionStorage, OnlineFunction, OnlineLinearSolver, OnlineMatrix,
+                                    OnlineVector)
 from rbnics.utils.cache import Cache
 from rbnics.utils.decorators import StoreMapFromProblemToReducedProblem, sync_setters
 from rbnics.utils.io import OnlineSizeDict
@@ -94,9 +98,15 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         self.truth_problem = truth_problem
         # Basis functions matrix: BasisFunctionsMatrix
         self.basis_functions = None
+        # Reuse reduced operators of the previous call to build_reduced_operators, and only project
+        # the basis functions added since then. This is only valid if basis functions are never changed
+        # after being added, e.g. during a greedy algorithm
+        self.incremental_build_reduced_operators = False
         # I/O
         self.folder["basis"] = os.path.join(self.folder_prefix, "basis")
         self.folder["reduced_operators"] = os.path.join(self.folder_prefix, "reduced_operators")
+        # Lock protecting the evaluation of parameter dependent quantities in evaluate()
+        self._evaluate_lock = Lock()
 
     def init(self, current_stage="online"):
         """
@@ -426,6 +436,77 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         """
         self._output = NotImplemented
 
+    def evaluate(self, mu, N=None, outputs=("solution", ), **kwargs):
+        """
+        Perform an online query for the parameter mu, without changing the current parameter, solution, output
+        or caches of this reduced problem. Differently from solve(), this method can be called concurrently
+        (e.g. from a thread pool) by several clients sharing the same reduced problem. Slices of reduced operators
+        and basis functions are still stored in caches shared with this reduced problem, which are filled upon first
+        use: concurrent first uses are safe, but may compute the same slice more than once. A call to solve() for
+        the same N before concurrent queries avoids this.
+
+        :param mu: the value of the parameter.
+        :type mu: tuple of real numbers
+        :param N: dimension of the reduced problem. self.N will be used if the default value is provided.
+        :param outputs: quantities to be computed, among "solution", "output", "error_estimate",
+            "relative_error_estimate", "error_estimate_output" and "relative_error_estimate_output".
+        :return: dict from each of the requested outputs to its value.
+        """
+        assert not hasattr(self, "set_time"), "evaluate() is only available for stationary problems"
+        assert len(mu) == len(self.mu_range), "mu and mu_range must have the same length"
+        for output in outputs:
+            if output not in _evaluate_methods:
+                raise ValueError("Invalid output " + str(output) + " in evaluate()")
+        mu = tuple(mu)
+
+        # Evaluation of parameter dependent quantities requires to change the parameter of the (shared) truth
+        # problem, and possibly of the EIM/DEIM/SCM approximations, and thus it is carried out under a lock
+        def evaluate_at_mu(function, *args):
+            with self._evaluate_lock:
+                previous_mu = self.mu
+                self.set_mu(mu)
+                try:
+                    return function(*args)
+                finally:
+                    self.set_mu(previous_mu)
+
+        thetas = dict()
+
+        def compute_theta(term):
+            if term not in thetas:
+                thetas[term] = evaluate_at_mu(self.compute_theta, term)
+            return thetas[term]
+
+        # Everything else (assembly and solution of the reduced system, error estimation) is carried out
+        # on a shallow copy of this reduced problem, which owns its solution and output and does not cache
+        truth_problem = shallow_copy(self.truth_problem)
+        truth_problem.mu = mu
+        truth_problem.compute_theta = compute_theta
+        if hasattr(truth_problem, "get_stability_factor_lower_bound"):
+            stability_factor_lower_bound = list()
+
+            def get_stability_factor_lower_bound():
+                if len(stability_factor_lower_bound) == 0:
+                    stability_factor_lower_bound.append(
+                        evaluate_at_mu(self.truth_problem.get_stability_factor_lower_bound))
+                return stability_factor_lower_bound[0]
+
+            truth_problem.get_stability_factor_lower_bound = get_stability_factor_lower_bound
+        problem = shallow_copy(self)
+        problem.mu = mu
+        problem.truth_problem = truth_problem
+        problem.compute_theta = compute_theta
+        problem._solution_cache = _DisabledCache()
+        problem._output_cache = _DisabledCache()
+        solution = problem.solve(N, **kwargs)
+        evaluated = dict()
+        for output in outputs:
+            if output == "solution":
+                evaluated[output] = solution
+            else:
+                evaluated[output] = getattr(problem, _evaluate_methods[output])()
+        return evaluated
+
     def _online_size_from_kwargs(self, N, **kwargs):
         return OnlineSizeDict.generate_from_N_and_kwargs(self.components, self.N, N, **kwargs)
 
@@ -675,6 +756,16 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         """
         return self.truth_problem.compute_theta(term)
 
+    def compute_theta_batched(self, term, mus):
+        """
+        Return theta multiplicative terms of the affine expansion of the problem for each parameter in mus.
+
+        :param term: the forms of the class of the problem.
+        :param mus: list of parameters.
+        :return: list of computed thetas.
+        """
+        return self.truth_problem.compute_theta_batched(term, mus)
+
     # Assemble the reduced order affine expansion
     def assemble_operator(self, term, current_stage="online"):
         """
@@ -728,7 +819,10 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
                 assert self.Q[term] == self.truth_problem.Q[term]
                 for q in range(self.Q[term]):
                     assert self.terms_order[term] in (0, 1, 2)
-                    if self.terms_order[term] == 2:
+                    if self.terms_order[term] in (1, 2) and self.incremental_build_reduced_operators:
+                        self.operator[term][q] = self._assemble_operator_incrementally(
+                            self.operator[term], q, self.truth_problem.operator[term][q], self.terms_order[term])
+                    elif self.terms_order[term] == 2:
                         self.operator[term][q] = (
                             transpose(self.basis_functions) * self.truth_problem.operator[term][q]
                             * self.basis_functions)
@@ -834,6 +928,80 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         else:
             raise ValueError("Invalid stage in assemble_operator().")
 
+    def _assemble_operator_incrementally(self, operator, q, truth_operator, order):
+        """
+        It projects truth_operator onto the reduced basis, reusing the entries of the previous operator[q] which
+        involve basis functions that were already available when operator[q] was assembled.
+
+        :param operator: reduced operator expansion storage.
+        :param q: index in the affine expansion.
+        :param truth_operator: truth matrix (if order is 2) or vector (if order is 1).
+        :param order: order of the term.
+        """
+        if isinstance(operator, AbstractAffineExpansionStorage):
+            previous_output = operator[q]
+        else:  # e.g. exact evaluation of parametrized functions
+            previous_output = None
+        Z = self.basis_functions
+        N = Z._component_name_to_basis_component_length
+        if order == 2:
+            if (not isinstance(previous_output, OnlineMatrix.Type())
+                    or not self._is_leading_block(previous_output.M, N)
+                    or not self._is_leading_block(previous_output.N, N)):
+                return transpose(Z) * truth_operator * Z
+            Z_enumerated = self._enumerate_basis_functions(Z, previous_output.M)
+            output = OnlineMatrix(N, N)
+            output[:previous_output.M, :previous_output.N] = previous_output
+            for (i, Z_i, Z_i_is_new) in Z_enumerated:
+                if Z_i_is_new:
+                    # New row, computed with a single (transposed) matrix-vector product
+                    row_i = transpose(Z_i) * truth_operator * Z
+                    for (j, _, _) in Z_enumerated:
+                        output[i, j] = row_i[j]
+                    # New column, computed with a single matrix-vector product
+                    column_i = transpose(Z) * truth_operator * Z_i
+                    for (j, _, _) in Z_enumerated:
+                        output[j, i] = column_i[j]
+            return output
+        elif order == 1:
+            if (not isinstance(previous_output, OnlineVector.Type())
+                    or not self._is_leading_block(previous_output.N, N)):
+                return transpose(Z) * truth_operator
+            Z_enumerated = self._enumerate_basis_functions(Z, previous_output.N)
+            output = OnlineVector(N)
+            output[:previous_output.N] = previous_output
+            for (i, Z_i, Z_i_is_new) in Z_enumerated:
+                if Z_i_is_new:
+                    output[i] = transpose(Z_i) * truth_operator
+            return output
+        else:
+            raise ValueError("Invalid value for order of term")
+
+    def _is_leading_block(self, previous_N, N):
+        """
+        It checks if the (previous) basis size previous_N corresponds to the leading block of a basis of size N,
+        i.e. if the basis of size N has been obtained by enriching the previous one.
+        """
+        if not isinstance(previous_N, dict) or not isinstance(N, dict):
+            return False
+        elif list(previous_N.keys()) != list(N.keys()):
+            return False
+        else:
+            return all(previous_N[component_name] <= N[component_name] for component_name in N)
+
+    def _enumerate_basis_functions(self, basis_functions_matrix, previous_N):
+        """
+        It enumerates basis functions in the same order used by online matrices and vectors, marking the ones
+        which have been added since the basis had size previous_N.
+        """
+        output = list()
+        i = 0
+        for (component_name, component_N) in basis_functions_matrix._component_name_to_basis_component_length.items():
+            for n in range(component_N):
+                output.append((i, basis_functions_matrix[component_name][n], n >= previous_N[component_name]))
+                i += 1
+        return output
+
     def _lifting_truth_solve(self, term, i):
         # Since lifting solves for different values of i are associated to the same parameter
         # but with a patched call to compute_theta(), which returns the i-th component, we set
@@ -841,3 +1009,29 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         lifting = self.truth_problem.solve(cache_key="lifting_" + str(i))
         lifting /= self.compute_theta(term)[i]
         return lifting
+
+
+# Map from the outputs of evaluate() to the method computing each of them
+_evaluate_methods = {
+    "solution": "solve",
+    "output": "compute_output",
+    "error_estimate": "estimate_error",
+    "relative_error_estimate": "estimate_relative_error",
+    "error_estimate_output": "estimate_error_output",
+    "relative_error_estimate_output": "estimate_relative_error_output"
+}
+
+
+# Auxiliary class to disable caching of solutions and outputs in evaluate()
+class _DisabledCache(object):
+    def __getitem__(self, key):
+        raise KeyError
+
+    def __setitem__(self, key, value):
+        pass
+
+    def items(self):
+        return list()
+
+    def clear(self):
+        pass
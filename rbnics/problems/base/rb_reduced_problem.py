@@ -8,7 +8,9 @@ import os
 from abc import ABCMeta, abstractmethod
 from numbers import Number
 from rbnics.backends import BasisFunctionsMatrix, Function, FunctionsList, LinearSolver, transpose
-from rbnics.backends.online import OnlineAffineExpansionStorage
+from rbnics.backends.abstract import (AffineExpansionStorage as AbstractAffineExpansionStorage,
+                                      BasisFunctionsMatrix as AbstractBasisFunctionsMatrix)
+from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineMatrix, OnlineVector
 from rbnics.utils.decorators import overload, PreserveClassName, RequiredBaseDecorators
 
 
@@ -42,6 +44,7 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             self._riesz_solve_storage = Function(self.truth_problem.V)
             self._riesz_solve_inner_product = None  # setup by init()
             self._riesz_solve_homogeneous_dirichlet_bc = None  # setup by init()
+            self._riesz_solver = None  # setup by the first Riesz solve, and reused afterwards
             self._error_estimation_inner_product = None  # setup by init()
             # I/O
             self.folder["error_estimation"] = os.path.join(self.folder_prefix, "error_estimation")
@@ -70,6 +73,8 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             # Setup homogeneous Dirichlet BCs for Riesz solve, if any (no check if init was already called
             # because this variable can actually be None)
             self._riesz_solve_homogeneous_dirichlet_bc = self.truth_problem._combined_and_homogenized_dirichlet_bc
+            # Discard any factorization of the previous Riesz solve inner product
+            self._riesz_solver = None
             # Initialize Riesz representation
             for term in self.riesz_terms:
                 if term not in self.riesz:  # init was not called already
@@ -201,18 +206,25 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             else:
                 raise ValueError("Invalid value for order of term " + term)
 
+        def _riesz_solve(self, rhs):
+            # The inner product matrix is the same for every Riesz solve: factorize it only once,
+            # and then only update the right-hand side
+            if self._riesz_solver is None:
+                self._riesz_solver = LinearSolver(self._riesz_solve_inner_product, self._riesz_solve_storage, rhs,
+                                                  self._riesz_solve_homogeneous_dirichlet_bc)
+            else:
+                self._riesz_solver.set_rhs(rhs)
+            self._riesz_solver.set_parameters(self._linear_solver_parameters)
+            self._riesz_solver.solve()
+            return self._riesz_solve_storage
+
         class RieszSolver(object):
             def __init__(self, problem):
                 self.problem = problem
 
             @overload
             def solve(self, rhs: object):
-                problem = self.problem
-                solver = LinearSolver(problem._riesz_solve_inner_product, problem._riesz_solve_storage, rhs,
-                                      problem._riesz_solve_homogeneous_dirichlet_bc)
-                solver.set_parameters(problem._linear_solver_parameters)
-                solver.solve()
-                return problem._riesz_solve_storage
+                return self.problem._riesz_solve(rhs)
 
             @overload
             def solve(self, coef: Number, matrix: object, basis_function: object):
@@ -239,15 +251,17 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
                     for q0 in range(self.Q[term[0]]):
                         for q1 in range(self.Q[term[1]]):
                             self.error_estimation_operator[term][q0, q1] = (
-                                transpose(self.riesz[term[0]][q0]) * self._error_estimation_inner_product
-                                * self.riesz[term[1]][q1])
+                                self._assemble_error_estimation_operator_incrementally(
+                                    self.error_estimation_operator[term], (q0, q1),
+                                    self.riesz[term[0]][q0], self.riesz[term[1]][q1]))
                 elif self.terms_order[term[0]] == 2 and self.terms_order[term[1]] == 1:
                     for q0 in range(self.Q[term[0]]):
                         for q1 in range(self.Q[term[1]]):
                             assert len(self.riesz[term[1]][q1]) == 1
                             self.error_estimation_operator[term][q0, q1] = (
-                                transpose(self.riesz[term[0]][q0]) * self._error_estimation_inner_product
-                                * self.riesz[term[1]][q1][0])
+                                self._assemble_error_estimation_operator_incrementally(
+                                    self.error_estimation_operator[term], (q0, q1),
+                                    self.riesz[term[0]][q0], self.riesz[term[1]][q1][0]))
                 elif self.terms_order[term[0]] == 1 and self.terms_order[term[1]] == 1:
                     for q0 in range(self.Q[term[0]]):
                         assert len(self.riesz[term[0]][q0]) == 1
@@ -264,5 +278,62 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             else:
                 raise ValueError("Invalid stage in assemble_error_estimation_operators().")
 
+        def _assemble_error_estimation_operator_incrementally(self, error_estimation_operator, q, riesz_0, riesz_1):
+            """
+            It computes transpose(riesz_0) * X * riesz_1, X being the error estimation inner product, reusing the
+            entries of the previous error_estimation_operator[q] which involve Riesz representers that were already
+            available when error_estimation_operator[q] was assembled.
+
+            :param error_estimation_operator: error estimation operator expansion storage.
+            :param q: tuple of indices in the affine expansion.
+            :param riesz_0: Riesz representers of a term of order 2.
+            :param riesz_1: Riesz representers of a term of order 2, or Riesz representer of a term of order 1.
+            """
+            X = self._error_estimation_inner_product
+            if (not isinstance(error_estimation_operator, AbstractAffineExpansionStorage)
+                    or not isinstance(riesz_0, AbstractBasisFunctionsMatrix)):  # e.g. exact evaluation
+                return transpose(riesz_0) * X * riesz_1
+            previous_output = error_estimation_operator[q]
+            N_0 = riesz_0._component_name_to_basis_component_length
+            if isinstance(riesz_1, AbstractBasisFunctionsMatrix):
+                N_1 = riesz_1._component_name_to_basis_component_length
+                if (not isinstance(previous_output, OnlineMatrix.Type())
+                        or not self._is_leading_block(previous_output.M, N_0)
+                        or not self._is_leading_block(previous_output.N, N_1)):
+                    return transpose(riesz_0) * X * riesz_1
+                riesz_0_enumerated = self._enumerate_basis_functions(riesz_0, previous_output.M)
+                riesz_1_enumerated = self._enumerate_basis_functions(riesz_1, previous_output.N)
+                output = OnlineMatrix(N_0, N_1)
+                output[:previous_output.M, :previous_output.N] = previous_output
+                # Rows associated to new Riesz representers in riesz_0, for the previous columns. Since X is
+                # symmetric, transpose(riesz_1_previous) * X * riesz_0[i] requires a single matrix-vector product
+                previous_columns = [j for (j, _, riesz_1_j_is_new) in riesz_1_enumerated if not riesz_1_j_is_new]
+                if len(previous_columns) > 0:
+                    riesz_1_previous = riesz_1[:previous_output.N]
+                    for (i, riesz_0_i, riesz_0_i_is_new) in riesz_0_enumerated:
+                        if riesz_0_i_is_new:
+                            row_i = transpose(riesz_1_previous) * X * riesz_0_i
+                            for (k, j) in enumerate(previous_columns):
+                                output[i, j] = row_i[k]
+                # Columns associated to new Riesz representers in riesz_1, for all rows
+                for (j, riesz_1_j, riesz_1_j_is_new) in riesz_1_enumerated:
+                    if riesz_1_j_is_new:
+                        column_j = transpose(riesz_0) * X * riesz_1_j
+                        for (i, _, _) in riesz_0_enumerated:
+                            output[i, j] = column_j[i]
+                return output
+            else:
+                if (not isinstance(previous_output, OnlineVector.Type())
+                        or not self._is_leading_block(previous_output.N, N_0)):
+                    return transpose(riesz_0) * X * riesz_1
+                riesz_0_enumerated = self._enumerate_basis_functions(riesz_0, previous_output.N)
+                output = OnlineVector(N_0)
+                output[:previous_output.N] = previous_output
+                # Entries associated to new Riesz representers in riesz_0
+                for (i, riesz_0_i, riesz_0_i_is_new) in riesz_0_enumerated:
+                    if riesz_0_i_is_new:
+                        output[i] = transpose(riesz_0_i) * X * riesz_1
+                return output
+
     # return value (a class) for the decorator
     return RBReducedProblem_Class
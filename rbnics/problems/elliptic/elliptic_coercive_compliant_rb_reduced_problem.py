@@ -26,6 +26,16 @@ class EllipticCoerciveCompliantRBReducedProblem(EllipticCoerciveCompliantRBReduc
         assert beta >= 0.
         return sqrt(abs(eps2) / beta)
 
+    # Return an error bound for each parameter in mus, solving the corresponding reduced problems all at once
+    def estimate_error_batched(self, mus):
+        (eps2, beta) = self.get_residual_norm_squared_and_stability_factor_lower_bound_batched(mus)
+        error_estimators = list()
+        for (eps2_mu, beta_mu) in zip(eps2, beta):
+            assert eps2_mu >= 0. or isclose(eps2_mu, 0.)
+            assert beta_mu >= 0.
+            error_estimators.append(sqrt(abs(eps2_mu) / beta_mu))
+        return error_estimators
+
     # Return an error bound for the current compliant output
     def estimate_error_output(self):
         return self.estimate_error()**2
@@ -7,6 +7,8 @@
 from math import sqrt
 from numpy import isclose
 from rbnics.backends import product, sum, transpose
+from rbnics.backends.online.wrapping import (batched_solve, batched_sum_product, batched_vector_mul_matrix_mul_vector,
+                                             batched_vector_mul_vector)
 from rbnics.problems.base import LinearRBReducedProblem, ParametrizedReducedDifferentialProblem
 from rbnics.problems.elliptic.elliptic_problem import EllipticProblem
 from rbnics.problems.elliptic.elliptic_reduced_problem import EllipticReducedProblem
@@ -39,6 +41,17 @@ class EllipticRBReducedProblem(EllipticRBReducedProblem_Base):
         assert beta >= 0.
         return sqrt(abs(eps2)) / beta
 
+    # Return an error bound for each parameter in mus, solving the corresponding reduced problems all at once.
+    # Note that, in contrast to estimate_error, the reduced solutions are neither stored nor cached
+    def estimate_error_batched(self, mus):
+        (eps2, beta) = self.get_residual_norm_squared_and_stability_factor_lower_bound_batched(mus)
+        error_estimators = list()
+        for (eps2_mu, beta_mu) in zip(eps2, beta):
+            assert eps2_mu >= 0. or isclose(eps2_mu, 0.)
+            assert beta_mu >= 0.
+            error_estimators.append(sqrt(abs(eps2_mu)) / beta_mu)
+        return error_estimators
+
     # Return a relative error bound for the current solution
     def estimate_relative_error(self):
         return NotImplemented
@@ -62,3 +75,35 @@ class EllipticRBReducedProblem(EllipticRBReducedProblem_Base):
                 + (transpose(self._solution)
                    * sum(product(theta_a, self.error_estimation_operator["a", "a"][:N, :N], theta_a))
                    * self._solution))
+
+    # Return the numerator of the error bound and the stability factor lower bound for each parameter in mus.
+    # Parametrized coefficients are evaluated by compute_theta_batched, while the reduced solve and the evaluation
+    # of the residual norm are carried out at once on the stacked reduced operators. Only available for
+    # problems with an affine decomposition of the reduced operators.
+    def get_residual_norm_squared_and_stability_factor_lower_bound_batched(self, mus):
+        assert isinstance(self.N, int), "Batched evaluation is not available for problems with several components"
+        N = self.N + self.N_bc
+        has_non_homogeneous_dirichlet_bc = self.dirichlet_bc and not self.dirichlet_bc_are_homogeneous
+        # Evaluate parametrized coefficients
+        theta_a = self.compute_theta_batched("a", mus)
+        theta_f = self.compute_theta_batched("f", mus)
+        theta_bc = None
+        if has_non_homogeneous_dirichlet_bc:
+            theta_bc = self.compute_theta_batched("dirichlet_bc", mus)
+        beta = list()
+        for mu in mus:
+            self.set_mu(mu)
+            beta.append(self.truth_problem.get_stability_factor_lower_bound())
+        # Compute the residual norm
+        eps2 = batched_sum_product(theta_f, self.error_estimation_operator["f", "f"], theta_f)
+        if N > 0:
+            solutions = batched_solve(
+                batched_sum_product(theta_a, self.operator["a"][:N, :N]),
+                batched_sum_product(theta_f, self.operator["f"][:N]),
+                theta_bc)
+            eps2 += 2.0 * batched_vector_mul_vector(
+                solutions, batched_sum_product(theta_a, self.error_estimation_operator["a", "f"][:N], theta_f))
+            eps2 += batched_vector_mul_matrix_mul_vector(
+                solutions, batched_sum_product(theta_a, self.error_estimation_operator["a", "a"][:N, :N], theta_a),
+                solutions)
+        return (eps2, beta)
@@ -60,7 +60,8 @@ class StokesProblem(StokesProblem_Base):
             key_generator=_supremizer_cache_key_generator,
             import_=_supremizer_cache_import,
             export=_supremizer_cache_export,
-            filename_generator=_supremizer_cache_filename_generator
+            filename_generator=_supremizer_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
     class ProblemSolver(StokesProblem_Base.ProblemSolver):
@@ -7,7 +7,8 @@
 import inspect
 from rbnics.backends import assign
 from rbnics.reduction_methods.base.reduction_method import ReductionMethod
-from rbnics.utils.io import Folders
+from rbnics.sampling.executors import Executor, ProcessPoolExecutor, SerialExecutor
+from rbnics.utils.io import Folders, Profiler
 from rbnics.utils.decorators import StoreMapFromProblemToReductionMethod, UpdateMapFromProblemToTrainingStatus
 from rbnics.utils.factories import ReducedProblemFactory
 from rbnics.utils.test import PatchInstanceMethod
@@ -30,6 +31,40 @@ class DifferentialProblemReductionMethod(ReductionMethod):
         # $$ OFFLINE DATA STRUCTURES $$ #
         # High fidelity problem
         self.truth_problem = truth_problem
+        # Profiler of the phases of the offline stage (None if profiling is disabled)
+        self.offline_profiler = None
+
+        # $$ ERROR ANALYSIS AND SPEEDUP ANALYSIS DATA STRUCTURES $$ #
+        # Executor used to distribute the parameters in the testing set
+        self.analysis_executor = SerialExecutor()
+
+    # ERROR ANALYSIS: set the executor used to distribute the parameters in the testing set, e.g. among
+    # MPI groups or local processes. Since every call processes a whole parameter, truth solves are collective
+    # on the communicator returned by the executor get_function_mpi_comm method
+    def set_analysis_executor(self, executor, **kwargs):
+        assert isinstance(executor, Executor)
+        self.analysis_executor = executor
+
+    # SPEEDUP ANALYSIS: get the executor used to distribute the parameters in the testing set. Worker processes
+    # of a ProcessPoolExecutor share the cores of the current process, so that their concurrent solves would affect
+    # each other's timings: in such case speedups are computed one parameter at a time. Groups of processes of an
+    # MPIGroupsExecutor run on separate resources, and can thus time their solves concurrently
+    def _speedup_analysis_executor(self):
+        if isinstance(self.analysis_executor, ProcessPoolExecutor):
+            return SerialExecutor()
+        else:
+            return self.analysis_executor
+
+    # OFFLINE: enable a report of wall time, number of calls and peak memory for each phase of the offline stage,
+    # which will be saved in the post processing folder. Phases in cprofile_phases (e.g. "truth solve") are also
+    # profiled by cProfile
+    def set_offline_profiling(self, profile, cprofile_phases=None, **kwargs):
+        assert isinstance(profile, bool)
+        if profile:
+            self.offline_profiler = Profiler(cprofile_phases=cprofile_phases)
+        else:
+            assert cprofile_phases is None
+            self.offline_profiler = None
 
     def initialize_training_set(self, ntrain, enable_import=True, sampling=None, **kwargs):
         return ReductionMethod.initialize_training_set(
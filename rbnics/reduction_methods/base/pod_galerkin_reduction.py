@@ -7,7 +7,12 @@
 import os
 from numbers import Number
 from rbnics.backends import ProperOrthogonalDecomposition
-from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators, snapshot_links_to_cache
+from rbnics.sampling.executors import Executor
+from rbnics.utils.cache.cache import parse_cache_limit
+from rbnics.utils.config import config
+from rbnics.utils.decorators import (PreserveClassName, profile_offline_phases, RequiredBaseDecorators,
+                                     snapshot_links_to_cache)
+from rbnics.utils.factories import ReducedProblemFactory
 from rbnics.utils.io import ErrorAnalysisTable, OnlineSizeDict, SpeedupAnalysisTable, TextBox, TextLine, Timer
 
 
@@ -44,6 +49,13 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             else:
                 self.tol = 0.
 
+            # Executor used to carry out truth solves over the training set in advance, storing them
+            # in the disk cache. None corresponds to truth solves being carried out sequentially on the fly.
+            self.snapshots_executor = None
+
+            # Parameters of the POD, e.g. the method used to compute the POD modes
+            self.POD_parameters = dict()
+
         def set_tolerance(self, tol, **kwargs):
             """
             It sets tolerance to be used as stopping criterion.
@@ -84,6 +96,15 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
 
             self.tol = tol
 
+        # OFFLINE: set the executor used to compute truth snapshots over the training set
+        def set_snapshots_executor(self, executor, **kwargs):
+            assert executor is None or isinstance(executor, Executor)
+            self.snapshots_executor = executor
+
+        # OFFLINE: set the parameters of the POD
+        def set_POD_parameters(self, parameters, **kwargs):
+            self.POD_parameters.update(parameters)
+
         def _init_offline(self):
             # Call parent to initialize inner product and reduced problem
             output = DifferentialProblemReductionMethod_DerivedClass._init_offline(self)
@@ -96,11 +117,13 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
                     # the affine expansion storage contains only the inner product matrix
                     inner_product = self.truth_problem.inner_product[component][0]
                     self.POD[component] = ProperOrthogonalDecomposition(self.truth_problem.V, inner_product)
+                    self.POD[component].set_parameters(self.POD_parameters)
             else:
                 assert len(self.truth_problem.inner_product) == 1
                 # the affine expansion storage contains only the inner product matrix
                 inner_product = self.truth_problem.inner_product[0]
                 self.POD = ProperOrthogonalDecomposition(self.truth_problem.V, inner_product)
+                self.POD.set_parameters(self.POD_parameters)
 
             # Return
             return output
@@ -118,36 +141,83 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             return self.reduced_problem
 
         @snapshot_links_to_cache
+        @profile_offline_phases
         def _offline(self):
             print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase begins", fill="="))
             print("")
 
-            for (mu_index, mu) in enumerate(self.training_set):
-                print(TextLine(str(mu_index), fill="#"))
+            def build_reduced_problem():
+                for (mu_index, mu) in enumerate(self.training_set):
+                    print(TextLine(str(mu_index), fill="#"))
+
+                    self.truth_problem.set_mu(mu)
 
-                self.truth_problem.set_mu(mu)
+                    print("truth solve for mu =", self.truth_problem.mu)
+                    snapshot = self.truth_problem.solve()
+                    self.truth_problem.export_solution(self.folder["snapshots"], "truth_" + str(mu_index), snapshot)
+                    snapshot = self.postprocess_snapshot(snapshot, mu_index)
 
-                print("truth solve for mu =", self.truth_problem.mu)
-                snapshot = self.truth_problem.solve()
-                self.truth_problem.export_solution(self.folder["snapshots"], "truth_" + str(mu_index), snapshot)
-                snapshot = self.postprocess_snapshot(snapshot, mu_index)
+                    print("update snapshots matrix")
+                    self.update_snapshots_matrix(snapshot)
 
-                print("update snapshots matrix")
-                self.update_snapshots_matrix(snapshot)
+                    print("")
+
+                print(TextLine("perform POD", fill="#"))
+                self.compute_basis_functions()
 
                 print("")
+                print("build reduced operators")
+                self.reduced_problem.build_reduced_operators()
 
-            print(TextLine("perform POD", fill="#"))
-            self.compute_basis_functions()
+                print("")
 
-            print("")
-            print("build reduced operators")
-            self.reduced_problem.build_reduced_operators()
+            if self.snapshots_executor is not None:
+                print(TextLine("truth solves over the training set", fill="#"))
+                self.compute_snapshots()
+                print("")
 
-            print("")
+                # The rest of the offline stage is carried out only once, rather than e.g. by every group of
+                # an MPIGroupsExecutor. Processes which did not take part in it discard their reduced problem,
+                # so that the basis functions and reduced operators are read back from file when finalizing
+                if not self.snapshots_executor.execute_once(build_reduced_problem):
+                    self.reduced_problem = ReducedProblemFactory(self.truth_problem, self, **self._init_kwargs)
+            else:
+                build_reduced_problem()
             print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase ends", fill="="))
             print("")
 
+        def _offline_phases(self):
+            """
+            It returns the phases of the offline stage to be profiled, as (instance, method name, phase name).
+            """
+            return [
+                (self, "compute_snapshots", "truth solves over the training set"),
+                (self.truth_problem, "solve", "truth solve"),
+                (self.truth_problem, "export_solution", "snapshot export"),
+                (self, "update_snapshots_matrix", "snapshots matrix"),
+                (self, "compute_basis_functions", "POD"),
+                (self.reduced_problem, "build_reduced_operators", "reduced operators")
+            ]
+
+        def compute_snapshots(self):
+            """
+            It carries out the truth solves for all parameters in the training set through the snapshots executor.
+            Solutions are not returned, but rather stored in the disk cache of the truth problem, from which they
+            will be read when assembling the snapshots matrix.
+            """
+            assert "disk" in config.get("problems", "cache"), (
+                "A snapshots executor requires the disk cache of truth problems to be enabled")
+            # Each worker process or group of processes has its own index of the disk cache, so that a limit would
+            # not be enforced globally, and snapshots evicted by a worker would have to be computed again
+            assert parse_cache_limit(config.get("problems", "disk cache limit")) is None, (
+                "A snapshots executor requires the disk cache of truth problems to be unlimited")
+
+            def truth_solve(mu_index):
+                self.truth_problem.set_mu(self.training_set[mu_index])
+                self.truth_problem.solve()
+
+            self.snapshots_executor.execute(truth_solve, range(len(self.training_set)))
+
         def update_snapshots_matrix(self, snapshot):
             """
             It updates the snapshots matrix.
@@ -243,11 +313,12 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             error_analysis_table.add_column("error_output", group_name="output", operations=("mean", "max"))
             error_analysis_table.add_column("relative_error_output", group_name="output", operations=("mean", "max"))
 
-            for (mu_index, mu) in enumerate(self.testing_set):
+            def compute_errors(mu_index):
                 print(TextLine(str(mu_index), fill="#"))
 
-                self.reduced_problem.set_mu(mu)
+                self.reduced_problem.set_mu(self.testing_set[mu_index])
 
+                errors = list()
                 for (n_int, n_arg) in N_generator_items():
                     self.reduced_problem.solve(n_arg, **kwargs)
                     error = self.reduced_problem.compute_error(**kwargs)
@@ -257,6 +328,14 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
                     error_output = self.reduced_problem.compute_error_output(**kwargs)
                     relative_error_output = self.reduced_problem.compute_relative_error_output(**kwargs)
 
+                    errors.append((n_int, error, relative_error, error_output, relative_error_output))
+                return errors
+
+            # Parameters in the testing set are distributed by the analysis executor, while the table is filled in
+            # by all processes with the gathered errors
+            all_errors = self.analysis_executor.map(compute_errors, range(len(self.testing_set)))
+            for (mu_index, errors) in enumerate(all_errors):
+                for (n_int, error, relative_error, error_output, relative_error_output) in errors:
                     if len(components) > 1:
                         for component in components:
                             error_analysis_table["error_" + component, n_int, mu_index] = error[component]
@@ -333,13 +412,16 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             speedup_analysis_table.add_column(
                 "speedup_output", group_name="speedup_output", operations=("min", "mean", "max"))
 
-            truth_timer = Timer("parallel")
-            reduced_timer = Timer("serial")
+            speedup_analysis_executor = self._speedup_analysis_executor()
+            truth_timer = Timer("parallel", speedup_analysis_executor.get_function_mpi_comm())
+            reduced_timer = Timer("serial", speedup_analysis_executor.get_function_mpi_comm())
 
-            for (mu_index, mu) in enumerate(self.testing_set):
+            def compute_speedups(mu_index):
                 print(TextLine(str(mu_index), fill="#"))
 
-                self.reduced_problem.set_mu(mu)
+                self.reduced_problem.set_mu(self.testing_set[mu_index])
+
+                speedups = list()
 
                 truth_timer.start()
                 self.truth_problem.solve(**kwargs)
@@ -350,6 +432,7 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
                 elapsed_truth_output = truth_timer.stop()
 
                 for (n_int, n_arg) in N_generator_items():
+                    speedups_n = dict()
                     reduced_timer.start()
                     solution = self.reduced_problem.solve(n_arg, **kwargs)
                     elapsed_reduced_solve = reduced_timer.stop()
@@ -359,17 +442,23 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
                     elapsed_reduced_output = reduced_timer.stop()
 
                     if solution is not NotImplemented:
-                        speedup_analysis_table[
-                            "speedup_solve", n_int, mu_index] = elapsed_truth_solve / elapsed_reduced_solve
+                        speedups_n["speedup_solve"] = elapsed_truth_solve / elapsed_reduced_solve
                     else:
-                        speedup_analysis_table["speedup_solve", n_int, mu_index] = NotImplemented
+                        speedups_n["speedup_solve"] = NotImplemented
                     if output is not NotImplemented:
-                        speedup_analysis_table[
-                            "speedup_output", n_int, mu_index] = (
-                                elapsed_truth_solve + elapsed_truth_output) / (
-                                    elapsed_reduced_solve + elapsed_reduced_output)
+                        speedups_n["speedup_output"] = (
+                            elapsed_truth_solve + elapsed_truth_output) / (
+                                elapsed_reduced_solve + elapsed_reduced_output)
                     else:
-                        speedup_analysis_table["speedup_output", n_int, mu_index] = NotImplemented
+                        speedups_n["speedup_output"] = NotImplemented
+                    speedups.append((n_int, speedups_n))
+                return speedups
+
+            all_speedups = speedup_analysis_executor.map(compute_speedups, range(len(self.testing_set)))
+            for (mu_index, speedups) in enumerate(all_speedups):
+                for (n_int, speedups_n) in speedups:
+                    for (column, speedup) in speedups_n.items():
+                        speedup_analysis_table[column, n_int, mu_index] = speedup
 
             # Print
             print("")
@@ -8,7 +8,8 @@ import os
 from math import sqrt
 from logging import DEBUG, getLogger
 from rbnics.backends import GramSchmidt
-from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators, snapshot_links_to_cache
+from rbnics.utils.decorators import (PreserveClassName, profile_offline_phases, RequiredBaseDecorators,
+                                     snapshot_links_to_cache)
 from rbnics.utils.io import (ErrorAnalysisTable, GreedySelectedParametersList, GreedyErrorEstimatorsList,
                              OnlineSizeDict, SpeedupAnalysisTable, TextBox, TextLine, Timer)
 
@@ -43,6 +44,21 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             self.greedy_selected_parameters = GreedySelectedParametersList()
             self.greedy_error_estimators = GreedyErrorEstimatorsList()
             self.label = "RB"
+            # Number of training parameters to be processed at once by the greedy, if the reduced problem
+            # provides a batched evaluation of the error estimator. None corresponds to one parameter at a time.
+            self.greedy_batch_size = None
+            # Since the greedy algorithm only appends basis functions, reduced operators may be built incrementally
+            self.incremental_build_reduced_operators = False
+
+        # OFFLINE: set the number of training parameters processed at once by the greedy algorithm
+        def set_greedy_batch_size(self, batch_size, **kwargs):
+            assert batch_size is None or batch_size > 0
+            self.greedy_batch_size = batch_size
+
+        # OFFLINE: set whether reduced operators are built incrementally, i.e. only projecting new basis functions
+        def set_incremental_build_reduced_operators(self, incremental, **kwargs):
+            assert isinstance(incremental, bool)
+            self.incremental_build_reduced_operators = incremental
 
         def _init_offline(self):
             # Call parent to initialize inner product and reduced problem
@@ -60,6 +76,9 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
                 inner_product = self.truth_problem.inner_product[0]
                 self.GS = GramSchmidt(self.truth_problem.V, inner_product)
 
+            # Build reduced operators incrementally, if requested
+            self.reduced_problem.incremental_build_reduced_operators = self.incremental_build_reduced_operators
+
             # Return
             return output
 
@@ -76,6 +95,7 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             return self.reduced_problem
 
         @snapshot_links_to_cache
+        @profile_offline_phases
         def _offline(self):
             print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase begins", fill="="))
             print("")
@@ -120,6 +140,22 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase ends", fill="="))
             print("")
 
+        def _offline_phases(self):
+            """
+            It returns the phases of the offline stage to be profiled, as (instance, method name, phase name).
+            """
+            return [
+                (self.truth_problem, "solve", "truth solve"),
+                (self.truth_problem, "export_solution", "snapshot export"),
+                (self, "update_basis_matrix", "Gram-Schmidt"),
+                (self.reduced_problem, "build_reduced_operators", "reduced operators"),
+                (self.reduced_problem, "build_error_estimation_operators", "error estimation operators"),
+                (self.reduced_problem, "compute_riesz_representation", "Riesz solves"),
+                (self.reduced_problem, "assemble_error_estimation_operators", "error estimation assembly"),
+                (self, "greedy", "greedy search"),
+                (self.reduced_problem, "solve", "reduced solve")
+            ]
+
         def update_basis_matrix(self, snapshot):
             """
             It updates basis matrix.
@@ -177,12 +213,22 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
                 logger.log(DEBUG, "Error estimator for mu = " + str(mu) + " is " + str(error_estimator))
                 return error_estimator
 
+            # Carry out the actual greedy search on batches of parameters, if requested
+            def solve_and_estimate_error_batched(mus):
+                error_estimators = self.reduced_problem.estimate_error_batched(mus)
+                for (mu, error_estimator) in zip(mus, error_estimators):
+                    logger.log(DEBUG, "Error estimator for mu = " + str(mu) + " is " + str(error_estimator))
+                return error_estimators
+
             if self.reduced_problem.N == 0:
                 print("find initial mu")
             else:
                 print("find next mu")
 
-            return self.training_set.max(solve_and_estimate_error)
+            if self.greedy_batch_size is not None and hasattr(self.reduced_problem, "estimate_error_batched"):
+                return self.training_set.max(solve_and_estimate_error_batched, batch_size=self.greedy_batch_size)
+            else:
+                return self.training_set.max(solve_and_estimate_error)
 
         def error_analysis(self, N_generator=None, filename=None, **kwargs):
             """
@@ -309,11 +355,12 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             error_analysis_table.add_column(
                 "relative_effectivity_output", group_name="output_relative_error", operations=("min", "mean", "max"))
 
-            for (mu_index, mu) in enumerate(self.testing_set):
+            def compute_errors(mu_index):
                 print(TextLine(str(mu_index), fill="#"))
 
-                self.reduced_problem.set_mu(mu)
+                self.reduced_problem.set_mu(self.testing_set[mu_index])
 
+                errors = list()
                 for (n_int, n_arg) in N_generator_items():
                     self.reduced_problem.solve(n_arg, **kwargs)
                     error = self.reduced_problem.compute_error(**kwargs)
@@ -333,6 +380,18 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
                     relative_error_output = self.reduced_problem.compute_relative_error_output(**kwargs)
                     relative_error_output_estimator = self.reduced_problem.estimate_relative_error_output()
 
+                    errors.append((n_int, error, error_estimator, relative_error, relative_error_estimator,
+                                   error_output, error_output_estimator,
+                                   relative_error_output, relative_error_output_estimator))
+                return errors
+
+            # Parameters in the testing set are distributed by the analysis executor, while the table is filled in
+            # by all processes with the gathered errors
+            all_errors = self.analysis_executor.map(compute_errors, range(len(self.testing_set)))
+            for (mu_index, errors) in enumerate(all_errors):
+                for (n_int, error, error_estimator, relative_error, relative_error_estimator,
+                     error_output, error_output_estimator,
+                     relative_error_output, relative_error_output_estimator) in errors:
                     if len(components) > 1:
                         for component in components:
                             error_analysis_table[
@@ -472,13 +531,16 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
                 group_name="speedup_output_and_estimate_relative_error_output",
                 operations=("min", "mean", "max"))
 
-            truth_timer = Timer("parallel")
-            reduced_timer = Timer("serial")
+            speedup_analysis_executor = self._speedup_analysis_executor()
+            truth_timer = Timer("parallel", speedup_analysis_executor.get_function_mpi_comm())
+            reduced_timer = Timer("serial", speedup_analysis_executor.get_function_mpi_comm())
 
-            for (mu_index, mu) in enumerate(self.testing_set):
+            def compute_speedups(mu_index):
                 print(TextLine(str(mu_index), fill="#"))
 
-                self.reduced_problem.set_mu(mu)
+                self.reduced_problem.set_mu(self.testing_set[mu_index])
+
+                speedups = list()
 
                 truth_timer.start()
                 self.truth_problem.solve(**kwargs)
@@ -489,6 +551,7 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
                 elapsed_truth_output = truth_timer.stop()
 
                 for (n_int, n_arg) in N_generator_items():
+                    speedups_n = dict()
                     reduced_timer.start()
                     solution = self.reduced_problem.solve(n_arg, **kwargs)
                     elapsed_reduced_solve = reduced_timer.stop()
@@ -530,54 +593,50 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
                     elapsed_relative_error_estimator_output = reduced_timer.stop()
 
                     if solution is not NotImplemented:
-                        speedup_analysis_table[
-                            "speedup_solve", n_int, mu_index] = elapsed_truth_solve / elapsed_reduced_solve
+                        speedups_n["speedup_solve"] = elapsed_truth_solve / elapsed_reduced_solve
                     else:
-                        speedup_analysis_table[
-                            "speedup_solve", n_int, mu_index] = NotImplemented
+                        speedups_n["speedup_solve"] = NotImplemented
                     if error_estimator is not NotImplemented:
-                        speedup_analysis_table[
-                            "speedup_solve_and_estimate_error", n_int, mu_index] = (
-                                elapsed_truth_solve + elapsed_error) / (
-                                    elapsed_reduced_solve + elapsed_error_estimator)
+                        speedups_n["speedup_solve_and_estimate_error"] = (
+                            elapsed_truth_solve + elapsed_error) / (
+                                elapsed_reduced_solve + elapsed_error_estimator)
                     else:
-                        speedup_analysis_table[
-                            "speedup_solve_and_estimate_error", n_int, mu_index] = NotImplemented
+                        speedups_n["speedup_solve_and_estimate_error"] = NotImplemented
                     if relative_error_estimator is not NotImplemented:
-                        speedup_analysis_table[
-                            "speedup_solve_and_estimate_relative_error", n_int, mu_index] = (
-                                elapsed_truth_solve + elapsed_relative_error) / (
-                                    elapsed_reduced_solve + elapsed_relative_error_estimator)
+                        speedups_n["speedup_solve_and_estimate_relative_error"] = (
+                            elapsed_truth_solve + elapsed_relative_error) / (
+                                elapsed_reduced_solve + elapsed_relative_error_estimator)
                     else:
-                        speedup_analysis_table[
-                            "speedup_solve_and_estimate_relative_error", n_int, mu_index] = NotImplemented
+                        speedups_n["speedup_solve_and_estimate_relative_error"] = NotImplemented
                     if output is not NotImplemented:
-                        speedup_analysis_table[
-                            "speedup_output", n_int, mu_index] = (
-                                elapsed_truth_solve + elapsed_truth_output) / (
-                                    elapsed_reduced_solve + elapsed_reduced_output)
+                        speedups_n["speedup_output"] = (
+                            elapsed_truth_solve + elapsed_truth_output) / (
+                                elapsed_reduced_solve + elapsed_reduced_output)
                     else:
-                        speedup_analysis_table[
-                            "speedup_output", n_int, mu_index] = NotImplemented
+                        speedups_n["speedup_output"] = NotImplemented
                     if error_estimator_output is not NotImplemented:
                         assert output is not NotImplemented
-                        speedup_analysis_table[
-                            "speedup_output_and_estimate_error_output", n_int, mu_index] = (
-                                elapsed_truth_solve + elapsed_truth_output + elapsed_error_output) / (
-                                    elapsed_reduced_solve + elapsed_reduced_output + elapsed_error_estimator_output)
+                        speedups_n["speedup_output_and_estimate_error_output"] = (
+                            elapsed_truth_solve + elapsed_truth_output + elapsed_error_output) / (
+                                elapsed_reduced_solve + elapsed_reduced_output + elapsed_error_estimator_output)
                     else:
-                        speedup_analysis_table[
-                            "speedup_output_and_estimate_error_output", n_int, mu_index] = NotImplemented
+                        speedups_n["speedup_output_and_estimate_error_output"] = NotImplemented
                     if relative_error_estimator_output is not NotImplemented:
                         assert output is not NotImplemented
-                        speedup_analysis_table[
-                            "speedup_output_and_estimate_relative_error_output", n_int, mu_index] = (
-                                elapsed_truth_solve + elapsed_truth_output + elapsed_relative_error_output) / (
-                                    elapsed_reduced_solve + elapsed_reduced_output
-                                    + elapsed_relative_error_estimator_output)
+                        speedups_n["speedup_output_and_estimate_relative_error_output"] = (
+                            elapsed_truth_solve + elapsed_truth_output + elapsed_relative_error_output) / (
+                                elapsed_reduced_solve + elapsed_reduced_output
+                                + elapsed_relative_error_estimator_output)
                     else:
-                        speedup_analysis_table[
-                            "speedup_output_and_estimate_relative_error_output", n_int, mu_index] = NotImplemented
+                        speedups_n["speedup_output_and_estimate_relative_error_output"] = NotImplemented
+                    speedups.append((n_int, speedups_n))
+                return speedups
+
+            all_speedups = speedup_analysis_executor.map(compute_speedups, range(len(self.testing_set)))
+            for (mu_index, speedups) in enumerate(all_speedups):
+                for (n_int, speedups_n) in speedups:
+                    for (column, speedup) in speedups_n.items():
+                        speedup_analysis_table[column, n_int, mu_index] = speedup
 
             # Print
             print("")
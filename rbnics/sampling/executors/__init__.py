@@ -0,0 +1,17 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from rbnics.sampling.executors.executor import Executor
+from rbnics.sampling.executors.mpi_groups_executor import MPIGroupsExecutor
+from rbnics.sampling.executors.process_pool_executor import ProcessPoolExecutor
+from rbnics.sampling.executors.serial_executor import SerialExecutor
+
+__all__ = [
+    "Executor",
+    "MPIGroupsExecutor",
+    "ProcessPoolExecutor",
+    "SerialExecutor"
+]
@@ -0,0 +1,31 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from abc import ABCMeta, abstractmethod
+from mpi4py.MPI import COMM_WORLD
+
+
+class Executor(object, metaclass=ABCMeta):
+    @abstractmethod
+    def execute(self, function, indices):
+        raise NotImplementedError("The method execute is executor-specific and needs to be overridden.")
+
+    @abstractmethod
+    def map(self, function, indices):
+        # Return the list of the values of function over indices, in the same order as indices, on all processes.
+        # Values must be picklable, since they may have to be sent from a different process
+        raise NotImplementedError("The method map is executor-specific and needs to be overridden.")
+
+    def execute_once(self, function):
+        # Call function (without arguments) once on behalf of all processes, e.g. to carry out the part of
+        # an algorithm which follows the execution over indices. Return whether function was called on the
+        # current process: processes for which it was not should read the results it stored, if needed
+        function()
+        return True
+
+    def get_function_mpi_comm(self):
+        # Return the communicator on which each call of function is collective
+        return COMM_WORLD
@@ -0,0 +1,54 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from mpi4py.MPI import COMM_WORLD
+from rbnics.sampling.executors.executor import Executor
+from rbnics.utils.mpi import parallel_io_default_mpi_comm
+
+
+class MPIGroupsExecutor(Executor):
+    def __init__(self, group_mpi_comm, mpi_comm=None):
+        # group_mpi_comm: communicator of the group the current process belongs to, e.g. obtained by splitting
+        # mpi_comm, and used to define the mesh of the problem. Each group processes a disjoint subset of indices.
+        if mpi_comm is None:
+            mpi_comm = COMM_WORLD
+        self.group_mpi_comm = group_mpi_comm
+        self.mpi_comm = mpi_comm
+
+    def execute(self, function, indices):
+        # Process indices in a round robin fashion, and wait for all groups to be done
+        for index in self._group_indices(indices):
+            function(index)
+        self.mpi_comm.Barrier()
+
+    def map(self, function, indices):
+        # Process indices in a round robin fashion, and then gather the values computed by each group
+        # from its first process, since all processes in a group compute the same values
+        values = {index: function(index) for index in self._group_indices(indices)}
+        all_values = dict()
+        for group_values in self.mpi_comm.allgather(values if self.group_mpi_comm.rank == 0 else dict()):
+            all_values.update(group_values)
+        return [all_values[index] for index in indices]
+
+    def execute_once(self, function):
+        # Only call function on the group which contains the first process of mpi_comm, with I/O being
+        # collective on that group alone, and make the other groups wait for it to be done
+        called = any(self.group_mpi_comm.allgather(self.mpi_comm.rank == 0))
+        if called:
+            with parallel_io_default_mpi_comm(self.group_mpi_comm):
+                function()
+        self.mpi_comm.Barrier()
+        return called
+
+    def get_function_mpi_comm(self):
+        return self.group_mpi_comm
+
+    def _group_indices(self, indices):
+        # Identify each group by the rank (in mpi_comm) of its first process
+        group_leader = self.group_mpi_comm.bcast(self.mpi_comm.rank, root=0)
+        groups_leaders = sorted(set(self.mpi_comm.allgather(group_leader)))
+        group_index = groups_leaders.index(group_leader)
+        return list(indices)[group_index::len(groups_leaders)]
@@ -0,0 +1,38 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import multiprocessing
+from mpi4py.MPI import COMM_WORLD
+from rbnics.sampling.executors.executor import Executor
+
+
+class ProcessPoolExecutor(Executor):
+    def __init__(self, processes=None):
+        # processes: number of worker processes. If None, use as many worker processes as available cores
+        self.processes = processes
+
+    def execute(self, function, indices):
+        self.map(function, indices)
+
+    def map(self, function, indices):
+        assert COMM_WORLD.size == 1, (
+            "ProcessPoolExecutor cannot be used when running in parallel with MPI. Use MPIGroupsExecutor instead.")
+        # Worker processes are forked from the current one, so that function (which typically is a closure
+        # over a problem, and thus cannot be pickled) is inherited by them rather than being sent
+        global _function
+        _function = function
+        try:
+            with multiprocessing.get_context("fork").Pool(self.processes) as pool:
+                return pool.map(_call_function, indices)
+        finally:
+            _function = None
+
+
+_function = None
+
+
+def _call_function(index):
+    return _function(index)
@@ -0,0 +1,16 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from rbnics.sampling.executors.executor import Executor
+
+
+class SerialExecutor(Executor):
+    def execute(self, function, indices):
+        for index in indices:
+            function(index)
+
+    def map(self, function, indices):
+        return [function(index) for index in indices]
@@ -4,11 +4,9 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-import operator  # to find closest parameters
-from math import sqrt
 from mpi4py.MPI import COMM_WORLD
 from numpy import zeros as array
-from numpy import argmax
+from numpy import argmax, asarray, atleast_1d, log
 from rbnics.sampling.distributions import CompositeDistribution, UniformDistribution
 from rbnics.utils.decorators import overload
 from rbnics.utils.io import ExportableList
@@ -20,6 +18,8 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
         ExportableList.__init__(self, "text")
         self.mpi_comm = COMM_WORLD
         self.distributed_max = True
+        self.distance_scaling = None
+        self._closest_index = None  # spatial index for closest, lazily built and invalidated on mutation
 
     @overload
     def __getitem__(self, key: int):
@@ -29,11 +29,33 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
     def __getitem__(self, key: slice):
         output = ParameterSpaceSubset()
         output.distributed_max = self.distributed_max
+        output.distance_scaling = self.distance_scaling
         output._list = self._list[key]
         return output
 
+    def __setitem__(self, key, item):
+        ExportableList.__setitem__(self, key, item)
+        self._closest_index = None
+
+    def append(self, element):
+        ExportableList.append(self, element)
+        self._closest_index = None
+
+    def extend(self, other_list):
+        ExportableList.extend(self, other_list)
+        self._closest_index = None
+
+    def clear(self):
+        ExportableList.clear(self)
+        self._closest_index = None
+
+    def load(self, directory, filename):
+        self._closest_index = None
+        return ExportableList.load(self, directory, filename)
+
     # Method for generation of parameter space subsets
     def generate(self, box, n, sampling=None):
+        self._closest_index = None
         if len(box) > 0:
             if sampling is None:
                 sampling = UniformDistribution()
@@ -49,7 +71,9 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
             for i in range(n):
                 self._list.append(tuple())
 
-    def max(self, generator, postprocessor=None):
+    def max(self, generator, postprocessor=None, batch_size=None):
+        # If batch_size is provided, generator is called on lists of (at most batch_size) parameters,
+        # and it is required to return the corresponding list of values
         if postprocessor is None:
             def postprocessor(value):
                 return value
@@ -60,8 +84,17 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
             local_list_indices = list(range(len(self._list)))
         values = array(len(local_list_indices))
         values_with_postprocessing = array(len(local_list_indices))
+        if batch_size is None:
+            for i in range(len(local_list_indices)):
+                values[i] = generator(self._list[local_list_indices[i]])
+        else:
+            assert batch_size > 0
+            for batch_begin in range(0, len(local_list_indices), batch_size):
+                batch_end = min(batch_begin + batch_size, len(local_list_indices))
+                batch_values = generator([self._list[local_list_indices[i]] for i in range(batch_begin, batch_end)])
+                assert len(batch_values) == batch_end - batch_begin
+                values[batch_begin:batch_end] = batch_values
         for i in range(len(local_list_indices)):
-            values[i] = generator(self._list[local_list_indices[i]])
             values_with_postprocessing[i] = postprocessor(values[i])
         if self.distributed_max:
             local_i_max = argmax(values_with_postprocessing)
@@ -83,9 +116,27 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
     def diff(self, other_set):
         output = ParameterSpaceSubset()
         output.distributed_max = self.distributed_max
+        output.distance_scaling = self.distance_scaling
         output._list = [mu for mu in self._list if mu not in other_set]
         return output
 
+    # Set the scaling of each parameter component in the computation of distances by closest:
+    # a tuple containing either "linear" or "log" for each component, or None to use "linear" for all of them.
+    # A "log" scaling is well suited for parameters which vary over several orders of magnitude.
+    def set_distance_scaling(self, distance_scaling):
+        assert distance_scaling is None or all(scaling in ("linear", "log") for scaling in distance_scaling)
+        self.distance_scaling = distance_scaling
+        self._closest_index = None
+
+    def _scale(self, parameters):
+        parameters = asarray(parameters, dtype=float).reshape(len(parameters), len(parameters[0]))
+        if self.distance_scaling is not None:
+            assert len(self.distance_scaling) == parameters.shape[1]
+            for (p, scaling) in enumerate(self.distance_scaling):
+                if scaling == "log":
+                    parameters[:, p] = log(parameters[:, p])
+        return parameters
+
     # M parameters in this set closest to mu
     def closest(self, M, mu):
         assert M <= len(self)
@@ -96,15 +147,16 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
 
         output = ParameterSpaceSubset()
         output.distributed_max = self.distributed_max
+        output.distance_scaling = self.distance_scaling
 
         # Trivial case 2:
         if M == 0:
             return output
 
-        parameters_and_distances = list()
-        for xi_i in self:
-            distance = sqrt(sum([(x - y)**2 for (x, y) in zip(mu, xi_i)]))
-            parameters_and_distances.append((xi_i, distance))
-        parameters_and_distances.sort(key=operator.itemgetter(1))
-        output._list = [xi_i for (xi_i, _) in parameters_and_distances[:M]]
+        # Build the spatial index only once, and reuse it until the next change to the list
+        if self._closest_index is None:
+            from scipy.spatial import cKDTree as KDTree
+            self._closest_index = KDTree(self._scale(self._list))
+        (_, indices) = self._closest_index.query(self._scale([mu])[0], k=M)
+        output._list = [self._list[i] for i in atleast_1d(indices)]
         return output
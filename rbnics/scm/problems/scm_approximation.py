@@ -6,6 +6,7 @@
 
 import os
 import hashlib
+from numpy import array, zeros
 from rbnics.backends import export, import_, LinearProgramSolver
 from rbnics.backends.common.linear_program_solver import Error as LinearProgramSolverError, Matrix, Vector
 from rbnics.problems.base import ParametrizedProblem
@@ -44,6 +45,10 @@ class SCMApproximation(ParametrizedProblem):
         # Storage for online computations
         self._stability_factor_lower_bound = 0.
         self._stability_factor_upper_bound = 0.
+        # Theta coefficients and exact stability factors at parameters in the training set, which are shared
+        # by the linear programs of all online queries
+        self._training_set_theta = dict()  # from parameter to theta array
+        self._training_set_stability_factor = dict()  # from parameter to exact stability factor
 
         # I/O
         self.folder["cache"] = os.path.join(self.folder_prefix, "reduced_cache")
@@ -73,7 +78,8 @@ class SCMApproximation(ParametrizedProblem):
             key_generator=_stability_factor_cache_key_generator,
             import_=_stability_factor_lower_bound_cache_import,
             export=_stability_factor_lower_bound_cache_export,
-            filename_generator=_stability_factor_cache_filename_generator
+            filename_generator=_stability_factor_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
         def _stability_factor_upper_bound_cache_import(filename):
@@ -88,7 +94,8 @@ class SCMApproximation(ParametrizedProblem):
             key_generator=_stability_factor_cache_key_generator,
             import_=_stability_factor_upper_bound_cache_import,
             export=_stability_factor_upper_bound_cache_export,
-            filename_generator=_stability_factor_cache_filename_generator
+            filename_generator=_stability_factor_cache_filename_generator,
+            folder=self.folder["cache"]
         )
 
         # Stability factor eigen problem
@@ -103,6 +110,9 @@ class SCMApproximation(ParametrizedProblem):
         self.truth_problem.init()
         # Init exact stability factor computations
         self.stability_factor_calculator.init()
+        # Clear data computed at parameters of a (possibly different) training set
+        self._training_set_theta.clear()
+        self._training_set_stability_factor.clear()
         # Read/Initialize reduced order data structures
         if current_stage == "online":
             self.bounding_box_min.load(self.folder["reduced_operators"], "bounding_box_min")
@@ -159,60 +169,41 @@ class SCMApproximation(ParametrizedProblem):
         constraints_vector = Vector(M_e + M_p + 1)
 
         # 2a. Add constraints: a constraint is added for the closest samples to mu among the selected parameters
-        mu_bak = self.mu
         closest_selected_parameters = self._closest_selected_parameters(M_e, N, self.mu)
-        for (j, omega) in enumerate(closest_selected_parameters):
-            # Overwrite parameter values
-            self.set_mu(omega)
-
-            # Compute theta
-            current_theta = self.truth_problem.compute_theta("stability_factor_left_hand_matrix")
-
-            # Assemble the LHS of the constraint
-            for q in range(Q):
-                constraints_matrix[j, q] = current_theta[q]
-
-            # Assemble the RHS of the constraint: note that computations for this call may be already cached
-            (constraints_vector[j], _) = self.evaluate_stability_factor()
-        self.set_mu(mu_bak)
+        # Assemble the LHS of the constraints
+        constraints_matrix[:M_e] = self._compute_training_set_theta(closest_selected_parameters)
+        # Assemble the RHS of the constraints
+        constraints_vector[:M_e] = self._compute_training_set_stability_factor(closest_selected_parameters)
 
         # 2b. Add constraints: also constrain the closest point in the complement of selected parameters,
         #                      with RHS depending on previously computed lower bounds
-        mu_bak = self.mu
         closest_selected_parameters_complement = self._closest_unselected_parameters(M_p, N, self.mu)
-        for (j, nu) in enumerate(closest_selected_parameters_complement):
-            # Overwrite parameter values
-            self.set_mu(nu)
-
-            # Compute theta
-            current_theta = self.truth_problem.compute_theta("stability_factor_left_hand_matrix")
-
-            # Assemble the LHS of the constraint
-            for q in range(Q):
-                constraints_matrix[M_e + j, q] = current_theta[q]
-
-            # Assemble the RHS of the constraint: note that computations for this call may be already cached
-            if N > 1:
+        # Assemble the LHS of the constraints
+        constraints_matrix[M_e:M_e + M_p] = self._compute_training_set_theta(closest_selected_parameters_complement)
+        # Assemble the RHS of the constraints: note that computations for this call may be already cached
+        if N > 1:
+            mu_bak = self.mu
+            for (j, nu) in enumerate(closest_selected_parameters_complement):
+                # Overwrite parameter values
+                self.set_mu(nu)
                 constraints_vector[M_e + j] = self.get_stability_factor_lower_bound(N - 1)
-            else:
-                constraints_vector[M_e + j] = 0.
-        self.set_mu(mu_bak)
+            self.set_mu(mu_bak)
+        else:
+            constraints_vector[M_e:M_e + M_p] = 0.
 
         # 2c. Add constraints: also constrain the stability factor for mu to be positive
         # Compute theta
-        current_theta = self.truth_problem.compute_theta("stability_factor_left_hand_matrix")
+        current_theta = array(self.truth_problem.compute_theta("stability_factor_left_hand_matrix"))
 
         # Assemble the LHS of the constraint
-        for q in range(Q):
-            constraints_matrix[M_e + M_p, q] = current_theta[q]
+        constraints_matrix[M_e + M_p] = current_theta
 
         # Assemble the RHS of the constraint
         constraints_vector[M_e + M_p] = 0.
 
         # 3. Add cost function coefficients
         cost = Vector(Q)
-        for q in range(Q):
-            cost[q] = current_theta[q]
+        cost[:] = current_theta
 
         # 4. Solve the linear programming problem
         linear_program = LinearProgramSolver(cost, constraints_matrix, constraints_vector, bounds)
@@ -226,6 +217,47 @@ class SCMApproximation(ParametrizedProblem):
 
         self._stability_factor_lower_bound = stability_factor_lower_bound
 
+    # Get a lower bound for the stability factor for each parameter in mus at once, returning them as an array.
+    # Linear programs are still solved one at a time, but their constraints share the theta coefficients and
+    # exact stability factors at parameters in the training set, which are computed once for all parameters.
+    def get_stability_factor_lower_bound_batched(self, mus, N=None):
+        mu_bak = self.mu
+        stability_factor_lower_bounds = zeros(len(mus))
+        for (j, mu) in enumerate(mus):
+            self.set_mu(mu)
+            stability_factor_lower_bounds[j] = self.get_stability_factor_lower_bound(N)
+        self.set_mu(mu_bak)
+        return stability_factor_lower_bounds
+
+    # Compute theta coefficients at the given parameters in the training set, returning them stacked as rows
+    # of an array, and storing them for later queries
+    def _compute_training_set_theta(self, parameters):
+        Q = self.truth_problem.Q["stability_factor_left_hand_matrix"]
+        self._compute_at_training_set_parameters(
+            parameters, self._training_set_theta,
+            lambda: array(self.truth_problem.compute_theta("stability_factor_left_hand_matrix")))
+        theta = zeros((len(parameters), Q))
+        for (j, parameter) in enumerate(parameters):
+            theta[j] = self._training_set_theta[parameter]
+        return theta
+
+    # Compute exact stability factors at the given parameters in the training set, returning them as an array,
+    # and storing them for later queries
+    def _compute_training_set_stability_factor(self, parameters):
+        self._compute_at_training_set_parameters(
+            parameters, self._training_set_stability_factor, lambda: self.evaluate_stability_factor()[0])
+        return array([self._training_set_stability_factor[parameter] for parameter in parameters])
+
+    def _compute_at_training_set_parameters(self, parameters, storage, compute):
+        missing_parameters = [parameter for parameter in parameters if parameter not in storage]
+        if len(missing_parameters) > 0:
+            mu_bak = self.mu
+            for parameter in missing_parameters:
+                # Overwrite parameter values
+                self.set_mu(parameter)
+                storage[parameter] = compute()
+            self.set_mu(mu_bak)
+
     # Get an upper bound for the stability factor
     def get_stability_factor_upper_bound(self, N=None):
         if N is None:
@@ -265,7 +297,9 @@ class SCMApproximation(ParametrizedProblem):
         return hashlib.sha1(str(self._cache_key(N)).encode("utf-8")).hexdigest()
 
     def _closest_selected_parameters(self, M, N, mu):
-        return self.greedy_selected_parameters[:N].closest(M, mu)
+        selected_parameters = self.greedy_selected_parameters[:N]
+        selected_parameters.set_distance_scaling(self.training_set.distance_scaling)
+        return selected_parameters.closest(M, mu)
 
     def _closest_unselected_parameters(self, M, N, mu):
         if N not in self.greedy_selected_parameters_complement:
@@ -36,6 +36,9 @@ class SCMApproximationReductionMethod(ReductionMethod):
         import_successful = ReductionMethod.initialize_training_set(
             self, self.SCM_approximation.mu_range, ntrain, enable_import, sampling, **kwargs)
         self.SCM_approximation.training_set = self.training_set
+        # Clear data computed at parameters of the previous training set
+        self.SCM_approximation._training_set_theta.clear()
+        self.SCM_approximation._training_set_stability_factor.clear()
         return import_successful
 
     def initialize_testing_set(self, ntest, enable_import=False, sampling=None, **kwargs):
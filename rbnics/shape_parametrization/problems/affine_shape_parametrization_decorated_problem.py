@@ -7,8 +7,6 @@
 from logging import DEBUG, getLogger
 from rbnics.shape_parametrization.problems.shape_parametrization_decorated_problem import (
     ShapeParametrizationDecoratedProblem)
-from rbnics.shape_parametrization.utils.symbolic import (
-    affine_shape_parametrization_from_vertices_mapping, VerticesMappingIO)
 from rbnics.utils.decorators import ProblemDecoratorFor
 
 logger = getLogger("rbnics/shape_parametrization/problems/affine_shape_parametrization_decorated_problem.py")
@@ -16,6 +14,10 @@ logger = getLogger("rbnics/shape_parametrization/problems/affine_shape_parametri
 
 def AffineShapeParametrizationDecoratedProblem(*shape_parametrization_vertices_mappings, **decorator_kwargs):
 
+    # Import symbolic utils (and thus sympy) only when a problem is actually decorated
+    from rbnics.shape_parametrization.utils.symbolic import (
+        affine_shape_parametrization_from_vertices_mapping, VerticesMappingIO)
+
     if "shape_parametrization_vertices_mappings" in decorator_kwargs:
         assert len(shape_parametrization_vertices_mappings) == 0
         shape_parametrization_vertices_mappings = decorator_kwargs["shape_parametrization_vertices_mappings"]
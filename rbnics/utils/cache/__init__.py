@@ -4,11 +4,12 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from rbnics.utils.cache.cache import Cache, cache
+from rbnics.utils.cache.cache import Cache, cache, CacheStatistics
 from rbnics.utils.cache.time_series_cache import TimeSeriesCache
 
 __all__ = [
     "Cache",
     "cache",
+    "CacheStatistics",
     "TimeSeriesCache"
 ]
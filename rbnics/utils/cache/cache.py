@@ -4,46 +4,61 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+import os
+import re
+import sys
+from collections import OrderedDict
 from collections.abc import MutableMapping
 from functools import wraps
 from logging import DEBUG, getLogger
-from pylru import lrucache
+from threading import RLock
 
 logger = getLogger("rbnics/utils/cache/cache.py")
 
 
 class Cache(object):
-    def __init__(self, config_section=None, key_generator=None, import_=None, export=None, filename_generator=None):
+    """
+    Cache with a RAM tier and an (optional) disk tier, as specified by the "cache" option of the configuration
+    section config_section. Each tier can be limited by the "RAM cache limit" and "disk cache limit" options,
+    which can either be "unlimited", a number of entries (e.g. "10") or a size (e.g. "500MB" or "2GB").
+    Entries are evicted from each tier in a least recently used fashion, where an access to an entry through
+    any tier counts as a use of that entry in both tiers. A size limit on the disk tier requires to provide
+    the folder in which export saves files.
+    """
+
+    def __init__(self, config_section=None, key_generator=None, import_=None, export=None, filename_generator=None,
+                 folder=None):
         self._config_section = config_section
+        self.statistics = CacheStatistics()
         if self._config_section is None:
             self._storage = dict()
             self._key_generator = None
             self._import = None
             self._export = None
             self._filename_generator = None
+            self._disk_storage = None
         else:
             from rbnics.utils.config import config  # cannot import at global scope
             cache_options = config.get(self._config_section, "cache")
             assert isinstance(cache_options, set)
             if "RAM" in cache_options:
-                cache_size = config.get(self._config_section, "RAM cache limit")
-                assert isinstance(cache_size, str)
-                if cache_size == "unlimited":
+                cache_limit = parse_cache_limit(config.get(self._config_section, "RAM cache limit"))
+                if cache_limit is None:
                     self._storage = dict()
                 else:
-                    assert cache_size.isdigit()
-                    cache_size = int(cache_size)
-                    assert cache_size > 0
-                    self._storage = lrucache(cache_size)
+                    self._storage = LRUStorage(cache_limit, self.statistics)
                 assert key_generator is not None
                 self._key_generator = key_generator
             else:
                 self._storage = DisabledStorage()
                 self._key_generator = key_generator
             if "disk" in cache_options:
-                cache_size = config.get(self._config_section, "disk cache limit")
-                assert isinstance(cache_size, str)
-                assert cache_size == "unlimited"
+                cache_limit = parse_cache_limit(config.get(self._config_section, "disk cache limit"))
+                if cache_limit is None:
+                    self._disk_storage = None
+                else:
+                    assert folder is not None, "A folder is required to enforce a disk cache limit"
+                    self._disk_storage = DiskStorageIndex(cache_limit, folder, self.statistics)
                 assert import_ is not None
                 self._import = import_
                 assert export is not None
@@ -54,6 +69,7 @@ class Cache(object):
                 self._import = None
                 self._export = None
                 self._filename_generator = None
+                self._disk_storage = None
 
     def __len__(self):
         """
@@ -87,21 +103,29 @@ class Cache(object):
                 try:
                     self._storage[storage_key] = self._import(storage_filename)
                 except OSError:
+                    self.statistics.misses += 1
                     logger.log(DEBUG, "Could not load key " + str(storage_key)
                                + " (corresponding to args = " + str(args)
                                + " and kwargs = " + str(kwargs) + ") from cache or disk")
                     raise key_error
                 else:
+                    self.statistics.disk_hits += 1
+                    if self._disk_storage is not None:
+                        self._disk_storage.touch(storage_filename)
                     logger.log(DEBUG, "Loaded key " + str(storage_key)
                                + " (corresponding to args = " + str(args)
                                + " and kwargs = " + str(kwargs) + ") from disk")
                     return self._storage[storage_key]
             else:
+                self.statistics.misses += 1
                 logger.log(DEBUG, "Could not load key " + str(storage_key)
                            + " (corresponding to args = " + str(args)
                            + " and kwargs = " + str(kwargs) + ") from cache")
                 raise key_error
         else:
+            self.statistics.RAM_hits += 1
+            if self._disk_storage is not None:
+                self._disk_storage.touch(self._filename_generator(*args, **kwargs))
             logger.log(DEBUG, "Loaded key " + str(storage_key)
                        + " (corresponding to args = " + str(args)
                        + " and kwargs = " + str(kwargs) + ") from cache")
@@ -116,6 +140,8 @@ class Cache(object):
         if self._filename_generator is not None:
             storage_filename = self._filename_generator(*args, **kwargs)
             self._export(storage_filename)
+            if self._disk_storage is not None:
+                self._disk_storage.touch(storage_filename, update_size=True)
 
     def __delitem__(self, key):
         """
@@ -205,3 +231,174 @@ class DisabledStorage(MutableMapping):
 
     def __keytransform__(self, key):
         return key
+
+
+class CacheStatistics(object):
+    """
+    Number of hits, misses and evictions of a Cache.
+    """
+
+    def __init__(self):
+        self.RAM_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.RAM_evictions = 0
+        self.disk_evictions = 0
+
+    def __str__(self):
+        return ("RAM hits: " + str(self.RAM_hits) + ", disk hits: " + str(self.disk_hits)
+                + ", misses: " + str(self.misses) + ", RAM evictions: " + str(self.RAM_evictions)
+                + ", disk evictions: " + str(self.disk_evictions))
+
+
+class LRUStorage(MutableMapping):
+    """
+    RAM storage which evicts the least recently used entries as soon as either their number or
+    their (estimated) size exceed the limit. The most recently used entry is never evicted.
+    Since even reads reorder entries, accesses are serialized by a lock, so that the storage can be shared
+    by several threads.
+    """
+
+    def __init__(self, limit, statistics):
+        (self._limit_type, self._limit) = limit
+        self._statistics = statistics
+        self._storage = OrderedDict()
+        self._sizes = dict()
+        self._size = 0
+        self._lock = RLock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = self._storage[key]
+            self._storage.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            if key in self._storage:
+                self._size -= self._sizes[key]
+            self._storage[key] = value
+            self._storage.move_to_end(key)
+            if self._limit_type == "bytes":
+                self._sizes[key] = estimate_size(value)
+            else:
+                self._sizes[key] = 1
+            self._size += self._sizes[key]
+            while self._size > self._limit and len(self._storage) > 1:
+                (evicted_key, _) = self._storage.popitem(last=False)
+                self._size -= self._sizes.pop(evicted_key)
+                self._statistics.RAM_evictions += 1
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self._storage[key]
+            self._size -= self._sizes.pop(key)
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._storage))
+
+    def __len__(self):
+        return len(self._storage)
+
+    def clear(self):
+        with self._lock:
+            self._storage.clear()
+            self._sizes.clear()
+            self._size = 0
+
+
+class DiskStorageIndex(object):
+    """
+    Index of the files saved to disk by a Cache, which deletes the files associated to the least recently used
+    entries as soon as either their number or their size exceed the limit. Only files saved (or loaded) by the
+    current Cache are accounted for. Files are looked up in a way that does not require collective communication,
+    so that the same index can be used by caches of problems defined on any MPI communicator.
+    """
+
+    def __init__(self, limit, folder, statistics):
+        (self._limit_type, self._limit) = limit
+        self._folder = folder
+        self._statistics = statistics
+        self._sizes = OrderedDict()
+        self._size = 0
+        self._files = dict()  # from filename to the files associated to it, recorded when they are saved
+
+    def touch(self, filename, update_size=False):
+        if filename not in self._sizes or update_size:
+            if filename in self._sizes:
+                self._size -= self._sizes[filename]
+            if self._limit_type == "bytes":
+                self._files[filename] = self._lookup_files(filename)
+                self._sizes[filename] = sum(os.path.getsize(f) for f in self._files[filename])
+            else:
+                # Files are only looked up upon eviction, since their size is not needed
+                self._files.pop(filename, None)
+                self._sizes[filename] = 1
+            self._size += self._sizes[filename]
+        self._sizes.move_to_end(filename)
+        while self._size > self._limit and len(self._sizes) > 1:
+            (evicted_filename, evicted_size) = self._sizes.popitem(last=False)
+            self._size -= evicted_size
+            evicted_files = self._files.pop(evicted_filename, None)
+            if evicted_files is None:
+                evicted_files = self._lookup_files(evicted_filename)
+            for f in evicted_files:
+                try:
+                    os.remove(f)
+                except FileNotFoundError:  # already removed by another process
+                    pass
+            self._statistics.disk_evictions += 1
+
+    def _lookup_files(self, filename):
+        folder = str(self._folder)
+        files = list()
+        if os.path.isdir(folder):
+            for f in os.listdir(folder):
+                if f == filename or f.startswith(filename + ".") or f.startswith(filename + "_"):
+                    files.append(os.path.join(folder, f))
+        return files
+
+
+_units = {"B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3, "TB": 1024**4}
+
+
+def parse_cache_limit(cache_limit):
+    """
+    Convert a cache limit from the configuration file to either None (for an unlimited cache), ("entries", n)
+    for a cache of at most n entries, or ("bytes", n) for a cache of at most n bytes.
+    """
+    assert isinstance(cache_limit, str)
+    cache_limit = cache_limit.strip()
+    if cache_limit == "unlimited":
+        return None
+    elif cache_limit.isdigit():
+        cache_limit = int(cache_limit)
+        assert cache_limit > 0
+        return ("entries", cache_limit)
+    else:
+        match = re.fullmatch(r"(\d+(?:\.\d*)?)\s*([KMGT]?B)", cache_limit.upper())
+        assert match is not None, "Invalid cache limit " + cache_limit
+        cache_limit = int(float(match.group(1)) * _units[match.group(2)])
+        assert cache_limit > 0
+        return ("bytes", cache_limit)
+
+
+def estimate_size(value):
+    """
+    Estimate the size in bytes of a value stored in the cache.
+    """
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_size(v) for v in value)
+    elif hasattr(value, "_list"):  # e.g. time series or functions lists
+        return sum(estimate_size(v) for v in value._list)
+    elif hasattr(value, "vector") and callable(value.vector):  # e.g. functions
+        return estimate_size(value.vector())
+    elif hasattr(value, "local_size") and callable(value.local_size):  # e.g. dolfin vectors
+        return 8 * value.local_size()
+    elif hasattr(value, "content"):  # e.g. online vectors and matrices
+        return estimate_size(value.content)
+    elif hasattr(value, "nbytes"):  # e.g. numpy arrays
+        return value.nbytes
+    else:
+        return sys.getsizeof(value)
@@ -23,6 +23,8 @@ class TimeSeriesCache(Cache):
 
             def patched_append(self_, item):
                 self._export(storage_filename, item, len(self_))
+                if self._disk_storage is not None:
+                    self._disk_storage.touch(storage_filename, update_size=True)
                 original_append(item)
 
             PatchInstanceMethod(value, "append", patched_append).patch()
@@ -28,6 +28,7 @@ class Config(object):
         "problems": {
             "cache": {"disk", "RAM"},
             "disk cache limit": "unlimited",
+            "disk cache storage": "files",
             "RAM cache limit": "1"
         },
         "reduced problems": {
@@ -18,6 +18,7 @@ from rbnics.utils.decorators.online_size_type import OnlineSizeType
 from rbnics.utils.decorators.parameters_type import ParametersType
 from rbnics.utils.decorators.preserve_class_name import PreserveClassName
 from rbnics.utils.decorators.problem_decorator_for import ProblemDecoratorFor
+from rbnics.utils.decorators.profile_offline_phases import profile_offline_phases
 from rbnics.utils.decorators.reduced_problem_decorator_for import ReducedProblemDecoratorFor
 from rbnics.utils.decorators.reduced_problem_for import ReducedProblemFor
 from rbnics.utils.decorators.reduction_method_decorator_for import ReductionMethodDecoratorFor
@@ -82,6 +83,7 @@ __all__ = [
     "ParametersType",
     "PreserveClassName",
     "ProblemDecoratorFor",
+    "profile_offline_phases",
     "ReducedProblemDecoratorFor",
     "ReducedProblemFor",
     "ReductionMethodDecoratorFor",
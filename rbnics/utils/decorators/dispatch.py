@@ -75,17 +75,20 @@ class InvalidSignatureError(TypeError):
 # == Customize Dispatcher == #
 class Dispatcher(OriginalDispatcher):
     # extend slots with new private members
-    __slots__ = "__name__", "name", "funcs", "_ordering", "_cache", "doc", "signature_to_provided_signature"
+    __slots__ = ("__name__", "name", "funcs", "_ordering", "_cache", "doc", "signature_to_provided_signature",
+                 "_fast_cache")
 
     def __init__(self, name, doc=None):
         OriginalDispatcher.__init__(self, name, doc)
         self.signature_to_provided_signature = dict()
+        self._fast_cache = dict()
 
     def add(self, signature, func, replaces=None, replaces_if=None):
         for types in expand_tuples(signature):
             self._add(types, signature, func, replaces, replaces_if)
         # Trigger reordering, if needed
         self._cache.clear()
+        self._fast_cache.clear()
         try:
             del self._ordering
         except AttributeError:
@@ -150,6 +153,19 @@ class Dispatcher(OriginalDispatcher):
         return func(*args, **kwargs)
 
     def _get_func(self, *args):
+        # Fast path: when no input is a container, the types of the inputs uniquely determine the types
+        # returned by get_types(), and can thus be used directly as key for the cache
+        fast_types = tuple(map(type, args))
+        func = self._fast_cache.get(fast_types)
+        if func is not None:
+            return func
+        if not _container_types.isdisjoint(fast_types):
+            fast_types = get_fast_types(args)
+            if fast_types is not None:
+                func = self._fast_cache.get(fast_types)
+                if func is not None:
+                    return func
+        # Slow path
         if len(args) > 1:
             types = get_types(args)
         elif len(args) == 1 and args[0] is not None:
@@ -163,12 +179,16 @@ class Dispatcher(OriginalDispatcher):
             if func is None:
                 raise UnavailableSignatureError(self.name, self.funcs.keys(), types)
             self._cache[types] = func
+        if fast_types is not None:
+            self._fast_cache[fast_types] = func
         return func
     _get_func.__doc__ = """
         This is a customization required by Dispatcher.__call__ method so that:
             * get_types() function is used to get input types. This handles the case of
               array_of, dict_of, iterable_of, list_of, set_of, tuple_of
             * a custom UnavailableSignatureError is thrown if no corresponding signature is provided
+            * inputs which are not containers are dispatched based only on their types, and flat containers
+              based on their types and the set of types of their elements, skipping get_types()
         It is based on the original multipledispatch implementation of Dispatcher.__call__
         """
 
@@ -250,7 +270,7 @@ class MethodDispatcher_Wrapper(object):
 class MethodDispatcher(Dispatcher):
     # extend slots with new private members
     __slots__ = ("__name__", "name", "funcs", "_ordering", "_cache", "doc", "signature_to_provided_signature",
-                 "origin", "obj")
+                 "_fast_cache", "origin", "obj")
 
     def __init__(self, origin, cls, name, doc=None):
         Dispatcher.__init__(self, name, doc)
@@ -319,6 +339,7 @@ class MethodDispatcher(Dispatcher):
             self._add(signature, signature, lambda_func)
         # Trigger reordering, if needed
         self._cache.clear()
+        self._fast_cache.clear()
         try:
             del self._ordering
         except AttributeError:
@@ -613,6 +634,10 @@ def validate_types(inputs, allow_lambda):
 
 
 # == Get types for provided inputs == #
+# Types of inputs for which get_type() does not simply return the type of the input
+_container_types = frozenset((array, dict, list, set, tuple))
+
+
 def get_types(inputs):
     inputs = remove_trailing_None(inputs)
     types = list()
@@ -661,6 +686,33 @@ def get_type(input_):
             return None
 
 
+# == Get cheap types for provided inputs, to be used as cache keys == #
+def get_fast_types(inputs):
+    """
+    Return a key which uniquely determines the types returned by get_types(inputs), or None if inputs contain
+    nested containers, None elements or dicts, for which such key would not be cheaper than get_types() itself
+    """
+    fast_types = list()
+    for input_ in inputs:
+        type_input_ = type(input_)
+        if type_input_ in (list, set, tuple):
+            subtypes = frozenset(map(type, input_))
+            if _NoneType in subtypes or not _container_types.isdisjoint(subtypes):
+                return None
+            fast_types.append((type_input_, subtypes))
+        elif type_input_ in (array, ) and input_.dtype != object:
+            # use a key different from type_input_, which would also match arrays of objects in the fast path
+            fast_types.append((type_input_, ))
+        elif type_input_ in _container_types:
+            return None
+        else:
+            fast_types.append(type_input_)
+    return tuple(fast_types)
+
+
+_NoneType = type(None)
+
+
 # == Customize tuple expansion to handle array_of, dict_of, iterable_of, list_of, set_of, tuple_of == #
 def expand_tuples(L):
     if not L:
@@ -0,0 +1,32 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+
+def profile_offline_phases(offline_method):
+
+    def patched_offline_method(self_):
+        profiler = self_.offline_profiler
+        if profiler is None:  # profiling is disabled
+            return offline_method(self_)
+
+        # Record calls to the methods associated to each phase of the offline stage
+        for (instance, method_name, phase_name) in self_._offline_phases():
+            profiler.instrument(instance, method_name, phase_name)
+
+        # Call standard offline
+        try:
+            with profiler.phase("offline"):
+                reduced_problem = offline_method(self_)
+        finally:
+            profiler.remove_instrumentation()
+
+        # Save profiling report alongside post processing data
+        profiler.save(self_.folder["post_processing"], "offline_profile")
+
+        # Return generated reduced problem
+        return reduced_problem
+
+    return patched_offline_method
@@ -6,14 +6,17 @@
 
 import glob
 import os
+import shutil
 from rbnics.utils.mpi import parallel_io
 from rbnics.utils.test import PatchInstanceMethod
 
 
 def snapshot_links_to_cache(offline_method):
 
-    def patched_export_solution(truth_problem, snapshots_folder):
+    def patched_export_solution(truth_problem, snapshots_folder, config_section):
         cache_folder = truth_problem.folder["cache"]
+        # Files in a disk cache with a limit may be deleted when their entry is evicted, and thus cannot be linked
+        copy_cache_files = _disk_cache_is_limited(config_section)
         original_export_solution = truth_problem.export_solution
 
         def patched_export_solution_internal(self_, folder=None, filename=None, *args, **kwargs):
@@ -45,14 +48,28 @@ def snapshot_links_to_cache(offline_method):
                                 should_link = True
                             else:
                                 should_link = (header != "<?xml")
-                            if should_link:
+                            if should_link and copy_cache_files:
+                                shutil.copyfile(cache_path, snapshot_path)
+                            elif should_link:
                                 os.symlink(cache_relpath, snapshot_path)
                             else:
                                 with open(cache_path, "r") as cache_file, open(snapshot_path, "w") as snapshot_file:
                                     for l in cache_file.readlines():  # noqa: E741
                                         snapshot_file.write(l.replace(cache_filename, filename))
 
-                parallel_io(create_links)
+                def create_reference(store_filename):
+                    # Snapshots in a snapshot store are referenced by their key in a single index file,
+                    # rather than by links, which would require one file per snapshot
+                    store_relpath = os.path.relpath(store_filename, str(folder))
+                    with open(os.path.join(str(folder), "snapshot_store_index.txt"), "a") as index_file:
+                        index_file.write(filename + " " + store_relpath + " " + cache_filename + "\n")
+
+                if getattr(truth_problem, "_snapshot_store", None) is not None:
+                    # The store may be sharded, so look for the file containing the snapshot (collectively)
+                    store_filename = truth_problem._snapshot_store.filename(cache_filename)
+                    parallel_io(lambda: create_reference(store_filename))
+                else:
+                    parallel_io(create_links)
             else:
                 original_export_solution(folder, filename, *args, **kwargs)
 
@@ -63,12 +80,15 @@ def snapshot_links_to_cache(offline_method):
         assert hasattr(self_, "truth_problem") or hasattr(self_, "EIM_approximation")
         if hasattr(self_, "truth_problem"):  # differential problem
             truth_problem = self_.truth_problem
+            config_section = "problems"
         elif hasattr(self_, "EIM_approximation"):  # EIM
             truth_problem = self_.EIM_approximation
+            config_section = "EIM"
         else:
             raise AttributeError("Invalid truth problem attribute.")
         export_solution_patch = PatchInstanceMethod(
-            truth_problem, "export_solution", patched_export_solution(truth_problem, self_.folder["snapshots"]))
+            truth_problem, "export_solution",
+            patched_export_solution(truth_problem, self_.folder["snapshots"], config_section))
         export_solution_patch.patch()
 
         # Call standard offline
@@ -81,3 +101,10 @@ def snapshot_links_to_cache(offline_method):
         return reduced_problem
 
     return patched_offline_method
+
+
+def _disk_cache_is_limited(config_section):
+    from rbnics.utils.cache.cache import parse_cache_limit  # cannot import at global scope
+    from rbnics.utils.config import config  # cannot import at global scope
+    return ("disk" in config.get(config_section, "cache")
+            and parse_cache_limit(config.get(config_section, "disk cache limit")) is not None)
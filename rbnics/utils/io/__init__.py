@@ -15,6 +15,7 @@ from rbnics.utils.io.numpy_io import NumpyIO
 from rbnics.utils.io.performance_table import PerformanceTable
 from rbnics.utils.io.online_size_dict import OnlineSizeDict
 from rbnics.utils.io.pickle_io import PickleIO
+from rbnics.utils.io.profiler import Profiler
 from rbnics.utils.io.speedup_analysis_table import SpeedupAnalysisTable
 from rbnics.utils.io.text_box import TextBox
 from rbnics.utils.io.text_io import TextIO
@@ -33,6 +34,7 @@ __all__ = [
     "OnlineSizeDict",
     "PerformanceTable",
     "PickleIO",
+    "Profiler",
     "SpeedupAnalysisTable",
     "TextBox",
     "TextIO",
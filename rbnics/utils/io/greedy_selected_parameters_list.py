@@ -21,6 +21,9 @@ class GreedySelectedParametersList(object):
     def append(self, element):
         self.parameter_space_subset.append(element)
 
+    def set_distance_scaling(self, distance_scaling):
+        self.parameter_space_subset.set_distance_scaling(distance_scaling)
+
     def closest(self, M, mu):
         output = GreedySelectedParametersList()
         output.parameter_space_subset = self.parameter_space_subset.closest(M, mu)
@@ -21,12 +21,12 @@ class NumpyIO(object):
 
         parallel_io(save_file_task)
 
-    # Load a variable from file
+    # Load a variable from file, possibly memory mapping it (see numpy.load for valid values of mmap_mode)
     @staticmethod
-    def load_file(directory, filename):
+    def load_file(directory, filename, mmap_mode=None):
         if not filename.endswith(".npy"):
             filename = filename + ".npy"
-        return numpy.load(os.path.join(str(directory), filename), allow_pickle=True)
+        return numpy.load(os.path.join(str(directory), filename), mmap_mode=mmap_mode, allow_pickle=True)
 
     # Check if the file exists
     @staticmethod
@@ -0,0 +1,148 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import cProfile
+import json
+import os
+import resource
+import sys
+from contextlib import contextmanager
+from timeit import default_timer as python_timer
+from mpi4py import MPI
+from mpi4py.MPI import MAX, SUM
+from rbnics.utils.io.csv_io import CSVIO
+from rbnics.utils.mpi import parallel_io
+
+
+class Profiler(object):
+    """
+    Hierarchical profiler, which records for each (possibly nested) phase the number of calls, the wall time
+    (both as maximum and as sum over processes) and the peak memory of the process at the end of the phase.
+    Nested phases are identified by the names of all enclosing phases, separated by "/". Phases whose name
+    is in cprofile_phases are also profiled by cProfile, unless they are nested in a phase which is already
+    profiled by cProfile.
+    """
+
+    def __init__(self, mpi_comm=None, cprofile_phases=None):
+        if mpi_comm is None:
+            mpi_comm = MPI.COMM_WORLD
+        self._comm = mpi_comm
+        if cprofile_phases is None:
+            cprofile_phases = set()
+        self._cprofile_phases = set(cprofile_phases)
+        self._stack = list()
+        self._statistics = dict()  # from phase path to PhaseStatistics
+        self._cprofiles = dict()  # from phase path to cProfile.Profile
+        self._cprofile_active = False
+        self._patches = list()
+
+    @contextmanager
+    def phase(self, name):
+        self._stack.append(name)
+        path = "/".join(self._stack)
+        if path not in self._statistics:
+            self._statistics[path] = PhaseStatistics()
+        cprofile = None
+        if name in self._cprofile_phases and not self._cprofile_active:
+            if path not in self._cprofiles:
+                self._cprofiles[path] = cProfile.Profile()
+            cprofile = self._cprofiles[path]
+            self._cprofile_active = True
+            cprofile.enable()
+        start = python_timer()
+        try:
+            yield
+        finally:
+            elapsed = python_timer() - start
+            if cprofile is not None:
+                cprofile.disable()
+                self._cprofile_active = False
+            self._statistics[path].add(elapsed, _peak_memory())
+            self._stack.pop()
+
+    def instrument(self, instance, method_name, name):
+        """
+        Record every call to the method method_name of instance as a phase, until remove_instrumentation is called.
+        """
+        from rbnics.utils.test import PatchInstanceMethod  # cannot import at global scope
+        original_method = getattr(instance, method_name)
+
+        def instrumented_method(self_, *args, **kwargs):
+            with self.phase(name):
+                return original_method(*args, **kwargs)
+
+        patch = PatchInstanceMethod(instance, method_name, instrumented_method)
+        patch.patch()
+        self._patches.append(patch)
+
+    def remove_instrumentation(self):
+        while len(self._patches) > 0:
+            self._patches.pop().unpatch()
+
+    def report(self):
+        """
+        Return a list of dicts, one for each phase, with statistics gathered over all processes.
+        This method is collective on the communicator of the profiler. Phases which were not carried out
+        on every process (e.g. the ones of a part of the offline stage run by a single group of processes)
+        are reported with statistics gathered over the processes which carried them out.
+        """
+        report = list()
+        paths = list()
+        for process_paths in self._comm.allgather(list(self._statistics.keys())):
+            paths.extend(path for path in process_paths if path not in paths)
+        for path in paths:
+            statistics = self._statistics.get(path, PhaseStatistics())
+            report.append({
+                "phase": path,
+                "calls": self._comm.allreduce(statistics.calls, op=MAX),
+                "wall time max": self._comm.allreduce(statistics.wall_time, op=MAX),
+                "wall time sum": self._comm.allreduce(statistics.wall_time, op=SUM),
+                "peak memory max": self._comm.allreduce(statistics.peak_memory, op=MAX),
+                "peak memory sum": self._comm.allreduce(statistics.peak_memory, op=SUM)
+            })
+        return report
+
+    def save(self, directory, filename):
+        """
+        Save the report as both json and csv files, and the output of cProfile (if any) for each profiled phase.
+        This method is collective on the communicator of the profiler.
+        """
+        report = self.report()
+
+        def save_json_task():
+            with open(os.path.join(str(directory), filename + ".json"), "w") as outfile:
+                json.dump(report, outfile, indent=4)
+
+        parallel_io(save_json_task)
+        keys = list(report[0].keys()) if len(report) > 0 else list()
+        CSVIO.save_file([keys] + [[phase_report[key] for key in keys] for phase_report in report],
+                        directory, filename)
+        for (path, cprofile) in self._cprofiles.items():
+            cprofile_filename = filename + "_" + path.replace("/", "_").replace(" ", "_")
+            if self._comm.size > 1:
+                cprofile_filename += "_" + str(self._comm.rank)
+            cprofile.dump_stats(os.path.join(str(directory), cprofile_filename + ".prof"))
+
+
+class PhaseStatistics(object):
+    def __init__(self):
+        self.calls = 0
+        self.wall_time = 0.
+        self.peak_memory = 0.
+
+    def add(self, wall_time, peak_memory):
+        self.calls += 1
+        self.wall_time += wall_time
+        self.peak_memory = max(self.peak_memory, peak_memory)
+
+
+# Peak resident memory of the current process, in MB
+def _peak_memory():
+    peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":  # bytes
+        return peak_memory / 1024**2
+    else:  # kilobytes
+        return peak_memory / 1024
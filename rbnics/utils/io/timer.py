@@ -10,11 +10,13 @@ from mpi4py.MPI import MAX, SUM
 
 
 class Timer(object):
-    def __init__(self, mode):
+    def __init__(self, mode, mpi_comm=None):
         assert mode in ("serial", "parallel")
         self._mode = mode
         self._start = None
-        self._comm = MPI.COMM_WORLD
+        if mpi_comm is None:
+            mpi_comm = MPI.COMM_WORLD
+        self._comm = mpi_comm
 
     def start(self):
         self._start = python_timer()
@@ -4,12 +4,13 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from rbnics.utils.mpi.parallel_io import parallel_io
+from rbnics.utils.mpi.parallel_io import parallel_io, parallel_io_default_mpi_comm
 from rbnics.utils.mpi.parallel_max import parallel_max
 from rbnics.utils.mpi.print import print
 
 __all__ = [
     "parallel_io",
+    "parallel_io_default_mpi_comm",
     "parallel_max",
     "print"
 ]
@@ -5,12 +5,16 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 import sys
+from contextlib import contextmanager
 from mpi4py.MPI import COMM_WORLD
 
+# Communicator used by parallel_io when none is provided
+_default_mpi_comm = COMM_WORLD
+
 
 def parallel_io(lambda_function, mpi_comm=None):
     if mpi_comm is None:
-        mpi_comm = COMM_WORLD
+        mpi_comm = _default_mpi_comm
     return_value = None
     error_raised = False
     error_type = None
@@ -30,3 +34,16 @@ def parallel_io(lambda_function, mpi_comm=None):
         error_type = mpi_comm.bcast(error_type, root=0)
         error_instance_args = mpi_comm.bcast(error_instance_args, root=0)
         raise error_type(*error_instance_args)
+
+
+# Temporarily change the communicator used by parallel_io when none is provided, so that I/O carried out
+# by a subset of the processes (e.g. a group of an MPIGroupsExecutor) is not collective on all of them
+@contextmanager
+def parallel_io_default_mpi_comm(mpi_comm):
+    global _default_mpi_comm
+    previous_mpi_comm = _default_mpi_comm
+    _default_mpi_comm = mpi_comm
+    try:
+        yield
+    finally:
+        _default_mpi_comm = previous_mpi_comm
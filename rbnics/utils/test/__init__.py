@@ -13,7 +13,6 @@ from rbnics.utils.test.patch_benchmark_plugin import patch_benchmark_plugin
 from rbnics.utils.test.patch_initialize_testing_training_set import patch_initialize_testing_training_set
 from rbnics.utils.test.patch_instance_method import PatchInstanceMethod
 from rbnics.utils.test.run_and_compare_to_gold import run_and_compare_to_gold
-from rbnics.utils.test.tempdir import load_tempdir, save_tempdir, tempdir
 
 __all__ = [
     "add_gold_options",
@@ -32,3 +31,14 @@ __all__ = [
     "save_tempdir",
     "tempdir"
 ]
+
+
+def __getattr__(name):
+    # Fixtures are imported only when they are first requested (e.g. by a conftest.py file), since their
+    # definition requires pytest, which is expensive to import
+    if name not in ("load_tempdir", "save_tempdir", "tempdir"):
+        raise AttributeError("module " + __name__ + " has no attribute " + name)
+    from rbnics.utils.test.tempdir import load_tempdir, save_tempdir, tempdir
+    # Importing the tempdir module has stored it as an attribute of this package: replace it with the fixture
+    globals().update(load_tempdir=load_tempdir, save_tempdir=save_tempdir, tempdir=tempdir)
+    return globals()[name]
@@ -4,15 +4,21 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-import matplotlib
-import matplotlib.pyplot as plt
-matplotlib_backend = matplotlib.get_backend()
+# matplotlib is imported only when it is actually disabled or enabled, since importing it is expensive
+matplotlib_backend = None
 
 
 def disable_matplotlib():
+    import matplotlib
+    import matplotlib.pyplot as plt
+    global matplotlib_backend
+    if matplotlib_backend is None:
+        matplotlib_backend = matplotlib.get_backend()
     plt.switch_backend("agg")
 
 
 def enable_matplotlib():
-    plt.switch_backend(matplotlib_backend)
+    import matplotlib.pyplot as plt
+    if matplotlib_backend is not None:
+        plt.switch_backend(matplotlib_backend)
     plt.close("all")  # do not trigger matplotlib max_open_warning
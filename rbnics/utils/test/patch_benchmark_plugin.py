@@ -9,7 +9,6 @@ import sys
 import gc
 import time
 from math import ceil
-import matplotlib.pyplot as plt
 from rbnics.utils.io import Timer
 
 
@@ -149,6 +148,9 @@ def patch_benchmark_plugin(benchmark_plugin):
                     name = benchmark["name"].split("[")[0]
                     params_str = benchmark["param"]
                     params_dict = benchmark["params"]
+                    # Skip benchmarks which are not compared to a builtin implementation, e.g. end-to-end ones
+                    if params_dict is None or "test_type" not in params_dict:
+                        continue
                     params_dict_without_test_type = dict(benchmark["params"])
                     params_dict_without_test_type.pop("test_type")
                     # Skip test_type set to builtin
@@ -181,6 +183,7 @@ def patch_benchmark_plugin(benchmark_plugin):
                         speedups[external_key] = dict()
                     speedups[external_key][internal_key] = values
             # Prepare a plot
+            import matplotlib.pyplot as plt
             storage_dir = self.config.getoption("overhead_speedup_storage")
             for (dict_, ylabel) in ((speedups, "speedup"), (overheads, "overhead")):
                 for (external_key, internal_dict) in dict_.items():
@@ -11,6 +11,7 @@ except ImportError:
     pass
 from rbnics.utils.test import (add_gold_options, disable_matplotlib, enable_matplotlib, PatchInstanceMethod,
                                process_gold_options, run_and_compare_to_gold)
+from rbnics.utils.test import tempdir  # noqa: F401
 
 
 def pytest_addoption(parser):
@@ -0,0 +1,76 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import pytest
+from numpy import argmax, isclose
+from dolfin import dx, FunctionSpace, IntervalMesh, pi, TestFunction
+from rbnics import EquispacedDistribution, ParametrizedExpression
+from rbnics.backends import ParametrizedExpressionFactory, ParametrizedTensorFactory
+from rbnics.eim.problems.eim_approximation import EIMApproximation
+from rbnics.eim.reduction_methods.eim_approximation_reduction_method import EIMApproximationReductionMethod
+from rbnics.problems.base import ParametrizedProblem
+
+
+@pytest.mark.parametrize("expression_type", ["Function", "Vector"])
+def test_eim_greedy_residuals(expression_type):
+    """
+    Check that the greedy algorithm, which updates the interpolation residuals over the training set with rank
+    one corrections, selects the same parameters as a greedy algorithm which solves the interpolation problem
+    for each parameter in the training set at each iteration.
+    """
+
+    class MockProblem(ParametrizedProblem):
+        def __init__(self, V, **kwargs):
+            ParametrizedProblem.__init__(self, "")
+            self.V = V
+
+        def name(self):
+            return "MockProblem_greedy_residuals_" + expression_type
+
+    class ParametrizedFunctionApproximation(EIMApproximation):
+        def __init__(self, V, expression_type):
+            self.V = V
+            # Parametrized function to be interpolated
+            mock_problem = MockProblem(V)
+            f = ParametrizedExpression(
+                mock_problem, "(1-x[0])*cos(3*pi*mu[0]*(1+x[0]))*exp(-mu[0]*(1+x[0]))", mu=(1., ),
+                element=V.ufl_element())
+            #
+            folder_prefix = os.path.join("test_eim_greedy_residuals_tempdir", expression_type)
+            if expression_type == "Function":
+                EIMApproximation.__init__(
+                    self, mock_problem, ParametrizedExpressionFactory(f), folder_prefix, "Greedy")
+            elif expression_type == "Vector":
+                v = TestFunction(V)
+                EIMApproximation.__init__(
+                    self, mock_problem, ParametrizedTensorFactory(f * v * dx), folder_prefix, "Greedy")
+            else:
+                raise AssertionError("Invalid expression_type")
+
+    mesh = IntervalMesh(100, -1., 1.)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    approximation = ParametrizedFunctionApproximation(V, expression_type)
+    approximation.set_mu_range([(1., pi), ])
+    reduction_method = EIMApproximationReductionMethod(approximation)
+    reduction_method.set_Nmax(10)
+    reduction_method.set_tolerance(0.)
+    reduction_method.initialize_training_set(51, sampling=EquispacedDistribution())
+    reduction_method.offline()
+    assert len(reduction_method.greedy_selected_parameters) == 11
+
+    # At each iteration, the greedy algorithm must select the parameter with the largest interpolation error
+    # computed by the interpolation solve with the basis functions available at that iteration
+    for N in range(11):
+        errors = list()
+        for mu in reduction_method.training_set:
+            approximation.set_mu(mu)
+            approximation.evaluate_parametrized_expression()
+            approximation.solve(N)
+            (_, maximum_error, _) = approximation.compute_maximum_interpolation_error(N)
+            errors.append(abs(maximum_error))
+        assert reduction_method.training_set[int(argmax(errors))] == reduction_method.greedy_selected_parameters[N]
+        assert isclose(max(errors), abs(reduction_method.greedy_errors[N]))
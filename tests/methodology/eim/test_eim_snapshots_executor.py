@@ -0,0 +1,91 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import pytest
+from numpy import isclose
+from dolfin import dx, FunctionSpace, IntervalMesh, pi, TestFunction
+from rbnics import EquispacedDistribution, ParametrizedExpression
+from rbnics.backends import ParametrizedExpressionFactory, ParametrizedTensorFactory
+from rbnics.eim.problems.eim_approximation import EIMApproximation
+from rbnics.eim.reduction_methods.eim_approximation_reduction_method import EIMApproximationReductionMethod
+from rbnics.problems.base import ParametrizedProblem
+from rbnics.sampling.executors import ProcessPoolExecutor, SerialExecutor
+
+
+def _offline(V, expression_type, folder_prefix, snapshots_executor):
+
+    class MockProblem(ParametrizedProblem):
+        def __init__(self, V, **kwargs):
+            ParametrizedProblem.__init__(self, "")
+            self.V = V
+
+        def name(self):
+            return "MockProblem_snapshots_executor_" + expression_type
+
+    class ParametrizedFunctionApproximation(EIMApproximation):
+        def __init__(self, V, expression_type):
+            self.V = V
+            # Parametrized function to be interpolated
+            mock_problem = MockProblem(V)
+            f = ParametrizedExpression(
+                mock_problem, "(1-x[0])*cos(3*pi*mu[0]*(1+x[0]))*exp(-mu[0]*(1+x[0]))", mu=(1., ),
+                element=V.ufl_element())
+            #
+            if expression_type == "Function":
+                EIMApproximation.__init__(
+                    self, mock_problem, ParametrizedExpressionFactory(f), folder_prefix, "Greedy")
+            elif expression_type == "Vector":
+                v = TestFunction(V)
+                EIMApproximation.__init__(
+                    self, mock_problem, ParametrizedTensorFactory(f * v * dx), folder_prefix, "Greedy")
+            else:
+                raise AssertionError("Invalid expression_type")
+
+    approximation = ParametrizedFunctionApproximation(V, expression_type)
+    approximation.set_mu_range([(1., pi), ])
+    reduction_method = EIMApproximationReductionMethod(approximation)
+    reduction_method.set_Nmax(10)
+    reduction_method.set_tolerance(0.)
+    reduction_method.initialize_training_set(51, sampling=EquispacedDistribution())
+    reduction_method.set_snapshots_executor(snapshots_executor)
+    reduction_method.offline()
+    return (approximation, reduction_method)
+
+
+def _basis_function_to_array(basis_function, expression_type):
+    if expression_type == "Function":
+        return basis_function.vector().get_local()
+    elif expression_type == "Vector":
+        return basis_function.get_local()
+    else:
+        raise AssertionError("Invalid expression_type")
+
+
+@pytest.mark.parametrize("expression_type", ["Function", "Vector"])
+@pytest.mark.parametrize("snapshots_executor", [SerialExecutor, ProcessPoolExecutor])
+def test_eim_snapshots_executor(expression_type, snapshots_executor, tempdir):
+    """
+    Check that the offline stage of EIM, when parametrized expressions are evaluated over the training set
+    through a snapshots executor and later read from the disk cache, selects the same parameters and
+    computes the same basis as the offline stage which evaluates them sequentially on the fly.
+    """
+
+    mesh = IntervalMesh(100, -1., 1.)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    (approximation, reduction_method) = _offline(
+        V, expression_type, os.path.join(tempdir, "sequential"), None)
+    (approximation_executor, reduction_method_executor) = _offline(
+        V, expression_type, os.path.join(tempdir, "executor"), snapshots_executor())
+    assert len(reduction_method_executor.greedy_selected_parameters) == 11
+    assert (list(reduction_method_executor.greedy_selected_parameters)
+            == list(reduction_method.greedy_selected_parameters))
+    assert isclose(list(reduction_method_executor.greedy_errors), list(reduction_method.greedy_errors)).all()
+    assert len(approximation_executor.basis_functions) == len(approximation.basis_functions)
+    for (basis_function_executor, basis_function) in zip(
+            approximation_executor.basis_functions, approximation.basis_functions):
+        assert isclose(_basis_function_to_array(basis_function_executor, expression_type),
+                       _basis_function_to_array(basis_function, expression_type)).all()
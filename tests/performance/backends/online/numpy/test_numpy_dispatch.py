@@ -0,0 +1,72 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import isclose
+from rbnics.backends import product as factory_product, sum as factory_sum, transpose as factory_transpose
+from rbnics.backends.online import OnlineAffineExpansionStorage, online_product, online_sum, online_transpose
+from rbnics.backends.online.numpy import product as numpy_product, sum as numpy_sum, transpose as numpy_transpose
+from test_numpy_utils import RandomNumpyMatrix, RandomNumpyVector, RandomTuple
+
+# Functions to be called: "numpy" calls the backend implementation directly, while "online" and "factory"
+# go through the dispatcher, so that the difference is the dispatch overhead per backend call
+product = None
+sum = None
+transpose = None
+all_product = {"numpy": numpy_product, "online": online_product, "factory": factory_product}
+all_sum = {"numpy": numpy_sum, "online": online_sum, "factory": factory_sum}
+all_transpose = {"numpy": numpy_transpose, "online": online_transpose, "factory": factory_transpose}
+
+
+class Data(object):
+    def __init__(self, N, Q):
+        self.N = N
+        self.Q = Q
+
+    def generate_random(self):
+        # Generate random affine expansion and parameter dependent coefficients
+        a = OnlineAffineExpansionStorage(self.Q)
+        for i in range(self.Q):
+            a[i] = RandomNumpyMatrix(self.N, self.N)
+        theta = RandomTuple(self.Q)
+        # Generate random vectors
+        v1 = RandomNumpyVector(self.N)
+        v2 = RandomNumpyVector(self.N)
+        # Return
+        return (theta, a, v1, v2)
+
+    def evaluate_builtin(self, theta, a, v1, v2):
+        A = theta[0] * a[0].content
+        for i in range(1, self.Q):
+            A += theta[i] * a[i].content
+        return float(v1.content.dot(A.dot(v2.content)))
+
+    def evaluate_backend(self, theta, a, v1, v2):
+        return transpose(v1) * sum(product(theta, a)) * v2
+
+    def assert_backend(self, theta, a, v1, v2, result_backend):
+        result_builtin = self.evaluate_builtin(theta, a, v1, v2)
+        relative_error = (result_builtin - result_backend) / result_builtin
+        assert isclose(relative_error, 0., atol=1e-12)
+
+
+# Small reduced dimensions, so that the cost of dispatch is comparable to the cost of arithmetic
+@pytest.mark.parametrize("N", [2**i for i in range(1, 6)])
+@pytest.mark.parametrize("Q", [2 + 4 * j for j in range(0, 2)])
+@pytest.mark.parametrize("test_type", ["builtin"] + list(all_transpose.keys()))
+def test_numpy_dispatch(N, Q, test_type, benchmark):
+    data = Data(N, Q)
+    print("N = " + str(N) + ", Q = " + str(Q))
+    if test_type == "builtin":
+        print("Testing", test_type)
+        benchmark(data.evaluate_builtin, setup=data.generate_random)
+    else:
+        print("Testing", test_type, "backend")
+        global product, sum, transpose
+        product = all_product[test_type]
+        sum = all_sum[test_type]
+        transpose = all_transpose[test_type]
+        benchmark(data.evaluate_backend, setup=data.generate_random, teardown=data.assert_backend)
@@ -0,0 +1,60 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import asarray, isclose
+from rbnics.backends.online import OnlineFunction, OnlineLinearSolver
+from rbnics.backends.online.numpy.wrapping import batched_factorized_solve, factorize
+from test_numpy_utils import RandomNumpyMatrix, RandomNumpyVector
+
+
+class Data(object):
+    def __init__(self, N, Nmu):
+        self.N = N
+        self.Nmu = Nmu
+
+    def generate_random(self):
+        # Generate random lower triangular interpolation matrix, with a dominant diagonal
+        interpolation_matrix = RandomNumpyMatrix(self.N, self.N)
+        for i in range(self.N):
+            for j in range(i + 1, self.N):
+                interpolation_matrix[i, j] = 0.
+            interpolation_matrix[i, i] = interpolation_matrix[i, i] + 1000. * self.N
+        # Generate random evaluations of the parametrized expression at interpolation locations
+        rhs = [RandomNumpyVector(self.N) for _ in range(self.Nmu)]
+        # Return
+        return (interpolation_matrix, rhs)
+
+    def evaluate_builtin(self, interpolation_matrix, rhs):
+        result_builtin = list()
+        for rhs_p in rhs:
+            interpolation_coefficients = OnlineFunction(self.N)
+            solver = OnlineLinearSolver(interpolation_matrix[:self.N, :self.N], interpolation_coefficients, rhs_p)
+            solver.solve()
+            result_builtin.append(asarray(interpolation_coefficients.vector()))
+        return result_builtin
+
+    def evaluate_batched(self, interpolation_matrix, rhs):
+        return batched_factorized_solve(factorize(interpolation_matrix[:self.N, :self.N]), rhs)
+
+    def assert_batched(self, interpolation_matrix, rhs, result_batched):
+        assert result_batched.shape == (self.Nmu, self.N)
+        result_builtin = self.evaluate_builtin(interpolation_matrix, rhs)
+        assert isclose(asarray(result_builtin), result_batched, rtol=1e-10, atol=1e-14).all()
+
+
+@pytest.mark.parametrize("N", [2**(i + 3) for i in range(1, 4)])
+@pytest.mark.parametrize("Nmu", [10**(i + 2) for i in range(0, 2)])
+@pytest.mark.parametrize("test_type", ["builtin", "batched"])
+def test_numpy_eim_batched(N, Nmu, test_type, benchmark):
+    data = Data(N, Nmu)
+    print("N = " + str(N) + ", Nmu = " + str(Nmu))
+    if test_type == "builtin":
+        print("Testing", test_type)
+        benchmark(data.evaluate_builtin, setup=data.generate_random)
+    else:
+        print("Testing", test_type)
+        benchmark(data.evaluate_batched, setup=data.generate_random, teardown=data.assert_batched)
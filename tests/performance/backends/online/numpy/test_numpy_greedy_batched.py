@@ -0,0 +1,124 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import einsum, isclose, zeros as legacy_tensor
+from numpy.linalg import solve
+from rbnics.backends.online import OnlineAffineExpansionStorage
+from rbnics.backends.online.numpy.wrapping import (batched_solve, batched_sum_product,
+                                                   batched_vector_mul_matrix_mul_vector, batched_vector_mul_vector)
+from test_numpy_utils import RandomNumber, RandomNumpyMatrix, RandomNumpyVector, RandomTuple
+
+
+class Data(object):
+    def __init__(self, N, Qa, Qf, Ntrain):
+        self.N = N
+        self.Qa = Qa
+        self.Qf = Qf
+        self.Ntrain = Ntrain
+
+    def generate_random(self):
+        a = OnlineAffineExpansionStorage(self.Qa)
+        a_legacy = legacy_tensor((self.Qa, self.N, self.N))
+        for i in range(self.Qa):
+            # Generate random matrix, with a dominant diagonal
+            a_i = RandomNumpyMatrix(self.N, self.N)
+            for n in range(self.N):
+                a_i[n, n] = a_i[n, n] + 1000. * self.N
+            a[i] = a_i
+            a_legacy[i] = a_i.content
+        f = OnlineAffineExpansionStorage(self.Qf)
+        f_legacy = legacy_tensor((self.Qf, self.N))
+        for i in range(self.Qf):
+            # Generate random vector
+            f[i] = RandomNumpyVector(self.N)
+            f_legacy[i] = f[i].content
+        aa_product = OnlineAffineExpansionStorage(self.Qa, self.Qa)
+        aa_product_legacy = legacy_tensor((self.Qa, self.Qa, self.N, self.N))
+        for i in range(self.Qa):
+            for j in range(self.Qa):
+                # Generate random matrix
+                aa_product[i, j] = RandomNumpyMatrix(self.N, self.N)
+                aa_product_legacy[i, j] = aa_product[i, j].content
+        af_product = OnlineAffineExpansionStorage(self.Qa, self.Qf)
+        af_product_legacy = legacy_tensor((self.Qa, self.Qf, self.N))
+        for i in range(self.Qa):
+            for j in range(self.Qf):
+                # Generate random vector
+                af_product[i, j] = RandomNumpyVector(self.N)
+                af_product_legacy[i, j] = af_product[i, j].content
+        ff_product = OnlineAffineExpansionStorage(self.Qf, self.Qf)
+        ff_product_legacy = legacy_tensor((self.Qf, self.Qf))
+        for i in range(self.Qf):
+            for j in range(self.Qf):
+                # Generate random number
+                ff_product[i, j] = RandomNumber()
+                ff_product_legacy[i, j] = ff_product[i, j]
+        # Genereate random theta, with positive theta_a
+        theta_a = []
+        theta_f = []
+        for t in range(self.Ntrain):
+            theta_a.append(tuple(abs(v) for v in RandomTuple(self.Qa)))
+            theta_f.append(RandomTuple(self.Qf))
+        # Return
+        return (theta_a, theta_f,
+                a, f, aa_product, af_product, ff_product,
+                a_legacy, f_legacy, aa_product_legacy, af_product_legacy, ff_product_legacy)
+
+    def evaluate_builtin(self,
+                         theta_a, theta_f,
+                         a, f, aa_product, af_product, ff_product,
+                         a_legacy, f_legacy, aa_product_legacy, af_product_legacy, ff_product_legacy):
+        result_builtin = list()
+        for t in range(self.Ntrain):
+            u = solve(einsum("i,inm->nm", theta_a[t], a_legacy), einsum("i,in->n", theta_f[t], f_legacy))
+            result_builtin.append(
+                einsum("n,i,ijnm,j,m", u, theta_a[t], aa_product_legacy, theta_a[t], u, optimize=True)
+                + 2. * einsum("i,ijn,j,n", theta_a[t], af_product_legacy, theta_f[t], u, optimize=True)
+                + einsum("i,ij,j", theta_f[t], ff_product_legacy, theta_f[t], optimize=True)
+            )
+        return result_builtin
+
+    def evaluate_batched(self,
+                         theta_a, theta_f,
+                         a, f, aa_product, af_product, ff_product,
+                         a_legacy, f_legacy, aa_product_legacy, af_product_legacy, ff_product_legacy):
+        u = batched_solve(batched_sum_product(theta_a, a), batched_sum_product(theta_f, f))
+        return (batched_vector_mul_matrix_mul_vector(u, batched_sum_product(theta_a, aa_product, theta_a), u)
+                + 2. * batched_vector_mul_vector(u, batched_sum_product(theta_a, af_product, theta_f))
+                + batched_sum_product(theta_f, ff_product, theta_f))
+
+    def assert_batched(self,
+                       theta_a, theta_f,
+                       a, f, aa_product, af_product, ff_product,
+                       a_legacy, f_legacy, aa_product_legacy, af_product_legacy, ff_product_legacy,
+                       result_batched):
+        assert len(result_batched) == self.Ntrain
+        result_builtin = self.evaluate_builtin(
+            theta_a, theta_f,
+            a, f, aa_product, af_product, ff_product,
+            a_legacy, f_legacy, aa_product_legacy, af_product_legacy, ff_product_legacy)
+        assert len(result_builtin) == self.Ntrain
+        relative_error = sum([
+            abs(result_builtin_t - result_batched_t) / abs(result_builtin_t)
+            for (result_builtin_t, result_batched_t) in zip(result_builtin, result_batched)]) / self.Ntrain
+        assert isclose(relative_error, 0., atol=1e-10)
+
+
+@pytest.mark.parametrize("N", [2**(i + 3) for i in range(1, 3)])
+@pytest.mark.parametrize("Qa", [2 + 4 * j for j in range(1, 3)])
+@pytest.mark.parametrize("Qf", [2 + 4 * k for k in range(1, 3)])
+@pytest.mark.parametrize("Ntrain", [10**(i + 2) for i in range(0, 2)])
+@pytest.mark.parametrize("test_type", ["builtin", "batched"])
+def test_numpy_greedy_batched(N, Qa, Qf, Ntrain, test_type, benchmark):
+    data = Data(N, Qa, Qf, Ntrain)
+    print("N = " + str(N) + ", Qa = " + str(Qa) + ", Qf = " + str(Qf) + ", Ntrain = " + str(Ntrain))
+    if test_type == "builtin":
+        print("Testing", test_type)
+        benchmark(data.evaluate_builtin, setup=data.generate_random)
+    else:
+        print("Testing", test_type)
+        benchmark(data.evaluate_batched, setup=data.generate_random, teardown=data.assert_batched)
@@ -0,0 +1,47 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import sys
+import subprocess
+import pytest
+import rbnics
+
+# Modules which are not required by the online phase with the numpy backend, and thus should not be
+# imported by import rbnics (unless the user has already imported them, as it happens e.g. for dolfin)
+expensive_modules = ("cvxopt", "dolfin", "matplotlib", "petsc4py", "pytest", "sympy")
+
+
+class Data(object):
+    def __init__(self, module_names):
+        self.module_names = module_names
+
+    def generate_command(self):
+        # Run the import in a new interpreter, so that it is not affected by modules already imported by pytest
+        command = "import sys; import " + ", ".join(self.module_names) + "; print(' '.join(sys.modules.keys()))"
+        return ([sys.executable, "-c", command], )
+
+    def evaluate(self, command):
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            [os.path.dirname(os.path.dirname(os.path.abspath(rbnics.__file__)))] + sys.path)
+        return subprocess.check_output(command, env=env).decode().split()
+
+    def assert_not_imported(self, command, imported_modules):
+        for module_name in expensive_modules:
+            assert module_name not in imported_modules, module_name + " has been imported"
+
+
+@pytest.mark.parametrize("test_type", ["builtin", "rbnics"])
+def test_import(test_type, benchmark):
+    if test_type == "builtin":
+        print("Testing", test_type)
+        data = Data(("mpi4py.MPI", "numpy"))
+        benchmark(data.evaluate, setup=data.generate_command)
+    else:
+        print("Testing", test_type)
+        data = Data(("rbnics", ))
+        benchmark(data.evaluate, setup=data.generate_command, teardown=data.assert_not_imported)
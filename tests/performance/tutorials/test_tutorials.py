@@ -0,0 +1,228 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import shutil
+import sys
+import pytest
+from mpi4py.MPI import COMM_WORLD
+from rbnics.utils.mpi import parallel_io
+from rbnics.utils.test import disable_matplotlib, enable_matplotlib, PatchInstanceMethod
+
+# End-to-end benchmarks of the offline stage, of online queries over the testing set and of the error analysis,
+# carried out on reduced-size configurations of the tutorials. Use the --benchmark-autosave option to store
+# a baseline, and the --benchmark-compare and --benchmark-compare-fail options (e.g. --benchmark-compare-fail=mean:10%)
+# to flag regressions with respect to the stored baseline. Tutorials are run in a temporary copy of the tutorials
+# directory, so that offline data which may have been generated in the source tree are neither used nor removed.
+tutorials_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, os.pardir,
+                                   "tutorials")
+
+# Tutorials, and keyword arguments for the initialization of the testing set (which are evaluated in the namespace
+# of the tutorial, since they may require some classes defined or imported there)
+tutorials = {
+    "thermal_block": ("01_thermal_block/tutorial_thermal_block.ipynb", ""),
+    "thermal_block_unsteady": ("06_thermal_block_unsteady/tutorial_thermal_block_unsteady_1_rb.ipynb", ""),
+    "nonlinear_elliptic": ("07_nonlinear_elliptic/tutorial_nonlinear_elliptic_deim.ipynb", "DEIM=ntest"),
+    "stokes": ("12_stokes/tutorial_stokes_1_rb.ipynb", "sampling=LinearlyDependentUniformDistribution()"),
+    "navier_stokes": ("17_navier_stokes/tutorial_navier_stokes_1_exact.ipynb", "sampling=EquispacedDistribution()")
+}
+
+# Reduced-size configurations: the size of training and testing sets is capped
+ntrain = 10
+ntest = 4
+
+
+@pytest.fixture(scope="module")
+def tutorials_copy(tmp_path_factory):
+    """
+    Copy the tutorials to a temporary directory, which is shared by all processes.
+    """
+    if COMM_WORLD.rank == 0:
+        directory = str(tmp_path_factory.mktemp("tutorials"))
+        for (filename, _) in tutorials.values():
+            tutorial_directory = os.path.dirname(filename)
+            if not os.path.exists(os.path.join(directory, tutorial_directory)):
+                shutil.copytree(os.path.join(tutorials_directory, tutorial_directory),
+                                os.path.join(directory, tutorial_directory),
+                                ignore=shutil.ignore_patterns("__pycache__", ".ipynb_checkpoints"))
+    else:
+        directory = None
+    directory = COMM_WORLD.bcast(directory, root=0)
+    yield directory
+    _all_tutorials.clear()  # tutorials ran in the temporary copy cannot be reused afterwards
+
+
+@pytest.fixture(scope="module", autouse=True)
+def jupyter_mode():
+    """
+    Tutorials are run several times in the same process, as it happens when re-running notebook cells in jupyter,
+    so problems and reduction methods with the same name are allowed to replace previous ones.
+    """
+    modules = [sys.modules["rbnics.utils.decorators." + module_name] for module_name in (
+        "customize_reduced_problem_for", "customize_reduction_method_for", "store_map_from_problem_name_to_problem",
+        "store_map_from_problem_to_reduced_problem", "store_map_from_problem_to_reduction_method")]
+    original_is_jupyter = [module.is_jupyter for module in modules]
+    for module in modules:
+        module.is_jupyter = lambda: True
+    yield
+    for (module, is_jupyter) in zip(modules, original_is_jupyter):
+        module.is_jupyter = is_jupyter
+
+
+class StopTutorial(Exception):
+    def __init__(self, reduction_method):
+        self.reduction_method = reduction_method
+
+
+class Tutorial(object):
+    def __init__(self, name, directory):
+        (filename, testing_set_kwargs) = tutorials[name]
+        self.directory = os.path.dirname(os.path.join(directory, filename))
+        self.filename = os.path.join(directory, filename)
+        self.testing_set_kwargs = testing_set_kwargs
+        self.namespace = None
+        self.reduction_method = None
+        self.reduced_problem = None
+
+    def run_until_offline(self):
+        """
+        Run the tutorial until the beginning of the offline stage, with training and testing sets of reduced size.
+        The tutorial directory is expected to be both the current directory and in the import path.
+        """
+        import rbnics.reduction_methods.base
+        from nbconvert.exporters import PythonExporter
+        ReductionMethod = rbnics.reduction_methods.base.ReductionMethod
+        DifferentialProblemReductionMethod = rbnics.reduction_methods.base.DifferentialProblemReductionMethod
+        original_initialize_training_set = ReductionMethod.initialize_training_set
+        original_initialize_testing_set = ReductionMethod.initialize_testing_set
+
+        def initialize_training_set(self_, mu_range, ntrain_, enable_import=True, sampling=None, **kwargs):
+            import_successful = original_initialize_training_set(
+                self_, mu_range, min(ntrain_, ntrain), enable_import, sampling, **kwargs)
+            if isinstance(self_, DifferentialProblemReductionMethod):
+                def offline(self__):
+                    raise StopTutorial(self__)
+
+                PatchInstanceMethod(self_, "offline", offline).patch()
+            return import_successful
+
+        def initialize_testing_set(self_, mu_range, ntest_, enable_import=False, sampling=None, **kwargs):
+            return original_initialize_testing_set(
+                self_, mu_range, min(ntest_, ntest), enable_import, sampling, **kwargs)
+
+        ReductionMethod.initialize_training_set = initialize_training_set
+        ReductionMethod.initialize_testing_set = initialize_testing_set
+        (code, _) = PythonExporter().from_filename(self.filename)
+        self.namespace = {"__name__": "tutorial"}
+        disable_matplotlib()
+        try:
+            exec(compile(code, self.filename, "exec"), self.namespace)
+        except StopTutorial as stop:
+            self.reduction_method = stop.reduction_method
+            del self.reduction_method.offline  # remove the patch which stopped the tutorial
+        else:
+            raise RuntimeError("The tutorial " + self.filename + " never called offline()")
+        finally:
+            ReductionMethod.initialize_training_set = original_initialize_training_set
+            ReductionMethod.initialize_testing_set = original_initialize_testing_set
+            enable_matplotlib()
+
+    def remove_offline_data(self):
+        """
+        Remove offline data and the truth cache, so that the next offline stage starts from scratch.
+        """
+        top_folder = str(self.reduction_method.truth_problem.folder_prefix).split(os.path.sep)[0]
+
+        def remove_offline_data_task():
+            if os.path.exists(os.path.join(self.directory, top_folder)):
+                shutil.rmtree(os.path.join(self.directory, top_folder))
+
+        parallel_io(remove_offline_data_task)
+
+    def remove_truth_cache(self):
+        """
+        Remove the truth cache, so that truth solves in the error analysis are actually carried out.
+        """
+        cache_folder = self.reduction_method.truth_problem.folder["cache"]
+
+        def remove_truth_cache_task():
+            if os.path.exists(os.path.join(self.directory, str(cache_folder))):
+                shutil.rmtree(os.path.join(self.directory, str(cache_folder)))
+
+        parallel_io(remove_truth_cache_task)
+        cache_folder.create()
+
+    def offline(self):
+        if self.reduced_problem is None:
+            self.reduced_problem = self.reduction_method.offline()
+            testing_set_kwargs = eval("dict(" + self.testing_set_kwargs + ")", self.namespace, {"ntest": ntest})
+            self.reduction_method.initialize_testing_set(ntest, enable_import=True, **testing_set_kwargs)
+        return self.reduced_problem
+
+
+_all_tutorials = dict()
+
+
+def get_tutorial(name, directory):
+    """
+    Return the tutorial, after its offline stage has been carried out. Tutorials are run only once per module.
+    """
+    if name not in _all_tutorials:
+        tutorial = Tutorial(name, directory)
+        tutorial.run_until_offline()
+        tutorial.offline()
+        _all_tutorials[name] = tutorial
+    return _all_tutorials[name]
+
+
+class Data(object):
+    def __init__(self, name, directory):
+        self.name = name
+        self.directory = directory
+
+    def generate_offline(self):
+        _all_tutorials.pop(self.name, None)  # offline data are going to be removed
+        tutorial = Tutorial(self.name, self.directory)
+        tutorial.run_until_offline()
+        tutorial.remove_offline_data()
+        return (tutorial, )
+
+    def evaluate_offline(self, tutorial):
+        return tutorial.reduction_method.offline()
+
+    def generate_online(self):
+        tutorial = get_tutorial(self.name, self.directory)
+        return (tutorial.reduced_problem, tutorial.reduction_method.testing_set)
+
+    def evaluate_online(self, reduced_problem, testing_set):
+        # Clear caches, so that reduced solutions are actually computed
+        for (attribute_name, attribute) in vars(reduced_problem).items():
+            if attribute_name.endswith("_cache") and hasattr(attribute, "clear"):
+                attribute.clear()
+        for mu in testing_set:
+            reduced_problem.set_mu(mu)
+            reduced_problem.solve()
+            reduced_problem.compute_output()
+
+    def generate_error_analysis(self):
+        tutorial = get_tutorial(self.name, self.directory)
+        tutorial.remove_truth_cache()
+        return (tutorial.reduction_method, )
+
+    def evaluate_error_analysis(self, reduction_method):
+        reduction_method.error_analysis()
+
+
+@pytest.mark.parametrize("name", list(tutorials.keys()))
+@pytest.mark.parametrize("phase", ["offline", "online", "error_analysis"])
+def test_tutorials(name, phase, benchmark, tutorials_copy, monkeypatch):
+    # Tutorials read their data and import their auxiliary modules from their own directory
+    tutorial_directory = os.path.dirname(os.path.join(tutorials_copy, tutorials[name][0]))
+    monkeypatch.chdir(tutorial_directory)
+    monkeypatch.syspath_prepend(tutorial_directory)
+    data = Data(name, tutorials_copy)
+    print("Testing", name, phase)
+    benchmark(getattr(data, "evaluate_" + phase), setup=getattr(data, "generate_" + phase))
@@ -0,0 +1,43 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import isclose, linspace
+from dolfin import (assemble, dx, Expression, FunctionSpace, inner, interpolate, TestFunction, TrialFunction,
+                    UnitSquareMesh)
+from rbnics.backends.dolfin import ProperOrthogonalDecomposition
+
+
+def _compute_POD(method, Nmax):
+    mesh = UnitSquareMesh(20, 20)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    u = TrialFunction(V)
+    v = TestFunction(V)
+    X = assemble(inner(u, v) * dx)
+
+    POD = ProperOrthogonalDecomposition(V, X)
+    POD.set_parameters({"method": method})
+    for mu in linspace(1., 3., 100):
+        snapshot = interpolate(Expression("exp(-mu*x[0])*sin(mu*pi*x[1])", mu=mu, element=V.ufl_element()), V)
+        POD.store_snapshot(snapshot)
+    (eigenvalues, _, basis_functions, N) = POD.apply(Nmax, 0.)
+    return (eigenvalues, POD.retained_energy, basis_functions, N, X)
+
+
+# Test that truncated, randomized and incremental POD compute the same leading modes as the full POD
+@pytest.mark.parametrize("method", ["truncated", "randomized", "incremental"])
+def test_proper_orthogonal_decomposition_methods(method):
+    Nmax = 4
+    (eigenvalues_full, retained_energy_full, _, N_full, _) = _compute_POD("full", Nmax)
+    (eigenvalues, retained_energy, basis_functions, N, X) = _compute_POD(method, Nmax)
+    assert N == N_full == Nmax
+    assert len(eigenvalues) == Nmax
+    assert isclose(eigenvalues, eigenvalues_full, rtol=1e-6).all()
+    for i in range(Nmax):
+        assert isclose(retained_energy[i], retained_energy_full[i], rtol=1e-6)
+    for (i, basis_i) in enumerate(basis_functions):
+        for (j, basis_j) in enumerate(basis_functions):
+            assert isclose(basis_i.vector().inner(X * basis_j.vector()), 1. if i == j else 0., atol=1e-8)
@@ -0,0 +1,90 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import glob
+import os
+import pytest
+from mpi4py.MPI import COMM_WORLD
+from numpy import isclose
+from dolfin import Expression, FiniteElement, Function, FunctionSpace, interpolate, MixedElement, UnitSquareMesh
+from dolfin_utils.test import fixture as module_fixture
+from rbnics.backends.dolfin import SnapshotStore
+from rbnics.sampling.executors import ProcessPoolExecutor
+
+
+# Meshes
+@module_fixture
+def mesh():
+    return UnitSquareMesh(10, 10)
+
+
+# Scalar and mixed spaces
+def generate_scalar_space_and_expression(mesh):
+    V = FunctionSpace(mesh, "Lagrange", 2)
+    return (V, Expression("x[0] + mu*x[1]", mu=0., element=V.ufl_element()))
+
+
+def generate_mixed_space_and_expression(mesh):
+    element_0 = FiniteElement("Lagrange", mesh.ufl_cell(), 2)
+    element_1 = FiniteElement("Lagrange", mesh.ufl_cell(), 1)
+    V = FunctionSpace(mesh, MixedElement(element_0, element_1))
+    return (V, Expression(("x[0] + mu*x[1]", "mu*x[0]"), mu=0., element=V.ufl_element()))
+
+
+# Tests
+@pytest.mark.parametrize("generate_space_and_expression", [
+    generate_scalar_space_and_expression, generate_mixed_space_and_expression])
+def test_snapshot_store(mesh, generate_space_and_expression, tempdir):
+    (V, expression) = generate_space_and_expression(mesh)
+    store = SnapshotStore(V, tempdir, "snapshot_store")
+    # Save snapshots and outputs
+    snapshots = dict()
+    for mu in range(3):
+        expression.mu = mu
+        snapshots["key_" + str(mu)] = interpolate(expression, V)
+        store.save(snapshots["key_" + str(mu)], "key_" + str(mu))
+        store.save([mu / 2.], "key_" + str(mu))
+    # Load them back in
+    for mu in range(3):
+        loaded_snapshot = Function(V)
+        store.load(loaded_snapshot, "key_" + str(mu))
+        assert isclose(loaded_snapshot.vector().get_local(), snapshots["key_" + str(mu)].vector().get_local()).all()
+        loaded_output = [0.]
+        store.load(loaded_output, "key_" + str(mu))
+        assert isclose(loaded_output[0], mu / 2.)
+    # Missing keys are reported as OSError, as for other disk storage of the cache
+    with pytest.raises(OSError):
+        store.load(Function(V), "key_3")
+    # Outputs of problems without any output are not stored
+    store.save(interpolate(expression, V), "key_3")
+    store.save([NotImplemented], "key_3")
+    with pytest.raises(OSError):
+        store.load([0.], "key_3")
+
+
+# Concurrent writes from the worker processes of an executor are stored in separate shards
+@pytest.mark.skipif(COMM_WORLD.size > 1, reason="Process pool executor cannot be used in parallel")
+def test_snapshot_store_process_pool_executor(mesh, tempdir):
+    (V, expression) = generate_scalar_space_and_expression(mesh)
+    store = SnapshotStore(V, tempdir, "snapshot_store")
+
+    def save_task(mu):
+        expression.mu = mu
+        store.save(interpolate(expression, V), "key_" + str(mu))
+        store.save([mu / 2.], "key_" + str(mu))
+
+    ProcessPoolExecutor(processes=4).execute(save_task, range(8))
+    assert not os.path.exists(store.filename())
+    assert len(glob.glob(os.path.join(tempdir, "snapshot_store_*.h5"))) > 1
+    # Load them back in from the main process
+    for mu in range(8):
+        expression.mu = mu
+        loaded_snapshot = Function(V)
+        store.load(loaded_snapshot, "key_" + str(mu))
+        assert isclose(loaded_snapshot.vector().get_local(), interpolate(expression, V).vector().get_local()).all()
+        loaded_output = [0.]
+        store.load(loaded_output, "key_" + str(mu))
+        assert isclose(loaded_output[0], mu / 2.)
@@ -0,0 +1,34 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import isclose, linspace
+from dolfin import (assemble, dx, Expression, FunctionSpace, grad, inner, interpolate, TestFunction, TrialFunction,
+                    UnitSquareMesh)
+from rbnics.backends import BasisFunctionsMatrix, transpose
+
+
+# Test that transpose(v) * A * Z, which requires the product of the transpose of A with v, agrees with
+# transpose(v) * A * Z_j for every basis function Z_j, on a non symmetric matrix A
+def test_transpose_vector_times_matrix_times_basis_functions_matrix():
+    mesh = UnitSquareMesh(10, 10)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    u = TrialFunction(V)
+    v = TestFunction(V)
+    A = assemble(inner(grad(u), grad(v)) * dx + u.dx(0) * v * dx)
+    w = interpolate(Expression("x[0]*x[1]", element=V.ufl_element()), V)
+
+    Z = BasisFunctionsMatrix(V)
+    Z.init(["u"])
+    functions = list()
+    for mu in linspace(1., 3., 4):
+        function = interpolate(Expression("exp(-mu*x[0])*sin(mu*pi*x[1])", mu=mu, element=V.ufl_element()), V)
+        Z.enrich(function)
+        functions.append(function)
+
+    output = transpose(w) * A * Z
+    assert output.N == len(functions)
+    for (j, function_j) in enumerate(functions):
+        assert isclose(output[j], transpose(w) * A * function_j)
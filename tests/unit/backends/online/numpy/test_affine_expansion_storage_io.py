@@ -0,0 +1,48 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import pytest
+from numpy import isclose
+from numpy.random import rand
+from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineMatrix, OnlineVector
+
+
+def generate_matrix(N):
+    matrix = OnlineMatrix(N, N)
+    matrix[:, :] = rand(N, N)
+    return matrix
+
+
+def generate_vector(N):
+    vector = OnlineVector(N)
+    vector[:] = rand(N)
+    return vector
+
+
+def generate_scalar(N):
+    return rand()
+
+
+# Test that the affine expansion storage is saved to a single packed file, and that it is correctly loaded back
+@pytest.mark.parametrize("generate_item", [generate_matrix, generate_vector, generate_scalar])
+@pytest.mark.parametrize("shape", [(3, ), (3, 4)])
+def test_affine_expansion_storage_io(generate_item, shape, tempdir):
+    N = 5
+    storage = OnlineAffineExpansionStorage(*shape)
+    if len(shape) == 1:
+        keys = [q for q in range(shape[0])]
+    else:
+        keys = [(q, r) for q in range(shape[0]) for r in range(shape[1])]
+    for key in keys:
+        storage[key] = generate_item(N)
+    storage.save(tempdir, "storage")
+    assert sorted(os.listdir(os.path.join(tempdir, "storage"))) == ["content.npy", "header.txt"]
+
+    loaded_storage = OnlineAffineExpansionStorage(*shape)
+    assert loaded_storage.load(tempdir, "storage")
+    for key in keys:
+        assert isclose(loaded_storage[key], storage[key]).all()
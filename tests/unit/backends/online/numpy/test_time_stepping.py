@@ -0,0 +1,116 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import eye, isclose, sin
+from numpy.linalg import solve
+from numpy.random import rand
+from rbnics.backends.abstract import TimeDependentProblemWrapper
+from rbnics.backends.online.numpy import Function, Matrix, TimeStepping, Vector
+
+
+# Test the implicit Euler integrator on M u_dot + A u = sin(t) f, with time independent M and A
+@pytest.mark.parametrize("time_independent_jacobian", [False, True])
+def test_time_stepping_time_independent_jacobian(time_independent_jacobian):
+    N = 4
+    (dt, T) = (0.01, 1.)
+    M = eye(N) + 0.1 * rand(N, N)
+    A = eye(N) + 0.1 * rand(N, N)
+    f = rand(N)
+    jacobian_evaluations = list()
+
+    class ProblemWrapper(TimeDependentProblemWrapper):
+        def residual_eval(self, t, solution, solution_dot):
+            residual = Vector(N)
+            residual[:] = M.dot(solution_dot.vector()) + A.dot(solution.vector()) - sin(t) * f
+            return residual
+
+        def jacobian_eval(self, t, solution, solution_dot, solution_dot_coefficient):
+            jacobian_evaluations.append(t)
+            jacobian = Matrix(N, N)
+            jacobian[:, :] = solution_dot_coefficient * M + A
+            return jacobian
+
+        def bc_eval(self, t):
+            return None
+
+        def ic_eval(self):
+            return None
+
+        def monitor(self, t, solution, solution_dot):
+            pass
+
+    (solution, solution_dot) = (Function(N), Function(N))
+    solver = TimeStepping(ProblemWrapper(), solution, solution_dot)
+    solver.set_parameters({
+        "initial_time": 0.,
+        "time_step_size": dt,
+        "final_time": T,
+        "integrator_type": "beuler",
+        "problem_type": "linear",
+        "time_independent_jacobian": time_independent_jacobian
+    })
+    solver.solve()
+
+    # Compare to a step by step implicit Euler
+    expected_solution = 0. * f
+    n_steps = int(round(T / dt))
+    for n in range(1, n_steps + 1):
+        expected_solution = solve(M / dt + A, M.dot(expected_solution) / dt + sin(n * dt) * f)
+    assert isclose(solution.vector(), expected_solution).all()
+    if time_independent_jacobian:
+        assert len(jacobian_evaluations) == 1
+    else:
+        assert len(jacobian_evaluations) == n_steps
+
+
+# Test the implicit Euler integrator on M u_dot + A(t) u = f, with a time dependent A(t) = A + t B which
+# is updated in place in the same matrix at every time step
+def test_time_stepping_jacobian_updated_in_place():
+    N = 4
+    (dt, T) = (0.01, 1.)
+    M = eye(N) + 0.1 * rand(N, N)
+    A = eye(N) + 0.1 * rand(N, N)
+    B = rand(N, N)
+    f = rand(N)
+    jacobian = Matrix(N, N)
+
+    class ProblemWrapper(TimeDependentProblemWrapper):
+        def residual_eval(self, t, solution, solution_dot):
+            residual = Vector(N)
+            residual[:] = M.dot(solution_dot.vector()) + (A + t * B).dot(solution.vector()) - f
+            return residual
+
+        def jacobian_eval(self, t, solution, solution_dot, solution_dot_coefficient):
+            jacobian[:, :] = solution_dot_coefficient * M + A + t * B
+            return jacobian
+
+        def bc_eval(self, t):
+            return None
+
+        def ic_eval(self):
+            return None
+
+        def monitor(self, t, solution, solution_dot):
+            pass
+
+    (solution, solution_dot) = (Function(N), Function(N))
+    solver = TimeStepping(ProblemWrapper(), solution, solution_dot)
+    solver.set_parameters({
+        "initial_time": 0.,
+        "time_step_size": dt,
+        "final_time": T,
+        "integrator_type": "beuler",
+        "problem_type": "linear"
+    })
+    solver.solve()
+
+    # Compare to a step by step implicit Euler
+    expected_solution = 0. * f
+    n_steps = int(round(T / dt))
+    for n in range(1, n_steps + 1):
+        expected_solution = solve(M / dt + A + n * dt * B, M.dot(expected_solution) / dt + f)
+    assert isclose(solution.vector(), expected_solution).all()
@@ -0,0 +1,29 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import isclose
+from numpy.random import rand
+from rbnics.backends.online.numpy import Function, Matrix, transpose, Vector
+from rbnics.backends.online.numpy.wrapping import function_to_vector, vector_mul_matrix, vector_mul_vector
+
+# Common data
+N = 5
+
+
+# Test the product of the transpose of a (non symmetric) matrix with a vector, which is used to compute
+# transpose(v) * A * Z
+def test_vector_mul_matrix():
+    A = Matrix(N, N)
+    A[:, :] = rand(N, N)
+    v = Vector(N)
+    v[:] = rand(N)
+    w = Function(N)
+    w.vector()[:] = rand(N)
+    vector_times_matrix = vector_mul_matrix(v, A)
+    assert vector_times_matrix.shape == (N, )
+    for j in range(N):
+        assert isclose(vector_times_matrix[j], sum(v[i] * A[i, j] for i in range(N)))
+    assert isclose(vector_mul_vector(vector_times_matrix, function_to_vector(w)), transpose(v) * A * w)
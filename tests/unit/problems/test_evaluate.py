@@ -0,0 +1,109 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from numpy import array, isclose
+from dolfin import (CompiledSubDomain, Constant, DirichletBC, FunctionSpace, grad, inner, Measure, MeshFunction,
+                    TestFunction, TrialFunction, UnitSquareMesh)
+from rbnics import EllipticCoerciveCompliantProblem, ReducedBasis
+
+
+def _ThermalBlock(folder):
+
+    class ThermalBlock(EllipticCoerciveCompliantProblem):
+        def __init__(self, V, **kwargs):
+            EllipticCoerciveCompliantProblem.__init__(self, V, **kwargs)
+            self.subdomains, self.boundaries = kwargs["subdomains"], kwargs["boundaries"]
+            self.u = TrialFunction(V)
+            self.v = TestFunction(V)
+            self.dx = Measure("dx")(subdomain_data=self.subdomains)
+            self.ds = Measure("ds")(subdomain_data=self.boundaries)
+
+        def name(self):
+            return os.path.join(folder, "ThermalBlock")
+
+        def get_stability_factor_lower_bound(self):
+            return min(self.compute_theta("a"))
+
+        def compute_theta(self, term):
+            mu = self.mu
+            if term == "a":
+                return (mu[0], 1.)
+            elif term == "f":
+                return (mu[1], )
+            else:
+                raise ValueError("Invalid term for compute_theta().")
+
+        def assemble_operator(self, term):
+            v = self.v
+            dx = self.dx
+            if term == "a":
+                u = self.u
+                return (inner(grad(u), grad(v)) * dx(1), inner(grad(u), grad(v)) * dx(2))
+            elif term == "f":
+                return (v * self.ds(1), )
+            elif term == "dirichlet_bc":
+                return ([DirichletBC(self.V, Constant(0.), self.boundaries, 3)], )
+            elif term == "inner_product":
+                u = self.u
+                return (inner(grad(u), grad(v)) * dx, )
+            else:
+                raise ValueError("Invalid term for assemble_operator().")
+
+    return ThermalBlock
+
+
+# Test that online queries carried out concurrently by evaluate() agree with sequential ones, and do not change
+# the state of the shared reduced problem
+def test_evaluate_thread_pool(tempdir):
+    mesh = UnitSquareMesh(16, 16)
+    subdomains = MeshFunction("size_t", mesh, mesh.topology().dim(), 2)
+    CompiledSubDomain("x[0] <= 0.5").mark(subdomains, 1)
+    boundaries = MeshFunction("size_t", mesh, mesh.topology().dim() - 1, 0)
+    CompiledSubDomain("on_boundary && near(x[0], 1.)").mark(boundaries, 1)
+    CompiledSubDomain("on_boundary && near(x[0], 0.)").mark(boundaries, 3)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    problem = _ThermalBlock(tempdir)(V, subdomains=subdomains, boundaries=boundaries)
+    problem.set_mu_range([(0.1, 10.), (-1., 1.)])
+    reduction_method = ReducedBasis(problem)
+    reduction_method.set_Nmax(4)
+    reduction_method.initialize_training_set(20)
+    reduced_problem = reduction_method.offline()
+
+    # Sequential online queries, which change the parameter of the reduced problem
+    online_mus = [(0.1 + 1.2 * i, -1. + 0.25 * i) for i in range(9)]
+    expected = list()
+    for mu in online_mus:
+        reduced_problem.set_mu(mu)
+        solution = reduced_problem.solve()
+        output = reduced_problem.compute_output()
+        error_estimate = reduced_problem.estimate_error()
+        expected.append((array(solution.vector()), output, error_estimate))
+
+    # Concurrent online queries through evaluate()
+    reduced_problem.set_mu((5., 0.5))
+    reduced_solution = reduced_problem.solve()
+    reduced_solution_values = array(reduced_solution.vector())
+    reduced_output = reduced_problem.compute_output()
+    solution_cache_size = len(reduced_problem._solution_cache)
+    output_cache_size = len(reduced_problem._output_cache)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        evaluated = list(executor.map(
+            lambda mu: reduced_problem.evaluate(mu, outputs=("solution", "output", "error_estimate")), online_mus))
+    for ((expected_solution, expected_output, expected_error_estimate), evaluated_mu) in zip(expected, evaluated):
+        assert isclose(array(evaluated_mu["solution"].vector()), expected_solution).all()
+        assert isclose(evaluated_mu["output"], expected_output)
+        assert isclose(evaluated_mu["error_estimate"], expected_error_estimate)
+
+    # The state of the reduced problem (and of its truth problem) is unchanged
+    assert reduced_problem.mu == (5., 0.5)
+    assert problem.mu == (5., 0.5)
+    assert reduced_problem._solution is reduced_solution
+    assert isclose(array(reduced_solution.vector()), reduced_solution_values).all()
+    assert reduced_problem._output == reduced_output
+    assert len(reduced_problem._solution_cache) == solution_cache_size
+    assert len(reduced_problem._output_cache) == output_cache_size
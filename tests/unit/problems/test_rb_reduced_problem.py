@@ -0,0 +1,109 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+from numpy import array, isclose
+from dolfin import (CompiledSubDomain, Constant, DirichletBC, FunctionSpace, grad, inner, Measure, MeshFunction,
+                    TestFunction, TrialFunction, UnitSquareMesh)
+from rbnics import EllipticCoerciveProblem, ReducedBasis
+from rbnics.backends import transpose
+
+
+def _ThermalBlock(folder):
+
+    class ThermalBlock(EllipticCoerciveProblem):
+        def __init__(self, V, **kwargs):
+            EllipticCoerciveProblem.__init__(self, V, **kwargs)
+            self.subdomains, self.boundaries = kwargs["subdomains"], kwargs["boundaries"]
+            self.u = TrialFunction(V)
+            self.v = TestFunction(V)
+            self.dx = Measure("dx")(subdomain_data=self.subdomains)
+            self.ds = Measure("ds")(subdomain_data=self.boundaries)
+
+        def name(self):
+            return os.path.join(folder, "ThermalBlock")
+
+        def get_stability_factor_lower_bound(self):
+            return min(self.compute_theta("a"))
+
+        def compute_theta(self, term):
+            mu = self.mu
+            if term == "a":
+                return (mu[0], 1.)
+            elif term == "f":
+                return (mu[1], 1.)
+            else:
+                raise ValueError("Invalid term for compute_theta().")
+
+        def assemble_operator(self, term):
+            v = self.v
+            dx = self.dx
+            if term == "a":
+                u = self.u
+                return (inner(grad(u), grad(v)) * dx(1), inner(grad(u), grad(v)) * dx(2))
+            elif term == "f":
+                return (v * self.ds(1), v * dx)
+            elif term == "dirichlet_bc":
+                return ([DirichletBC(self.V, Constant(0.), self.boundaries, 3)], )
+            elif term == "inner_product":
+                u = self.u
+                return (inner(grad(u), grad(v)) * dx, )
+            else:
+                raise ValueError("Invalid term for assemble_operator().")
+
+    return ThermalBlock
+
+
+def _offline(folder, Nmax, incremental_build_reduced_operators=False):
+    mesh = UnitSquareMesh(16, 16)
+    subdomains = MeshFunction("size_t", mesh, mesh.topology().dim(), 2)
+    CompiledSubDomain("x[0] <= 0.5").mark(subdomains, 1)
+    boundaries = MeshFunction("size_t", mesh, mesh.topology().dim() - 1, 0)
+    CompiledSubDomain("on_boundary && near(x[0], 1.)").mark(boundaries, 1)
+    CompiledSubDomain("on_boundary && near(x[0], 0.)").mark(boundaries, 3)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    problem = _ThermalBlock(folder)(V, subdomains=subdomains, boundaries=boundaries)
+    problem.set_mu_range([(0.1, 10.), (-1., 1.)])
+    reduction_method = ReducedBasis(problem)
+    reduction_method.set_Nmax(Nmax)
+    reduction_method.set_incremental_build_reduced_operators(incremental_build_reduced_operators)
+    reduction_method.initialize_training_set(20)
+    return reduction_method.offline()
+
+
+# Test that error estimation operators assembled incrementally, one basis function at a time during the greedy,
+# agree with the ones assembled from scratch with all Riesz representers
+def test_error_estimation_operators_incremental_assembly(tempdir):
+    reduced_problem = _offline(tempdir, 4)
+    assert reduced_problem.N == 4
+    X = reduced_problem._error_estimation_inner_product
+    riesz = reduced_problem.riesz
+    for term in reduced_problem.error_estimation_terms:
+        if reduced_problem.terms_order[term[0]] == 1:
+            continue  # assembled only once, since it does not depend on the basis
+        for q0 in range(reduced_problem.Q[term[0]]):
+            for q1 in range(reduced_problem.Q[term[1]]):
+                if reduced_problem.terms_order[term[1]] == 2:
+                    expected = transpose(riesz[term[0]][q0]) * X * riesz[term[1]][q1]
+                else:
+                    expected = transpose(riesz[term[0]][q0]) * X * riesz[term[1]][q1][0]
+                assert isclose(array(reduced_problem.error_estimation_operator[term][q0, q1]), array(expected)).all()
+
+
+# Test that reduced operators built incrementally, only projecting new basis functions during the greedy,
+# agree with the ones projected from scratch onto the whole reduced basis
+def test_build_reduced_operators_incremental(tempdir):
+    reduced_problem = _offline(tempdir, 4, incremental_build_reduced_operators=True)
+    assert reduced_problem.N == 4
+    Z = reduced_problem.basis_functions
+    truth_problem = reduced_problem.truth_problem
+    for term in reduced_problem.terms:
+        for q in range(reduced_problem.Q[term]):
+            if reduced_problem.terms_order[term] == 2:
+                expected = transpose(Z) * truth_problem.operator[term][q] * Z
+            else:
+                expected = transpose(Z) * truth_problem.operator[term][q]
+            assert isclose(array(reduced_problem.operator[term][q]), array(expected)).all()
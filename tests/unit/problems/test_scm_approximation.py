@@ -0,0 +1,153 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+from numpy import isclose, zeros
+from dolfin import (CompiledSubDomain, Constant, DirichletBC, FunctionSpace, grad, inner, Measure, MeshFunction,
+                    TestFunction, TrialFunction, UnitSquareMesh)
+from rbnics import (assemble_operator_for_stability_factor, compute_theta_for_stability_factor,
+                    EllipticCoerciveProblem, generate_function_space_for_stability_factor, ReducedBasis, SCM)
+from rbnics.utils.test import PatchInstanceMethod
+
+
+def _ThermalBlock(folder):
+
+    @SCM()
+    class ThermalBlock(EllipticCoerciveProblem):
+        @generate_function_space_for_stability_factor
+        def __init__(self, V, **kwargs):
+            EllipticCoerciveProblem.__init__(self, V, **kwargs)
+            self.subdomains, self.boundaries = kwargs["subdomains"], kwargs["boundaries"]
+            self.u = TrialFunction(V)
+            self.v = TestFunction(V)
+            self.dx = Measure("dx")(subdomain_data=self.subdomains)
+            self.ds = Measure("ds")(subdomain_data=self.boundaries)
+            self._eigen_solver_parameters.update({
+                "bounding_box_minimum": {
+                    "problem_type": "gen_hermitian", "spectral_transform": "shift-and-invert",
+                    "spectral_shift": 1.e-5, "linear_solver": "mumps"
+                },
+                "bounding_box_maximum": {
+                    "problem_type": "gen_hermitian", "spectral_transform": "shift-and-invert",
+                    "spectral_shift": 1.e5, "linear_solver": "mumps"
+                },
+                "stability_factor": {
+                    "problem_type": "gen_hermitian", "spectral_transform": "shift-and-invert",
+                    "spectral_shift": 1.e-5, "linear_solver": "mumps"
+                }
+            })
+
+        def name(self):
+            return os.path.join(folder, "ThermalBlock")
+
+        @compute_theta_for_stability_factor
+        def compute_theta(self, term):
+            mu = self.mu
+            if term == "a":
+                return (mu[0], mu[1])
+            elif term == "f":
+                return (1., )
+            else:
+                raise ValueError("Invalid term for compute_theta().")
+
+        @assemble_operator_for_stability_factor
+        def assemble_operator(self, term):
+            v = self.v
+            dx = self.dx
+            if term == "a":
+                u = self.u
+                return (inner(grad(u), grad(v)) * dx(1), inner(grad(u), grad(v)) * dx(2))
+            elif term == "f":
+                return (v * self.ds(1), )
+            elif term == "dirichlet_bc":
+                return ([DirichletBC(self.V, Constant(0.), self.boundaries, 3)], )
+            elif term == "inner_product":
+                u = self.u
+                return (inner(grad(u), grad(v)) * dx, )
+            else:
+                raise ValueError("Invalid term for assemble_operator().")
+
+    return ThermalBlock
+
+
+def _offline(folder):
+    mesh = UnitSquareMesh(16, 16)
+    subdomains = MeshFunction("size_t", mesh, mesh.topology().dim(), 2)
+    CompiledSubDomain("x[0] <= 0.5").mark(subdomains, 1)
+    boundaries = MeshFunction("size_t", mesh, mesh.topology().dim() - 1, 0)
+    CompiledSubDomain("on_boundary && near(x[0], 1.)").mark(boundaries, 1)
+    CompiledSubDomain("on_boundary && near(x[0], 0.)").mark(boundaries, 3)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    problem = _ThermalBlock(folder)(V, subdomains=subdomains, boundaries=boundaries)
+    problem.set_mu_range([(0.1, 10.), (0.1, 10.)])
+    reduction_method = ReducedBasis(problem)
+    reduction_method.set_Nmax(3, SCM=4)
+    reduction_method.set_tolerance(0., SCM=0.)
+    reduction_method.initialize_training_set(20, SCM=20)
+    reduction_method.offline()
+    reduction_method.initialize_testing_set(5, SCM=5)
+    return reduction_method
+
+
+# Assemble constraints of the SCM linear program one row at a time, setting each parameter in the training set
+def _compute_training_set_theta_row_by_row(self, parameters):
+    Q = self.truth_problem.Q["stability_factor_left_hand_matrix"]
+    theta = zeros((len(parameters), Q))
+    mu_bak = self.mu
+    for (j, parameter) in enumerate(parameters):
+        self.set_mu(parameter)
+        current_theta = self.truth_problem.compute_theta("stability_factor_left_hand_matrix")
+        for q in range(Q):
+            theta[j, q] = current_theta[q]
+    self.set_mu(mu_bak)
+    return theta
+
+
+def _compute_training_set_stability_factor_row_by_row(self, parameters):
+    stability_factor = zeros(len(parameters))
+    mu_bak = self.mu
+    for (j, parameter) in enumerate(parameters):
+        self.set_mu(parameter)
+        (stability_factor[j], _) = self.evaluate_stability_factor()
+    self.set_mu(mu_bak)
+    return stability_factor
+
+
+# Compute the lower bound without reading it from the cache, so that lower bounds which appear in the right-hand
+# side of the constraints are computed again as well
+def _get_stability_factor_lower_bound_uncached(self, N=None):
+    if N is None:
+        N = self.N
+    self._get_stability_factor_lower_bound(N)
+    return self._stability_factor_lower_bound
+
+
+# Test that SCM lower bounds computed for many parameters at once, with constraints assembled by slicing the data
+# stored at parameters in the training set, agree with the ones assembled one row at a time
+def test_scm_stability_factor_lower_bound_batched(tempdir):
+    reduction_method = _offline(tempdir)
+    SCM_approximation = reduction_method.SCM_reduction.SCM_approximation
+    assert SCM_approximation.N == 4
+    testing_set = reduction_method.SCM_reduction.testing_set
+    stability_factor_lower_bounds = SCM_approximation.get_stability_factor_lower_bound_batched(testing_set)
+    assert len(SCM_approximation._training_set_theta) > 0
+    assert len(SCM_approximation._training_set_stability_factor) > 0
+
+    PatchInstanceMethod(
+        SCM_approximation, "_compute_training_set_theta", _compute_training_set_theta_row_by_row).patch()
+    PatchInstanceMethod(
+        SCM_approximation, "_compute_training_set_stability_factor",
+        _compute_training_set_stability_factor_row_by_row).patch()
+    PatchInstanceMethod(
+        SCM_approximation, "get_stability_factor_lower_bound", _get_stability_factor_lower_bound_uncached).patch()
+    for (mu, stability_factor_lower_bound) in zip(testing_set, stability_factor_lower_bounds):
+        SCM_approximation.set_mu(mu)
+        assert isclose(SCM_approximation.get_stability_factor_lower_bound(), stability_factor_lower_bound)
+
+    # Data stored at parameters in the training set are cleared when a new training set is initialized
+    reduction_method.SCM_reduction.initialize_training_set(20)
+    assert len(SCM_approximation._training_set_theta) == 0
+    assert len(SCM_approximation._training_set_stability_factor) == 0
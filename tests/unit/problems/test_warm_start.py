@@ -0,0 +1,105 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import allclose, array
+from rbnics.backends.online import OnlineFunction, OnlineMatrix, OnlineVector
+from rbnics.problems.base.nonlinear_reduced_problem import NonlinearReducedProblem
+
+# Common data
+N = 3
+
+
+# Minimal reduced problem, providing only the members of ParametrizedReducedDifferentialProblem which are
+# required by NonlinearReducedProblem
+class ReducedProblem(object):
+    def __init__(self, truth_problem, **kwargs):
+        self.mu = None
+        self._solution = None
+
+    def set_mu(self, mu):
+        self.mu = mu
+
+    def solve(self, N):
+        self._solution = OnlineFunction(N)
+        self.ProblemSolver(self, N).solve()
+        return self._solution
+
+    def _cache_key_from_N_and_kwargs(self, N, **kwargs):
+        return (self.mu, N, tuple(sorted(kwargs.items())))
+
+    class ProblemSolver(object):
+        def __init__(self, problem, N, **kwargs):
+            self.problem = problem
+            self.N = N
+            self.kwargs = kwargs
+
+        def bc_eval(self):
+            return None
+
+        def monitor(self, solution):
+            pass
+
+
+NonlinearReducedProblemBase = NonlinearReducedProblem(ReducedProblem)
+
+
+# Reduced problem with residual u_i + u_i^3 - (i + 1) mu_0 - mu_1 = 0
+class CubicReducedProblem(NonlinearReducedProblemBase):
+    class ProblemSolver(NonlinearReducedProblemBase.ProblemSolver):
+        def residual_eval(self, solution):
+            u = array(list(solution.vector()))
+            residual = OnlineVector(self.N)
+            residual[:] = u + u**3 - self.problem.mu[0] * array(range(1, self.N + 1)) - self.problem.mu[1]
+            return residual
+
+        def jacobian_eval(self, solution):
+            u = array(list(solution.vector()))
+            jacobian = OnlineMatrix(self.N, self.N)
+            for i in range(self.N):
+                jacobian[i, i] = 1. + 3. * u[i]**2
+            return jacobian
+
+
+def solve(problem, mu):
+    problem.set_mu(mu)
+    return array(list(problem.solve(N).vector()))
+
+
+mus = [(1., 0.), (1.5, 0.5), (2., 1.), (1.75, 0.5), (1.25, 0.25)]
+
+
+@pytest.mark.parametrize("warm_start", ["nearest", "extrapolated"])
+def test_warm_start(warm_start):
+    cold_problem = CubicReducedProblem(None)
+    cold_problem._nonlinear_solver_parameters["absolute_tolerance"] = 1.e-12
+    warm_problem = CubicReducedProblem(None)
+    warm_problem._nonlinear_solver_parameters["absolute_tolerance"] = 1.e-12
+    warm_problem.set_warm_start(warm_start)
+    for mu in mus:
+        assert allclose(solve(warm_problem, mu), solve(cold_problem, mu))
+    assert cold_problem.warm_start_statistics.warm_solves == 0
+    assert cold_problem.warm_start_statistics.cold_solves == len(mus)
+    assert warm_problem.warm_start_statistics.warm_solves == len(mus) - 1
+    assert warm_problem.warm_start_statistics.cold_solves == 1
+
+
+@pytest.mark.parametrize("warm_start", ["nearest", "extrapolated"])
+def test_warm_start_repeated_parameter(warm_start):
+    cold_problem = CubicReducedProblem(None)
+    warm_problem = CubicReducedProblem(None)
+    warm_problem.set_warm_start(warm_start)
+    for mu in [mus[0], mus[1], mus[1], mus[0], mus[2], mus[2]]:
+        assert allclose(solve(warm_problem, mu), solve(cold_problem, mu))
+    assert len(warm_problem._warm_start_window) == 3
+
+
+def test_warm_start_window():
+    problem = CubicReducedProblem(None)
+    problem.set_warm_start("nearest", window=2)
+    for mu in mus:
+        solve(problem, mu)
+    assert [cache_key[0] for cache_key in problem._warm_start_window.keys()] == [mus[-2], mus[-1]]
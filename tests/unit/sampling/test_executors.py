@@ -0,0 +1,95 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import pytest
+from mpi4py.MPI import COMM_WORLD
+from rbnics.sampling.executors import MPIGroupsExecutor, ProcessPoolExecutor, SerialExecutor
+from rbnics.utils.mpi import parallel_io
+
+# Common data
+n = 20
+
+
+# Auxiliary function: since execute does not return values, each task writes a file named after its index
+def generate_task(tempdir):
+    def task(index):
+        with open(os.path.join(tempdir, str(index)), "a") as file_:
+            file_.write(str(os.getpid()) + "\n")
+    return task
+
+
+def assert_each_index_executed_once(tempdir):
+    def check():
+        assert sorted(os.listdir(tempdir), key=int) == [str(index) for index in range(n)]
+        for index in range(n):
+            with open(os.path.join(tempdir, str(index)), "r") as file_:
+                assert len(file_.readlines()) == 1
+    parallel_io(check)
+
+
+# Auxiliary function: map returns values, which also depend on the process the task was carried out on
+def map_task(index):
+    return (index**2, os.getpid())
+
+
+def assert_map_values(values):
+    assert [value for (value, _) in values] == [index**2 for index in range(n)]
+
+
+# Auxiliary function: execute_once calls a task with a fixed index, which must be carried out only once overall
+def assert_executed_once(executor, tempdir):
+    task = generate_task(tempdir)
+    called = executor.execute_once(lambda: parallel_io(lambda: task(0)))
+    assert COMM_WORLD.allreduce(int(called)) == executor.get_function_mpi_comm().size
+
+    def check():
+        assert os.listdir(tempdir) == ["0"]
+        with open(os.path.join(tempdir, "0"), "r") as file_:
+            assert len(file_.readlines()) == 1
+    parallel_io(check)
+
+
+# Serial executor
+@pytest.mark.skipif(COMM_WORLD.size > 1, reason="Serial executor is only tested in serial")
+def test_serial_executor(tempdir):
+    executor = SerialExecutor()
+    executor.execute(generate_task(tempdir), range(n))
+    assert_each_index_executed_once(tempdir)
+    assert_map_values(executor.map(map_task, range(n)))
+
+
+@pytest.mark.skipif(COMM_WORLD.size > 1, reason="Serial executor is only tested in serial")
+def test_serial_executor_once(tempdir):
+    assert_executed_once(SerialExecutor(), tempdir)
+
+
+# Process pool executor
+@pytest.mark.skipif(COMM_WORLD.size > 1, reason="Process pool executor cannot be used in parallel")
+def test_process_pool_executor(tempdir):
+    executor = ProcessPoolExecutor(processes=4)
+    executor.execute(generate_task(tempdir), range(n))
+    assert_each_index_executed_once(tempdir)
+    values = executor.map(map_task, range(n))
+    assert_map_values(values)
+    assert all(pid != os.getpid() for (_, pid) in values)
+
+
+@pytest.mark.skipif(COMM_WORLD.size > 1, reason="Process pool executor cannot be used in parallel")
+def test_process_pool_executor_once(tempdir):
+    assert_executed_once(ProcessPoolExecutor(processes=4), tempdir)
+
+
+# MPI groups executor, with one process per group
+def test_mpi_groups_executor(tempdir):
+    executor = MPIGroupsExecutor(COMM_WORLD.Split(COMM_WORLD.rank))
+    executor.execute(generate_task(tempdir), range(n))
+    assert_each_index_executed_once(tempdir)
+    assert_map_values(executor.map(map_task, range(n)))
+
+
+def test_mpi_groups_executor_once(tempdir):
+    assert_executed_once(MPIGroupsExecutor(COMM_WORLD.Split(COMM_WORLD.rank)), tempdir)
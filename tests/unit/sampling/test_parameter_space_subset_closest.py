@@ -0,0 +1,41 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from math import log, sqrt
+from rbnics.sampling import ParameterSpaceSubset
+from rbnics.sampling.distributions import LogUniformDistribution
+
+# Common data
+box = [(2., 5.), (10., 1000.)]
+n = 1000
+mu = (3., 100.)
+
+
+def closest_brute_force(parameter_space_subset, M, mu, transform):
+    def distance(xi_i):
+        return sqrt(sum([(transform[p](x) - transform[p](y))**2 for (p, (x, y)) in enumerate(zip(mu, xi_i))]))
+    return sorted(parameter_space_subset, key=distance)[:M]
+
+
+# Compare the output of closest to a brute force computation of distances
+@pytest.mark.parametrize("distance_scaling", [None, ("linear", "log")])
+@pytest.mark.parametrize("M", [1, 5])
+def test_parameter_space_subset_closest(distance_scaling, M):
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.generate(box, n, sampling=LogUniformDistribution())
+    parameter_space_subset.set_distance_scaling(distance_scaling)
+    if distance_scaling is None:
+        transform = (float, float)
+    else:
+        transform = (float, log)
+    closest = parameter_space_subset.closest(M, mu)
+    assert list(closest) == closest_brute_force(parameter_space_subset, M, mu, transform)
+    # The spatial index must be updated when the parameter space subset changes
+    parameter_space_subset.append(mu)
+    closest = parameter_space_subset.closest(M, mu)
+    assert closest[0] == mu
+    assert list(closest) == closest_brute_force(parameter_space_subset, M, mu, transform)
@@ -0,0 +1,63 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+from numpy import zeros
+from rbnics.utils.cache import CacheStatistics
+from rbnics.utils.cache.cache import DiskStorageIndex, LRUStorage, parse_cache_limit
+
+
+def test_parse_cache_limit():
+    assert parse_cache_limit("unlimited") is None
+    assert parse_cache_limit("1") == ("entries", 1)
+    assert parse_cache_limit("500KB") == ("bytes", 500 * 1024)
+    assert parse_cache_limit("1.5 GB") == ("bytes", int(1.5 * 1024**3))
+
+
+def test_RAM_storage_size_limit():
+    statistics = CacheStatistics()
+    storage = LRUStorage(parse_cache_limit("20KB"), statistics)
+    for i in range(4):
+        storage[i] = zeros(1000)  # 8000 bytes each
+        storage[0]  # keep the first entry as the most recently used one
+    assert sorted(storage.keys()) == [0, 3]
+    assert statistics.RAM_evictions == 2
+
+
+def test_disk_storage_entries_limit(tempdir):
+    statistics = CacheStatistics()
+    index = DiskStorageIndex(parse_cache_limit("2"), tempdir, statistics)
+    for i in range(3):
+        for suffix in (".h5", ".xdmf"):
+            with open(os.path.join(tempdir, "snapshot" + str(i) + suffix), "w") as f:
+                f.write("snapshot")
+        index.touch("snapshot" + str(i), update_size=True)
+    assert sorted(os.listdir(tempdir)) == ["snapshot1.h5", "snapshot1.xdmf", "snapshot2.h5", "snapshot2.xdmf"]
+    assert statistics.disk_evictions == 1
+
+
+def test_disk_storage_size_limit(tempdir, monkeypatch):
+    statistics = CacheStatistics()
+    index = DiskStorageIndex(parse_cache_limit("20B"), tempdir, statistics)
+    # Files are only looked up once when saved, and not again when touching or evicting entries
+    listdir_calls = list()
+    original_listdir = os.listdir
+
+    def listdir(folder):
+        listdir_calls.append(folder)
+        return original_listdir(folder)
+
+    monkeypatch.setattr(os, "listdir", listdir)
+    for i in range(3):
+        for suffix in (".h5", ".xdmf"):
+            with open(os.path.join(tempdir, "snapshot" + str(i) + suffix), "w") as f:
+                f.write("snapshot")  # 8 bytes each
+        index.touch("snapshot" + str(i), update_size=True)
+        index.touch("snapshot" + str(i))
+    assert len(listdir_calls) == 3
+    monkeypatch.setattr(os, "listdir", original_listdir)
+    assert sorted(os.listdir(tempdir)) == ["snapshot2.h5", "snapshot2.xdmf"]
+    assert statistics.disk_evictions == 2
@@ -0,0 +1,71 @@
+# Copyright (C) 2015-2020 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import json
+import os
+from mpi4py.MPI import COMM_WORLD
+from rbnics.utils.io import CSVIO, Profiler
+
+
+class Problem(object):
+    def solve(self):
+        return sum(i**2 for i in range(1000))
+
+
+def test_profiler_phases():
+    profiler = Profiler()
+    with profiler.phase("offline"):
+        for _ in range(3):
+            with profiler.phase("truth solve"):
+                pass
+        with profiler.phase("greedy search"):
+            with profiler.phase("truth solve"):
+                pass
+    report = {phase_report["phase"]: phase_report for phase_report in profiler.report()}
+    assert list(report.keys()) == ["offline", "offline/truth solve", "offline/greedy search",
+                                   "offline/greedy search/truth solve"]
+    assert report["offline"]["calls"] == 1
+    assert report["offline/truth solve"]["calls"] == 3
+    assert report["offline/greedy search/truth solve"]["calls"] == 1
+    assert report["offline"]["wall time max"] >= report["offline/greedy search"]["wall time max"]
+    assert report["offline"]["peak memory max"] > 0
+
+
+def test_profiler_phases_on_some_processes():
+    profiler = Profiler()
+    with profiler.phase("offline"):
+        with profiler.phase("truth solve"):
+            pass
+        if COMM_WORLD.rank == COMM_WORLD.size - 1:
+            with profiler.phase("POD"):
+                pass
+    report = {phase_report["phase"]: phase_report for phase_report in profiler.report()}
+    assert list(report.keys()) == ["offline", "offline/truth solve", "offline/POD"]
+    assert report["offline/POD"]["calls"] == 1
+    assert report["offline/POD"]["wall time sum"] == report["offline/POD"]["wall time max"]
+
+
+def test_profiler_instrument(tempdir):
+    profiler = Profiler(cprofile_phases=("truth solve", ))
+    problem = Problem()
+    profiler.instrument(problem, "solve", "truth solve")
+    with profiler.phase("offline"):
+        assert problem.solve() == Problem().solve()
+        problem.solve()
+    profiler.remove_instrumentation()
+    problem.solve()  # not recorded anymore
+    profiler.save(tempdir, "offline_profile")
+    with open(os.path.join(tempdir, "offline_profile.json"), "r") as infile:
+        report = json.load(infile)
+    assert [(phase_report["phase"], phase_report["calls"]) for phase_report in report] == [
+        ("offline", 1), ("offline/truth solve", 2)]
+    csv_report = CSVIO.load_file(tempdir, "offline_profile")
+    assert csv_report[0][:2] == ["phase", "calls"]
+    assert len(csv_report) == 3
+    cprofile_filename = "offline_profile_offline_truth_solve"
+    if COMM_WORLD.size > 1:
+        cprofile_filename += "_" + str(COMM_WORLD.rank)
+    assert os.path.exists(os.path.join(tempdir, cprofile_filename + ".prof"))